@@ -42,3 +42,9 @@ class LimitMeal(APIException):
     status_code = status.HTTP_400_BAD_REQUEST
     default_detail = 'شما از قبل وعده غذایی خودرا در تاریخ مورد نظر انتخاب کرده اید.'
     default_code = 'invalid'
+
+
+class SoldOut(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = 'ظرفیت این وعده غذایی تکمیل شده است.'
+    default_code = 'sold_out'
@@ -0,0 +1,138 @@
+import datetime
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from foods.models import WeeklyMeal
+
+MENU_CACHE_TTL = settings.MENU_CACHE_TTL
+MENU_MAX_DAYS = 31
+MENU_MEALS = [choice for choice, label in WeeklyMeal.ChoiceMeal.choices]
+
+
+def generation_key(year, week):
+    return f'weekly-menu-generation:{year}-{week}'
+
+
+def menu_key(year, week, generation, meal):
+    return f'weekly-menu:{year}-{week}:{generation}:{meal}'
+
+
+def menu_generations(weeks):
+    """
+    Returns the current generation of every (year, week), the menu documents of
+    a week are cached under it and an invalidation moves the week to the next one.
+    """
+    keys = {generation_key(*week): week for week in weeks}
+    generations = cache.get_many(list(keys))
+    for key in keys:
+        if key not in generations:
+            # a new week starts from the clock and not from 0, the documents of an evicted generation stay unread
+            cache.add(key, time.time_ns(), timeout=None)
+            generations[key] = cache.get(key)
+    return {keys[key]: generation for key, generation in generations.items()}
+
+
+def menu_window(query_params):
+    """
+    Returns the (first, last) dates of a `?date__gt=&date__lt=` menu request,
+    or None when the request is anything else and has to go to the database.
+    """
+    if set(query_params) != {'date__gt', 'date__lt'}:
+        return None
+    try:
+        first = datetime.date.fromisoformat(query_params['date__gt']) + datetime.timedelta(days=1)
+        last = datetime.date.fromisoformat(query_params['date__lt']) - datetime.timedelta(days=1)
+    except ValueError:
+        return None
+    if first > last or (last - first).days >= MENU_MAX_DAYS:
+        return None
+    return first, last
+
+
+def iso_weeks(first, last):
+    monday = first - datetime.timedelta(days=first.weekday())
+    while monday <= last:
+        yield monday
+        monday += datetime.timedelta(days=7)
+
+
+def build_documents(mondays, meals, generations):
+    # foods.serializer imports this module for invalidate_menu
+    from foods.serializer import WeeklyMealSerializer
+
+    query = Q()
+    for monday in mondays:
+        query |= Q(date__range=(monday, monday + datetime.timedelta(days=6)))
+    queryset = WeeklyMealSerializer.setup_eager_loading(WeeklyMeal.objects.filter(query, meal__in=meals))
+    data = WeeklyMealSerializer(queryset.order_by('date', 'meal', 'id'), many=True).data
+
+    documents = {}
+    for monday in mondays:
+        week = monday.isocalendar()[:2]
+        for meal in meals:
+            documents[menu_key(*week, generations[week], meal)] = []
+    for item in data:
+        week = datetime.date.fromisoformat(item['date']).isocalendar()[:2]
+        documents[menu_key(*week, generations[week], item['meal'])].append(item)
+    for key, items in documents.items():
+        etag = hashlib.sha1(json.dumps(items, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+        documents[key] = {'etag': etag, 'meals': items}
+    return documents
+
+
+def get_menu(first, last):
+    """
+    _Get Menu_
+    Answers a menu request from the per ISO week and meal type documents in the
+    cache, only the missing documents are built, with one query.
+    Returns:
+        _tuple_: (meals, etag)
+    """
+
+    weeks = {monday: monday.isocalendar()[:2] for monday in iso_weeks(first, last)}
+    generations = menu_generations(weeks.values())
+    keys = {menu_key(*week, generations[week], meal): (monday, meal) for monday, week in weeks.items()
+            for meal in MENU_MEALS}
+    documents = cache.get_many(list(keys))
+    missing = [keys[key] for key in keys if key not in documents]
+    if missing:
+        built = build_documents(sorted({monday for monday, meal in missing}), sorted({meal for monday, meal in missing}),
+                                generations)
+        built = {key: document for key, document in built.items() if key not in documents}
+        cache.set_many(built, timeout=MENU_CACHE_TTL)
+        documents.update(built)
+
+    meals = [item for key in keys for item in documents[key]['meals']
+             if first.isoformat() <= item['date'] <= last.isoformat()]
+    meals.sort(key=lambda item: (item['date'], MENU_MEALS.index(item['meal'])))
+    version = ':'.join([first.isoformat(), last.isoformat()] + [documents[key]['etag'] for key in sorted(keys)])
+    return meals, '"%s"' % hashlib.sha1(version.encode('utf-8')).hexdigest()
+
+
+def invalidate_menu(slots):
+    """
+    _Invalidate Menu_
+    Moves the weeks of the given (date, meal) slots to their next generation
+    once the current transaction commits. The old documents are not deleted, a
+    request that read the old rows before the commit caches them under the old
+    generation, where no later request looks.
+    """
+
+    weeks = {date.isocalendar()[:2] for date, meal in slots if date and meal}
+    if weeks:
+        transaction.on_commit(lambda: bump_generations(weeks))
+
+
+def bump_generations(weeks):
+    for week in weeks:
+        try:
+            cache.incr(generation_key(*week))
+        except ValueError:
+            # no generation, so no document of the week is read, the next request starts a new one
+            pass
@@ -0,0 +1,57 @@
+# Generated by Django 4.1.5 on 2026-10-18 14:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FoodAndDesire',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100, verbose_name='نام')),
+                ('description', models.TextField(verbose_name='توضیحات')),
+                ('price', models.PositiveBigIntegerField(verbose_name='قیمت')),
+                ('limit', models.PositiveIntegerField(verbose_name='محدودیت')),
+                ('type', models.CharField(choices=[('FOOD', 'غذا'), ('DESIRE', 'پیش غذا')], max_length=6, verbose_name='غذا/پیش غذا')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PaymentFood',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('default_payment', models.CharField(choices=[('DFC', 'کسر از اعتبار'), ('PG', 'درگاه پراخت'), ('ETQ', 'هربار سوال شود')], default='DFC', max_length=3)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WeeklyMeal',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('date', models.DateField(verbose_name='تاریخ')),
+                ('meal', models.CharField(choices=[('BREAKFAST', 'صبحانه'), ('LUNCH', 'ناهار'), ('DINNER', 'شام')], max_length=9, verbose_name='نوع وعده')),
+                ('price', models.PositiveBigIntegerField(default=0, verbose_name='قیمت')),
+                ('capacity', models.PositiveIntegerField(blank=True, null=True, verbose_name='ظرفیت')),
+                ('remaining', models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='ظرفیت باقی مانده')),
+                ('desire', models.ManyToManyField(blank=True, limit_choices_to={'type': 'DESIRE'}, null=True, related_name='weekly_meal_desire', to='foods.foodanddesire', verbose_name='پیش غذا')),
+                ('food', models.ForeignKey(limit_choices_to={'type': 'FOOD'}, on_delete=django.db.models.deletion.CASCADE, related_name='weekly_meal_food', to='foods.foodanddesire', verbose_name='غذا')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WeeklyMealUser',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('type_payment', models.CharField(choices=[('DFC', 'کسر از اعتبار'), ('PG', 'درگاه پراخت')], default='DFC', max_length=3)),
+                ('count', models.PositiveIntegerField(default=1, verbose_name='تعداد')),
+                ('payment', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='weekly_meal_user_payment', to='foods.paymentfood', verbose_name='پرداخت')),
+                ('weekly_meal_food', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weekly_meal_user_weekly_meal_food', to='foods.weeklymeal', verbose_name='غذای انتخابی')),
+            ],
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.1.5 on 2026-10-18 14:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('foods', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paymentfood',
+            name='user',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='payment_food_user', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterUniqueTogether(
+            name='weeklymealuser',
+            unique_together={('payment', 'weekly_meal_food')},
+        ),
+        migrations.AddIndex(
+            model_name='weeklymeal',
+            index=models.Index(fields=['date', 'meal'], name='foods_weeklymeal_date_meal'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='weeklymeal',
+            unique_together={('food', 'date', 'meal')},
+        ),
+    ]
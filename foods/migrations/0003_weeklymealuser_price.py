@@ -0,0 +1,29 @@
+# Generated by Django 4.1.5 on 2026-10-18 14:34
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def set_reservation_prices(apps, schema_editor):
+    # the price paid by the existing reservations is not known, the meal's price is the closest one
+    WeeklyMeal = apps.get_model('foods', 'WeeklyMeal')
+    WeeklyMealUser = apps.get_model('foods', 'WeeklyMealUser')
+    db = schema_editor.connection.alias
+    price = WeeklyMeal.objects.using(db).filter(pk=OuterRef('weekly_meal_food')).values('price')
+    WeeklyMealUser.objects.using(db).update(price=Subquery(price))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='weeklymealuser',
+            name='price',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='قیمت واحد'),
+        ),
+        migrations.RunPython(set_reservation_prices, migrations.RunPython.noop),
+    ]
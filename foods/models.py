@@ -1,9 +1,18 @@
 import uuid
+from collections import defaultdict
+from contextvars import ContextVar
 
 from django.conf import settings
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import Case, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Greatest, Least
 from django.utils import timezone
 
+from foods.exception import SoldOut
+
+# meals whose reservations are being refunded in bulk, the per-row delete receivers of WeeklyMealUser skip them
+refunded_weekly_meals = ContextVar('refunded_weekly_meals', default=frozenset())
+
 
 class ID(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -57,20 +66,28 @@ class WeeklyMealUser(ID):
 
     type_payment = models.CharField(max_length=3, choices=PaymentChoices.choices, default=PaymentChoices.DFC)
     count = models.PositiveIntegerField(verbose_name='تعداد', default=1)
+    # unit price paid for the portions, refunds and edits are counted from it and not from the meal's current price
+    price = models.PositiveBigIntegerField(verbose_name='قیمت واحد', default=0, editable=False)
     payment = models.ForeignKey('foods.PaymentFood', on_delete=models.CASCADE, related_name='weekly_meal_user_payment',
-                                verbose_name='پرداخت')
+                                verbose_name='پرداخت', db_index=False)
     weekly_meal_food = models.ForeignKey('foods.WeeklyMeal', on_delete=models.CASCADE,
                                          related_name='weekly_meal_user_weekly_meal_food', verbose_name="غذای انتخابی")
 
+    def apply_default_payment(self):
+        if self.payment.default_payment != "ETQ":
+            self.type_payment = self.payment.default_payment
+
     def save(
             self, force_insert=False, force_update=False, using=None, update_fields=None
     ):
-        if self.payment.default_payment != "ETQ":
-            self.type_payment = self.payment.default_payment
-        super().save(force_insert, force_update, using, update_fields)
+        self.apply_default_payment()
+        # the credit is charged in pre_save, keep it in the same transaction as the row
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(force_insert, force_update, using, update_fields)
 
     class Meta:
         app_label = 'foods'
+        # the unique index leads with payment, it replaces the index of the foreign key
         unique_together = ('payment', 'weekly_meal_food')
 
 
@@ -90,16 +107,119 @@ class WeeklyMeal(ID):
                                     blank=True)
     meal = models.CharField(max_length=9, choices=ChoiceMeal.choices, verbose_name='نوع وعده')
     price = models.PositiveBigIntegerField(verbose_name='قیمت', default=0)
+    capacity = models.PositiveIntegerField(verbose_name='ظرفیت', null=True, blank=True)
+    # portions left to reserve, kept up to date with conditional UPDATEs (reserve/release), null means unlimited
+    remaining = models.PositiveIntegerField(verbose_name='ظرفیت باقی مانده', null=True, blank=True, editable=False)
 
+    def __str__(self):
+        return f'{self.food}:{self.desire} - {self.date} - {self.meal}'
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # the menu slot the row was loaded with, a meal moved to another day also refreshes the day it left
+        instance.loaded_slot = (instance.__dict__.get('date', None), instance.__dict__.get('meal', None))
+        return instance
 
+    def save(
+            self, force_insert=False, force_update=False, using=None, update_fields=None
+    ):
+        if self._state.adding:
+            self.remaining = self.capacity
+        elif update_fields is None:
+            # remaining is only changed with F() updates, writing back a loaded value would undo parallel reservations
+            update_fields = [field.name for field in self._meta.concrete_fields
+                             if not field.primary_key and field.name != 'remaining']
+        super().save(force_insert, force_update, using, update_fields)
 
-    def __str__(self):
-        return f'{self.food}:{self.desire} - {self.date} - {self.meal}'
+    @classmethod
+    def recompute_prices(cls, queryset):
+        # one UPDATE that sets the price of every meal in queryset from the current food and desire prices
+        food_price = FoodAndDesire.objects.filter(pk=OuterRef('food')).values('price')
+        desire_price = cls.desire.through.objects.filter(weeklymeal=OuterRef('pk')).values('weeklymeal').annotate(
+            total=Sum('foodanddesire__price')).values('total')
+        return queryset.update(price=Subquery(food_price) + Coalesce(Subquery(desire_price), 0))
+
+    @staticmethod
+    def reserved_portions():
+        # the portions reserved of the meal in the outer query
+        return Coalesce(Subquery(WeeklyMealUser.objects.filter(weekly_meal_food=OuterRef('pk')).values(
+            'weekly_meal_food').annotate(total=Sum('count')).values('total')), 0)
+
+    def reset_remaining(self):
+        # recounts the portions left after the capacity is changed
+        queryset = WeeklyMeal.objects.filter(pk=self.pk)
+        # GREATEST skips NULLs on Postgres, without the CASE an unlimited meal would get 0
+        queryset.update(remaining=Case(When(capacity__isnull=True, then=Value(None)),
+                                       default=Greatest(F('capacity') - self.reserved_portions(), 0)))
+        self.remaining = queryset.values_list('remaining', flat=True).first()
+
+    @classmethod
+    def reserve(cls, counts, using=None):
+        """
+        Takes portions of meals, {weekly_meal_id: count}. Meals taking the same
+        count share one UPDATE that only matches the meals with enough portions
+        left, so parallel reservations can not oversell. Negative counts give the
+        portions back, up to the capacity less the reservations that are kept. They
+        are taken before the released reservations are deleted or changed.
+        Raises:
+            SoldOut: A meal does not have enough portions left
+        """
+        groups = defaultdict(list)
+        for weekly_meal_id, count in counts.items():
+            if count:
+                groups[count].append(weekly_meal_id)
+
+        with transaction.atomic(using=using, savepoint=False):
+            if len(groups) > 1:
+                # lock in id order first, like users.ledger.apply_credit
+                list(cls.objects.using(using).select_for_update(no_key=True).filter(
+                    pk__in=list(counts)).order_by('pk').values_list('pk', flat=True))
+            for count, weekly_meal_ids in sorted(groups.items()):
+                queryset = cls.objects.using(using).filter(pk__in=sorted(weekly_meal_ids))
+                if count > 0:
+                    queryset = queryset.filter(Q(remaining__isnull=True) | Q(remaining__gte=count))
+                    if queryset.update(remaining=F('remaining') - count) != len(weekly_meal_ids):
+                        raise SoldOut
+                else:
+                    # the released rows are still counted in reserved_portions, a capacity lowered below the
+                    # reservations only comes back once enough of them are cancelled
+                    queryset.filter(remaining__isnull=False).update(remaining=Least(
+                        F('remaining') - count, Greatest(F('capacity') - cls.reserved_portions() - count, 0)))
+
+    @classmethod
+    def release(cls, counts, using=None):
+        cls.reserve({weekly_meal_id: -count for weekly_meal_id, count in counts.items()}, using)
 
     def is_deletable(self):
         return self.date > timezone.now().date() + timezone.timedelta(days=settings.ADMIN_DAY_RESERVATION)
 
+    def refund_reservations(self, using):
+        """
+        Refunds every reservation of the meal with one UPDATE per refunded amount, then
+        deletes the reservations with the per-row refund and release receivers skipped.
+        """
+        from users.ledger import apply_credit, credit_deltas
+
+        reservations = self.weekly_meal_user_weekly_meal_food.using(using)
+        refunds = reservations.values('payment__user').annotate(total=Sum(F('count') * F('price'))).values_list(
+            'payment__user', 'total')
+        apply_credit(credit_deltas(*refunds), using=using)
+        token = refunded_weekly_meals.set(refunded_weekly_meals.get() | {self.pk})
+        try:
+            reservations.all().delete()
+        finally:
+            refunded_weekly_meals.reset(token)
+
+    def delete(self, using=None, keep_parents=False):
+        using = using or router.db_for_write(self.__class__, instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            self.refund_reservations(using)
+            return super().delete(using, keep_parents)
+
     class Meta:
         app_label = 'foods'
         unique_together = ('food', 'date', 'meal')
+        indexes = [
+            models.Index(fields=['date', 'meal'], name='foods_weeklymeal_date_meal'),
+        ]
@@ -0,0 +1,77 @@
+import csv
+import datetime
+
+import openpyxl
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from foods.models import WeeklyMeal, WeeklyMealUser
+
+KITCHEN_REPORT_HEADERS = ['تاریخ', 'وعده', 'غذا', 'پیش غذا', 'تعداد']
+KITCHEN_REPORT_MAX_DAYS = 366
+MEAL_LABELS = dict(WeeklyMeal.ChoiceMeal.choices)
+
+
+def kitchen_report_window(query_params):
+    """
+    Returns the inclusive (date_from, date_to) of a report request, today by
+    default, or None when the dates are invalid or too far apart.
+    """
+    today = timezone.now().date().isoformat()
+    try:
+        date_from = datetime.date.fromisoformat(query_params.get('date_from', None) or today)
+        date_to = datetime.date.fromisoformat(query_params.get('date_to', None) or date_from.isoformat())
+    except ValueError:
+        return None
+    if date_from > date_to or (date_to - date_from).days >= KITCHEN_REPORT_MAX_DAYS:
+        return None
+    return date_from, date_to
+
+
+def kitchen_report(date_from, date_to):
+    """
+    _Kitchen Report_
+    Reserved portions per (date, meal, food, desire) in one query. The meals
+    come from the (date, meal) index and each meal sums its reservations
+    through the reservation foreign key index, so the cost follows the range
+    and not the whole reservation history. Every desire of a meal is served
+    with each portion of its food, a meal without desires gives one row with
+    desire None.
+    """
+
+    portions = WeeklyMealUser.objects.filter(weekly_meal_food=OuterRef('pk')).values('weekly_meal_food').annotate(
+        total=Sum('count')).values('total')
+    queryset = WeeklyMeal.objects.filter(date__range=(date_from, date_to))
+    return queryset.values('date', 'meal', 'food__name', 'desire__name').annotate(
+        portions=Coalesce(Subquery(portions), 0)).order_by('date', 'meal', 'food__name', 'desire__name')
+
+
+def kitchen_report_rows(report):
+    for item in report:
+        yield [item['date'].isoformat(), MEAL_LABELS.get(item['meal'], item['meal']), item['food__name'],
+               item['desire__name'] or '', item['portions']]
+
+
+class Echo(object):
+    # csv.writer only needs `write`, hand every line back instead of buffering the file
+    def write(self, value):
+        return value
+
+
+def kitchen_report_csv(report):
+    writer = csv.writer(Echo())
+    yield '\ufeff' + writer.writerow(KITCHEN_REPORT_HEADERS)
+    for row in kitchen_report_rows(report):
+        yield writer.writerow(row)
+
+
+def write_kitchen_report_excel(report, file):
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.sheet_view.rightToLeft = True
+    sheet.append(KITCHEN_REPORT_HEADERS)
+    for row in kitchen_report_rows(report):
+        sheet.append(row)
+    workbook.save(file)
+    return file
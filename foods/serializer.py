@@ -1,19 +1,85 @@
+import uuid
+from collections import Counter
+
 from django.conf import settings
-from django.db.models import Sum
+from django.db import transaction
+from django.db.models import Prefetch
 from django.utils import timezone
 from rest_framework import serializers
 
 from foods.exception import DateIsPast, LimitFoodAndDesire, LimitMeal
+from foods.menu import invalidate_menu
 from foods.models import WeeklyMeal, FoodAndDesire, PaymentFood, WeeklyMealUser
+from users.ledger import apply_credit, credit_deltas
+
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    # list serializers fill `prefetched` for all the posted items with one query, anything else is still queried
+    prefetched = {}
+
+    def to_internal_value(self, data):
+        try:
+            return self.prefetched[uuid.UUID(str(data))]
+        except (KeyError, ValueError):
+            return super().to_internal_value(data)
+
+
+def prefetch_posted(field, data, field_name, queryset=None):
+    """
+    _Prefetch Posted_
+    Loads every object posted under `field_name` in a list of items with one query
+    and hands them to a PrefetchedPrimaryKeyRelatedField.
+    """
+
+    ids = set()
+    for item in data if isinstance(data, list) else []:
+        values = item.get(field_name, None) if isinstance(item, dict) else None
+        for value in values if isinstance(values, list) else [values]:
+            try:
+                ids.add(uuid.UUID(str(value)))
+            except ValueError:
+                pass
+    queryset = field.get_queryset() if queryset is None else queryset
+    field.prefetched = queryset.in_bulk(ids)
+
+
+class WeeklyMealListSerializer(serializers.ListSerializer):
+    def to_internal_value(self, data):
+        prefetch_posted(self.child.fields['food'], data, 'food')
+        prefetch_posted(self.child.fields['desire'].child_relation, data, 'desire')
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        weekly_meals, desires = [], []
+        for item in validated_data:
+            desires.append(item.pop('desire', []))
+            weekly_meal = WeeklyMeal(**item)
+            # bulk_create skips WeeklyMeal.save
+            weekly_meal.remaining = weekly_meal.capacity
+            weekly_meals.append(weekly_meal)
+        through = WeeklyMeal.desire.through
+        with transaction.atomic():
+            WeeklyMeal.objects.bulk_create(weekly_meals)
+            through.objects.bulk_create([through(weeklymeal=weekly_meal, foodanddesire=desire)
+                                         for weekly_meal, items in zip(weekly_meals, desires) for desire in items])
+            invalidate_menu([(weekly_meal.date, weekly_meal.meal) for weekly_meal in weekly_meals])
+        queryset = WeeklyMealSerializer.setup_eager_loading(WeeklyMeal.objects.all())
+        created = queryset.in_bulk([weekly_meal.pk for weekly_meal in weekly_meals])
+        return [created[weekly_meal.pk] for weekly_meal in weekly_meals]
 
 
 class WeeklyMealSerializer(serializers.ModelSerializer):
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, prefix=''):
+        return queryset.select_related(f'{prefix}food').prefetch_related(f'{prefix}desire')
+
     def to_representation(self, instance):
         result = super().to_representation(instance)
         if instance.food:
             result['food'] = FoodAndDesireSerializer(instance.food).data
-        if instance.desire:
-            result['desire'] = FoodAndDesireSerializer(instance.desire, many=True).data
+        result['desire'] = FoodAndDesireSerializer(instance.desire.all(), many=True).data
         return result
 
     def validate_date(self, value):
@@ -23,23 +89,74 @@ class WeeklyMealSerializer(serializers.ModelSerializer):
             raise DateIsPast
         return value
 
-    def save(self, **kwargs):
-        result = super(WeeklyMealSerializer, self).save()
-        if result.food:
-            result.price += result.food.price
-        price_desire = result.desire.all().aggregate(Sum('price'))['price__sum']
-        if result.desire and price_desire:
-            result.price += price_desire
-        result.save()
-        return result
+    def validate(self, attrs):
+        # price is the food plus the desires, written with the same INSERT/UPDATE as the meal
+        if 'food' in attrs or 'desire' in attrs:
+            food = attrs.get('food', None) or self.instance.food
+            desire = attrs['desire'] if 'desire' in attrs else self.instance.desire.all() if self.instance else []
+            attrs['price'] = food.price + sum(item.price for item in desire)
+        return attrs
+
+    def update(self, instance, validated_data):
+        capacity_changed = 'capacity' in validated_data and validated_data['capacity'] != instance.capacity
+        instance = super().update(instance, validated_data)
+        if capacity_changed:
+            instance.reset_remaining()
+            invalidate_menu([(instance.date, instance.meal)])
+        return instance
 
     class Meta:
         model = WeeklyMeal
         fields = '__all__'
         read_only_fields = ('price',)
+        list_serializer_class = WeeklyMealListSerializer
+
+
+class WeeklyMealUserListSerializer(serializers.ListSerializer):
+    def to_internal_value(self, data):
+        queryset = WeeklyMealSerializer.setup_eager_loading(WeeklyMeal.objects.all())
+        prefetch_posted(self.child.fields['weekly_meal_food'], data, 'weekly_meal_food', queryset)
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        user = self.context['request'].user
+        if user.is_superuser:
+            return attrs
+        slots = [(item['weekly_meal_food'].date, item['weekly_meal_food'].meal) for item in attrs]
+        if len(set(slots)) != len(slots):
+            raise LimitMeal
+        reserved = WeeklyMealUser.objects.filter(payment__user=user, weekly_meal_food__date__in={
+            date for date, meal in slots}).values_list('weekly_meal_food__date', 'weekly_meal_food__meal')
+        if set(reserved) & set(slots):
+            raise LimitMeal
+        return attrs
+
+    def create(self, validated_data):
+        reservations = [WeeklyMealUser(**item) for item in validated_data]
+        for reservation in reservations:
+            reservation.apply_default_payment()
+            reservation.price = reservation.weekly_meal_food.price
+        # bulk_create skips the pre_save signals, so the portions and the credit of the whole basket are taken here
+        counts = Counter()
+        for reservation in reservations:
+            counts[reservation.weekly_meal_food_id] += reservation.count
+        with transaction.atomic():
+            WeeklyMeal.reserve(counts)
+            invalidate_menu([(reservation.weekly_meal_food.date, reservation.weekly_meal_food.meal)
+                             for reservation in reservations if reservation.weekly_meal_food.capacity is not None])
+            WeeklyMealUser.objects.bulk_create(reservations)
+            apply_credit(credit_deltas(*((reservation.payment.user_id, -reservation.price * reservation.count)
+                                         for reservation in reservations)))
+        return reservations
 
 
 class WeeklyMealUserSerializer(serializers.ModelSerializer):
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return WeeklyMealSerializer.setup_eager_loading(queryset.select_related('weekly_meal_food'),
+                                                        prefix='weekly_meal_food__')
 
     def to_representation(self, instance):
         result = super().to_representation(instance)
@@ -57,6 +174,9 @@ class WeeklyMealUserSerializer(serializers.ModelSerializer):
             return attrs
         if count > weekly_meal.food.limit:
             raise LimitFoodAndDesire
+        if isinstance(self.parent, WeeklyMealUserListSerializer):
+            # checked for all the items together in WeeklyMealUserListSerializer.validate
+            return attrs
         if user.payment_food_user.weekly_meal_user_payment.filter(weekly_meal_food__date=date,
                                                                   weekly_meal_food__meal=meal).exists():
             raise LimitMeal
@@ -65,6 +185,7 @@ class WeeklyMealUserSerializer(serializers.ModelSerializer):
     class Meta:
         model = WeeklyMealUser
         exclude = ('payment',)
+        list_serializer_class = WeeklyMealUserListSerializer
 
 
 class FoodAndDesireSerializer(serializers.ModelSerializer):
@@ -74,6 +195,12 @@ class FoodAndDesireSerializer(serializers.ModelSerializer):
 
 
 class PaymentFoodSerializer(serializers.ModelSerializer):
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        reservations = WeeklyMealUserSerializer.setup_eager_loading(WeeklyMealUser.objects.all())
+        return queryset.select_related('user').prefetch_related(
+            Prefetch('weekly_meal_user_payment', queryset=reservations))
+
     def get_bills(self, obj):
         debt = obj.user.credit
         return {
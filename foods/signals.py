@@ -1,29 +1,93 @@
-from django.db.models.signals import pre_delete, pre_save
+from collections import Counter
+
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 
-from foods.models import WeeklyMeal, WeeklyMealUser
+from foods.menu import invalidate_menu
+from foods.models import FoodAndDesire, WeeklyMeal, WeeklyMealUser, refunded_weekly_meals
+from users.ledger import apply_credit, credit_deltas
 
 
-@receiver(pre_delete, sender=WeeklyMeal)
-def credit_user_pre_delete_weekly_meal(sender, instance, **kwargs):
-    price = instance.price
-    for i in instance.weekly_meal_user_weekly_meal_food.all():
-        user = i.payment.user
-        user.credit += price * i.count
-        user.save()
+@receiver(pre_delete, sender=WeeklyMealUser)
+def credit_user_pre_delete_weekly_meal_user(sender, instance, **kwargs):
+    if instance.weekly_meal_food_id in refunded_weekly_meals.get():
+        return
+    apply_credit(credit_deltas((instance.payment.user_id, instance.price * instance.count)))
 
 
 @receiver(pre_delete, sender=WeeklyMealUser)
-def credit_user_pre_delete_weekly_meal_user(sender, instance, **kwargs):
-    price = instance.weekly_meal_food.price
-    user = instance.payment.user
-    user.credit += price * instance.count
-    user.save()
+def release_pre_delete_weekly_meal_user(sender, instance, **kwargs):
+    # the meal is deleted with its reservations, nothing to give back
+    if instance.weekly_meal_food_id in refunded_weekly_meals.get():
+        return
+    WeeklyMeal.release({instance.weekly_meal_food_id: instance.count})
+    if instance.weekly_meal_food.capacity is not None:
+        invalidate_menu([(instance.weekly_meal_food.date, instance.weekly_meal_food.meal)])
 
 
 @receiver(pre_save, sender=WeeklyMealUser)
 def credit_user_pre_save_weekly_meal_user(sender, instance, **kwargs):
-    price = instance.weekly_meal_food.price
-    user = instance.payment.user
-    user.credit -= price * instance.count
-    user.save()
+    instance.price = instance.weekly_meal_food.price
+    amount = 0
+    if not instance._state.adding:
+        # an edited reservation is only charged for the difference with what was already paid, portions of the
+        # same meal keep the price they were reserved with
+        old = WeeklyMealUser.objects.filter(pk=instance.pk).values_list('weekly_meal_food', 'price', 'count').first()
+        if old:
+            weekly_meal_id, price, count = old
+            if weekly_meal_id == instance.weekly_meal_food_id:
+                instance.price = price
+            amount += price * count
+    amount -= instance.price * instance.count
+    apply_credit(credit_deltas((instance.payment.user_id, amount)))
+
+
+@receiver(pre_save, sender=WeeklyMealUser)
+def reserve_pre_save_weekly_meal_user(sender, instance, **kwargs):
+    counts = Counter({instance.weekly_meal_food_id: instance.count})
+    if not instance._state.adding:
+        old = WeeklyMealUser.objects.filter(pk=instance.pk).values_list('weekly_meal_food', 'count').first()
+        if old:
+            counts[old[0]] -= old[1]
+    WeeklyMeal.reserve(counts)
+    if instance.weekly_meal_food.capacity is not None:
+        invalidate_menu([(instance.weekly_meal_food.date, instance.weekly_meal_food.meal)])
+
+
+@receiver(post_save, sender=FoodAndDesire)
+def price_post_save_food_and_desire(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and 'price' not in update_fields):
+        return
+    # meals of past days keep the price they were served with
+    weekly_meals = WeeklyMeal.objects.filter(Q(food=instance) | Q(desire=instance), date__gt=timezone.now().date())
+    WeeklyMeal.recompute_prices(weekly_meals)
+
+
+@receiver(post_save, sender=WeeklyMeal)
+@receiver(post_delete, sender=WeeklyMeal)
+def menu_weekly_meal(sender, instance, **kwargs):
+    slots = [(instance.date, instance.meal)]
+    if getattr(instance, 'loaded_slot', None):
+        slots.append(instance.loaded_slot)
+    invalidate_menu(slots)
+
+
+@receiver(m2m_changed, sender=WeeklyMeal.desire.through)
+def menu_m2m_changed_weekly_meal_desire(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        invalidate_menu([(instance.date, instance.meal)])
+    elif pk_set:
+        invalidate_menu(WeeklyMeal.objects.filter(pk__in=pk_set).values_list('date', 'meal'))
+
+
+@receiver(post_save, sender=FoodAndDesire)
+@receiver(pre_delete, sender=FoodAndDesire)
+def menu_food_and_desire(sender, instance, created=False, **kwargs):
+    if created:
+        return
+    weekly_meals = WeeklyMeal.objects.filter(Q(food=instance) | Q(desire=instance))
+    invalidate_menu(weekly_meals.values_list('date', 'meal').distinct())
@@ -1,3 +1,200 @@
-from django.test import TestCase
+import datetime
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from foods.exception import SoldOut
+from foods.menu import get_menu, menu_generations
+from foods.models import FoodAndDesire, WeeklyMeal, WeeklyMealUser, PaymentFood
+from main.testing import plan, run_parallel
+from users.models import User, CreditSummary
+
+RESERVATION_THREADS = 8
+
+
+class ReservationCreditConcurrencyTests(TransactionTestCase):
+    """
+    Parallel reservations and cancellations, on committed rows, charge and
+    refund the credit exactly once each.
+    """
+
+    def setUp(self):
+        today = timezone.now().date()
+        self.meals = []
+        for i in range(16):
+            food = FoodAndDesire.objects.create(name=f'food{i}', description='d', price=1000 + i, limit=5, type='FOOD')
+            self.meals.append(WeeklyMeal.objects.create(date=today + datetime.timedelta(days=i), food=food,
+                                                        meal='LUNCH', price=food.price))
+
+    def test_one_user_reserves_and_cancels_in_parallel(self):
+        payment = PaymentFood.objects.create(user=User.objects.create_user('user', credit=100000))
+
+        def reserve(meal):
+            return WeeklyMealUser.objects.create(payment=payment, weekly_meal_food=meal, count=2)
+
+        reservations = run_parallel(reserve, self.meals, RESERVATION_THREADS)
+        run_parallel(lambda reservation: reservation.delete(), reservations[::2], RESERVATION_THREADS)
+
+        kept = sum(meal.price * 2 for meal in self.meals[1::2])
+        self.assertEqual(User.objects.get(pk=payment.user_id).credit, 100000 - kept)
+
+    def test_many_users_reserve_the_same_meal(self):
+        meal = self.meals[0]
+        payments = [PaymentFood.objects.create(user=User.objects.create_user(f'user{i}', credit=5000))
+                    for i in range(RESERVATION_THREADS * 4)]
+
+        def reserve(payment):
+            WeeklyMealUser.objects.create(payment=payment, weekly_meal_food=meal, count=3)
+
+        run_parallel(reserve, payments, RESERVATION_THREADS)
+
+        credits = User.objects.filter(payment_food_user__in=payments).values_list('credit', flat=True)
+        self.assertEqual(set(credits), {5000 - meal.price * 3})
+
+
+class CapacityConcurrencyTests(TransactionTestCase):
+    """
+    More parallel reservations than portions, only the portions left are sold
+    and only the sold ones are charged.
+    """
+
+    def test_parallel_reservations_do_not_oversell(self):
+        food = FoodAndDesire.objects.create(name='food', description='d', price=1000, limit=5, type='FOOD')
+        meal = WeeklyMeal.objects.create(date=timezone.now().date(), food=food, meal='LUNCH', price=food.price,
+                                         capacity=50)
+        payments = [PaymentFood.objects.create(user=User.objects.create_user(f'user{i}', credit=5000))
+                    for i in range(200)]
+
+        def reserve(payment):
+            try:
+                WeeklyMealUser.objects.create(payment=payment, weekly_meal_food=meal)
+                return True
+            except SoldOut:
+                return False
+
+        results = run_parallel(reserve, payments, RESERVATION_THREADS * 2)
+
+        meal.refresh_from_db()
+        self.assertEqual(sum(results), 50)
+        self.assertEqual(meal.remaining, 0)
+        self.assertEqual(WeeklyMealUser.objects.filter(weekly_meal_food=meal).count(), 50)
+        credits = User.objects.filter(payment_food_user__in=payments).values_list('credit', flat=True)
+        self.assertCountEqual(credits, [5000 - meal.price] * 50 + [5000] * 150)
+
+
+class IndexPlanTests(TestCase):
+    """
+    The menu and the reservations of a user are answered from their indexes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('user', password='x')
+
+    def test_menu_of_a_week(self):
+        today = timezone.now().date()
+        queryset = WeeklyMeal.objects.filter(date__range=(today, today + datetime.timedelta(days=6)), meal='LUNCH')
+        self.assertIn('foods_weeklymeal_date_meal', plan(queryset))
+
+    def test_reservations_of_a_user(self):
+        # the unique index of (payment, weekly_meal_food) also serves the payment lookups
+        self.assertIn('foods_weeklymealuser_payment_id_weekly_meal_f_4fea81d1_uniq',
+                      plan(WeeklyMealUser.objects.filter(payment__user=self.user)))
+
+
+class MenuCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.monday = datetime.date(2026, 10, 12)
+        cls.food = FoodAndDesire.objects.create(name='food', description='d', price=1000, limit=5, type='FOOD')
+        WeeklyMeal.objects.create(date=cls.monday, food=cls.food, meal='LUNCH', price=cls.food.price)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_a_new_meal_moves_the_week_to_a_new_generation(self):
+        week = self.monday.isocalendar()[:2]
+        meals, etag = get_menu(self.monday, self.monday + datetime.timedelta(days=6))
+        generation = menu_generations([week])[week]
+        self.assertEqual(len(meals), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            WeeklyMeal.objects.create(date=self.monday + datetime.timedelta(days=1), food=self.food, meal='LUNCH',
+                                      price=self.food.price)
+
+        self.assertEqual(menu_generations([week])[week], generation + 1)
+        with self.assertNumQueries(2):
+            meals, new_etag = get_menu(self.monday, self.monday + datetime.timedelta(days=6))
+        self.assertEqual(len(meals), 2)
+        self.assertNotEqual(new_etag, etag)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_menu(self.monday, self.monday + datetime.timedelta(days=6)), (meals, new_etag))
+
+
+class MealDeleteRefundTests(TestCase):
+    def test_deleting_a_meal_refunds_every_reservation_once(self):
+        food = FoodAndDesire.objects.create(name='food', description='d', price=1000, limit=5, type='FOOD')
+        meal = WeeklyMeal.objects.create(date=timezone.now().date(), food=food, meal='LUNCH', price=food.price,
+                                         capacity=10)
+        payments = [PaymentFood.objects.create(user=User.objects.create_user(f'user{i}', credit=credit))
+                    for i, credit in enumerate([500, 5000, 5000])]
+        for count, payment in enumerate(payments, 1):
+            WeeklyMealUser.objects.create(payment=payment, weekly_meal_food=meal, count=count)
+        # the first user went 500 below zero
+        self.assertEqual(CreditSummary.objects.get(user=None, month='').debt, -500)
+
+        meal.delete()
+
+        self.assertFalse(WeeklyMealUser.objects.exists())
+        credits = User.objects.filter(payment_food_user__in=payments).values_list('credit', flat=True)
+        self.assertCountEqual(credits, [500, 5000, 5000])
+        self.assertEqual(CreditSummary.objects.get(user=None, month='').debt, 0)
+
+
+class LoweredCapacityTests(TestCase):
+    def test_cancelling_does_not_sell_above_a_lowered_capacity(self):
+        food = FoodAndDesire.objects.create(name='food', description='d', price=1000, limit=5, type='FOOD')
+        meal = WeeklyMeal.objects.create(date=timezone.now().date(), food=food, meal='LUNCH', price=food.price,
+                                         capacity=3)
+        payments = [PaymentFood.objects.create(user=User.objects.create_user(f'user{i}', credit=5000))
+                    for i in range(4)]
+        reservations = [WeeklyMealUser.objects.create(payment=payment, weekly_meal_food=meal)
+                        for payment in payments[:3]]
+        meal.capacity = 1
+        meal.save()
+        meal.reset_remaining()
+        self.assertEqual(meal.remaining, 0)
+
+        # two reservations are left for one portion
+        reservations[0].delete()
+        meal.refresh_from_db()
+        self.assertEqual(meal.remaining, 0)
+        with self.assertRaises(SoldOut), transaction.atomic():
+            WeeklyMealUser.objects.create(payment=payments[3], weekly_meal_food=meal)
+
+        reservations[1].delete()
+        meal.refresh_from_db()
+        self.assertEqual(meal.remaining, 0)
+        reservations[2].delete()
+        meal.refresh_from_db()
+        self.assertEqual(meal.remaining, 1)
+        WeeklyMealUser.objects.create(payment=payments[3], weekly_meal_food=meal)
+        meal.refresh_from_db()
+        self.assertEqual(meal.remaining, 0)
+
+    def test_smaller_edit_gives_back_up_to_the_lowered_capacity(self):
+        food = FoodAndDesire.objects.create(name='food', description='d', price=1000, limit=5, type='FOOD')
+        meal = WeeklyMeal.objects.create(date=timezone.now().date(), food=food, meal='LUNCH', price=food.price,
+                                         capacity=10)
+        reservation = WeeklyMealUser.objects.create(payment=PaymentFood.objects.create(
+            user=User.objects.create_user('user', credit=50000)), weekly_meal_food=meal, count=8)
+        meal.capacity = 4
+        meal.save()
+        meal.reset_remaining()
+
+        reservation.count = 3
+        reservation.save()
+        meal.refresh_from_db()
+        self.assertEqual(meal.remaining, 1)
@@ -1,7 +1,10 @@
+import tempfile
 import uuid
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, viewsets, status
@@ -11,10 +14,15 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
 from foods.exception import DateIsPast, NotEnoughMoney, InputNotValid
+from foods.menu import get_menu, menu_window
 from foods.models import PaymentFood, FoodAndDesire, WeeklyMeal, WeeklyMealUser
+from foods.report import kitchen_report, kitchen_report_csv, kitchen_report_window, write_kitchen_report_excel
 from foods.serializer import PaymentFoodSerializer, FoodAndDesireSerializer, WeeklyMealSerializer, \
     WeeklyMealUserSerializer
+from main.pagination import OptionalCursorPagination
 from main.permissions import IsOwner, IsSuperUser, IsSuperUserOrReadOnly
+from users.renderer import ExcelRenderer
+from utils.utils import EXCEL_SPOOL_MAX_SIZE
 
 User = get_user_model()
 
@@ -39,14 +47,49 @@ class WeeklyMealViewSet(viewsets.ModelViewSet):
         'date': ['lt', 'gt'],
     }
 
+    def get_queryset(self):
+        return WeeklyMealSerializer.setup_eager_loading(super().get_queryset())
+
+    def list(self, request, *args, **kwargs):
+        # the weekly menu (?date__gt=&date__lt=) is answered from the cached per week documents
+        window = menu_window(request.query_params)
+        if window is None:
+            return super().list(request, *args, **kwargs)
+        meals, etag = get_menu(*window)
+        if etag in [tag.strip() for tag in request.headers.get('If-None-Match', '').split(',')]:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(meals)
+        response['ETag'] = etag
+        return response
+
     @action(detail=False, methods=['get'], permission_classes=[IsSuperUser])
     def today(self, request, *args, **kwargs):
-        queryset = self.queryset.filter(date=timezone.now().date())
+        queryset = self.get_queryset().filter(date=timezone.now().date())
         paginator = PageNumberPagination()
         result_page = paginator.paginate_queryset(queryset, request)
         serializer = self.get_serializer(result_page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
+    @action(detail=False, methods=['get'], permission_classes=[IsSuperUser])
+    def report(self, request, *args, **kwargs):
+        window = kitchen_report_window(request.query_params)
+        if window is None:
+            raise InputNotValid
+        report = kitchen_report(*window)
+        file_format = request.query_params.get('file', None)
+        if file_format == 'csv':
+            response = StreamingHttpResponse(kitchen_report_csv(report.iterator()), content_type='text/csv')
+            response['Content-Disposition'] = 'attachment; filename="kitchen-report.csv"'
+            return response
+        if file_format == 'xlsx':
+            file = tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_MAX_SIZE)
+            write_kitchen_report_excel(report.iterator(), file)
+            file.seek(0)
+            return FileResponse(file, as_attachment=True, filename='kitchen-report.xlsx',
+                                content_type=ExcelRenderer.media_type)
+        return Response(report)
+
     @action(detail=False, methods=['post'])
     def bulk_create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data, many=True)
@@ -67,6 +110,7 @@ class WeeklyMealUserViewSet(viewsets.ModelViewSet):
     queryset = WeeklyMealUser.objects.all()
     serializer_class = WeeklyMealUserSerializer
     filter_backends = [DjangoFilterBackend]
+    pagination_class = OptionalCursorPagination
 
     filterset_fields = {
         'weekly_meal_food__date': ['lt', 'gt'],
@@ -74,11 +118,15 @@ class WeeklyMealUserViewSet(viewsets.ModelViewSet):
 
     def list(self, request, *args, **kwargs):
         response = super().list(request, *args, **kwargs)
-        response.data.append({'credit': request.user.credit})
+        if isinstance(response.data, dict):
+            response.data['credit'] = request.user.credit
+        else:
+            response.data.append({'credit': request.user.credit})
         return response
 
     def get_queryset(self):
-        return self.queryset.filter(payment__user=self.request.user)
+        queryset = WeeklyMealUserSerializer.setup_eager_loading(self.queryset)
+        return queryset.filter(payment__user=self.request.user)
 
     def perform_create(self, serializer):
         payment = PaymentFood.objects.get_or_create(user=self.request.user)
@@ -90,10 +138,13 @@ class WeeklyMealUserViewSet(viewsets.ModelViewSet):
                 price += data['weekly_meal_food'].price * data['count']
         else:
             price = validated_data['weekly_meal_food'].price * validated_data['count']
-        user = self.request.user
-        if user.credit < price:
-            raise NotEnoughMoney
-        serializer.save(payment=payment[0])
+        # the user row stays locked until the reservation is charged, so parallel requests can not overspend
+        with transaction.atomic():
+            users = User.objects.select_for_update(no_key=True)
+            credit = users.values_list('credit', flat=True).get(pk=self.request.user.pk)
+            if credit < price:
+                raise NotEnoughMoney
+            serializer.save(payment=payment[0])
 
     @action(detail=False, methods=['post'])
     def bulk_create(self, request, *args, **kwargs):
@@ -122,7 +173,7 @@ class WeeklyMealUserViewSet(viewsets.ModelViewSet):
 
 class PaymentFoodRUAV(generics.RetrieveUpdateAPIView):
     permission_classes = (IsOwner,)
-    queryset = PaymentFood.objects.all()
+    queryset = PaymentFoodSerializer.setup_eager_loading(PaymentFood.objects.all())
     serializer_class = PaymentFoodSerializer
 
 
@@ -133,5 +184,5 @@ class PaymentFoodRUAVMe(PaymentFoodRUAV):
 
 class PaymentFoodLAV(generics.ListAPIView):
     permission_classes = (IsSuperUser,)
-    queryset = PaymentFood.objects.all()
+    queryset = PaymentFoodSerializer.setup_eager_loading(PaymentFood.objects.all())
     serializer_class = PaymentFoodSerializer
@@ -0,0 +1,170 @@
+import asyncio
+import os
+import sqlite3
+import threading
+from urllib.parse import urlsplit
+
+import httpx
+from zeep import AsyncClient, Client
+from zeep.cache import InMemoryCache, SqliteCache
+from zeep.transports import AsyncTransport, Transport
+
+# a saved copy of a wsdl, named after its page (send.asmx.wsdl, users.asmx.wsdl, ...), is used instead of the url
+WSDL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wsdl')
+# the downloaded wsdl files are kept on disk, the provider rarely changes them
+WSDL_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+_clients = {}
+_cache = None
+_lock = threading.Lock()
+
+
+def wsdl_location(url):
+    path = os.path.join(WSDL_DIR, urlsplit(url).path.rsplit('/', 1)[-1] + '.wsdl')
+    return path if os.path.isfile(path) else url
+
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        try:
+            _cache = SqliteCache(timeout=WSDL_CACHE_TIMEOUT)
+        except (OSError, sqlite3.Error):
+            # no writable cache directory, keep them for the process only
+            _cache = InMemoryCache(timeout=WSDL_CACHE_TIMEOUT)
+    return _cache
+
+
+def get_client(url):
+    """
+    _Get Client_
+    The zeep client of a wsdl url, built once per process and shared by all
+    threads, parsing a wsdl is much slower than calling the service.
+    Args:
+        url (_str_): Wsdl url
+    Returns:
+        _Client_: zeep client
+    """
+
+    client = _clients.get(url)
+    if client is None:
+        with _lock:
+            client = _clients.get(url)
+            if client is None:
+                client = Client(wsdl_location(url), transport=Transport(cache=get_cache()))
+                _clients[url] = client
+    return client
+
+
+def run_sync(coroutine):
+    """
+    Runs a coroutine to the end from sync code. Inside a running event loop
+    it has to be awaited instead, blocking there would stop the loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    coroutine.close()
+    raise RuntimeError('Called from a running event loop, await the coroutine instead')
+
+
+class AsyncSoapClient:
+    """
+    Base of the async SOAP classes. The operations are coroutines sent over
+    one httpx connection pool, shared by the instance in an event loop, and
+    the wsdl files are the ones parsed once by get_client.
+    """
+
+    def __init__(self, username, password, limit=10, timeout=(3.05, 10)):
+        """
+        Args:
+            limit (_int_): Connections open at once
+            timeout (_tuple_): (connect, read) seconds of a call
+        """
+        self.username = username
+        self.password = password
+        self.limit = limit
+        self.timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        self.transport = None
+        self.loop = None
+        self.clients = {}
+
+    def get_data(self):
+        return {
+            'username': self.username,
+            'password': self.password
+        }
+
+    async def get_service(self, url):
+        # httpx clients belong to the loop they were used in, a new asyncio.run gets a new transport
+        loop = asyncio.get_running_loop()
+        if self.transport is None or self.loop is not loop:
+            limits = httpx.Limits(max_connections=self.limit, max_keepalive_connections=self.limit)
+            self.transport = AsyncTransport(client=httpx.AsyncClient(limits=limits, timeout=self.timeout),
+                                            wsdl_client=httpx.Client(timeout=self.timeout), cache=get_cache())
+            self.loop = loop
+            self.clients = {}
+        client = self.clients.get(url)
+        if client is None:
+            # the first get_client of a url downloads and parses the wsdl, in a thread so the loop keeps running
+            wsdl = (await asyncio.to_thread(get_client, url)).wsdl
+            client = self.clients.setdefault(url, AsyncClient(wsdl, transport=self.transport))
+        return client.service
+
+    async def call(self, url, func, data):
+        service = await self.get_service(url)
+        return await getattr(service, func)(**data)
+
+    async def gather(self, calls, concurrency=10):
+        """
+        _Gather_
+        Awaits the calls, at most `concurrency` at once.
+        Args:
+            calls (_list_): Coroutines of the instance, e.g. [soap.get_credit(), soap.send(...)]
+            concurrency (_int_): Calls in flight at once
+        Returns:
+            _list_: The result of each call in order, the exception when it failed
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*[call(coroutine) for coroutine in calls], return_exceptions=True)
+
+    def run(self, coroutine):
+        """
+        Sync wrapper of the coroutines, e.g. soap.run(soap.get_credit()).
+        """
+
+        async def main():
+            try:
+                return await coroutine
+            finally:
+                await self.close()
+
+        try:
+            return run_sync(main())
+        except RuntimeError:
+            # never started when a loop is running, a finished one ignores it
+            coroutine.close()
+            raise
+
+    def makeRequest(self, url, func, data):
+        return self.run(self.gather([self.call(url, func, data)]))
+
+    async def close(self):
+        if self.transport is not None and self.loop is asyncio.get_running_loop():
+            await self.transport.aclose()
+            self.transport.wsdl_client.close()
+        self.transport = None
+        self.clients = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
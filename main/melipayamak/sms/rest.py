@@ -1,16 +1,69 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
 
 
 class Rest:
     PATH = "https://rest.payamak-panel.com/api/SendSMS/%s"
+    # calls that only read, the others send messages and must not be repeated after they reached the provider
+    IDEMPOTENT = ('GetDeliveries2', 'GetMessages', 'GetCredit', 'GetBasePrice', 'GetUserNumbers')
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
 
-    def __init__(self, username, password):
+    def __init__(self, username, password, pool_size=10, timeout=(3.05, 10), retries=3, backoff=0.5):
+        """
+        Args:
+            pool_size (_int_): Keep-alive connections kept to the provider
+            timeout (_tuple_): (connect, read) seconds of a call
+            retries (_int_): Attempts after the first one, with exponential backoff
+            backoff (_float_): Backoff factor in seconds, see urllib3 Retry
+        """
         self.username = username
         self.password = password
+        self.timeout = timeout
+        self.metrics = defaultdict(lambda: {'calls': 0, 'errors': 0, 'seconds': 0.0, 'max': 0.0})
+        self.metrics_lock = threading.Lock()
+
+        self.session = requests.Session()
+        # a connection that could not be opened never reached the provider, every call retries those
+        send_retry = Retry(total=retries, connect=retries, read=0, status=0, other=0, backoff_factor=backoff)
+        read_retry = Retry(total=retries, backoff_factor=backoff, status_forcelist=self.RETRY_STATUSES,
+                           allowed_methods=None, raise_on_status=False)
+        self.session.mount(self.PATH % '', HTTPAdapter(pool_maxsize=pool_size, max_retries=send_retry))
+        # one adapter, so one connection pool, for all the read calls
+        read_adapter = HTTPAdapter(pool_maxsize=pool_size, max_retries=read_retry)
+        for name in self.IDEMPOTENT:
+            self.session.mount(self.PATH % name, read_adapter)
 
     def post(self, url, data):
-        r = requests.post(url, data)
-        return r.json()
+        name = url.rsplit('/', 1)[-1]
+        start = time.perf_counter()
+        failed = True
+        try:
+            r = self.session.post(url, data, timeout=self.timeout)
+            result = r.json()
+            failed = False
+            return result
+        finally:
+            self.record(name, time.perf_counter() - start, failed)
+
+    def record(self, name, seconds, failed):
+        with self.metrics_lock:
+            metric = self.metrics[name]
+            metric['calls'] += 1
+            metric['errors'] += failed
+            metric['seconds'] += seconds
+            metric['max'] = max(metric['max'], seconds)
+        logger.debug('melipayamak %s %.1f ms%s', name, seconds * 1000, ' (failed)' if failed else '')
+
+    def close(self):
+        self.session.close()
 
     def get_data(self):
         return {
@@ -1,17 +1,59 @@
+import asyncio
+
 import aiohttp
 
+
+async def close_session(session, loop):
+    # a session is closed in its own loop when that loop still runs in another thread
+    if loop is not asyncio.get_running_loop() and loop.is_running():
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+    else:
+        await session.close()
+
 class RestAsync:
     PATH = "https://rest.payamak-panel.com/api/SendSMS/%s"
 
-    def __init__(self, username, password):
+    def __init__(self, username, password, limit=100, timeout=(3.05, 10)):
+        """
+        Args:
+            limit (_int_): Connections open at once in the shared session
+            timeout (_tuple_): (connect, read) seconds of a call
+        """
         self.username = username
         self.password = password
+        self.limit = limit
+        self.timeout = aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+        self.session = None
+        self.loop = None
+
+    async def get_session(self):
+        # a session belongs to the loop it was created in, a new asyncio.run gets a new one
+        loop = asyncio.get_running_loop()
+        if self.session is None or self.session.closed or self.loop is not loop:
+            stale, stale_loop = self.session, self.loop
+            connector = aiohttp.TCPConnector(limit=self.limit)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self.loop = loop
+            if stale is not None and not stale.closed:
+                await close_session(stale, stale_loop)
+        return self.session
+
+    async def close(self):
+        session, self.session = self.session, None
+        if session is not None and not session.closed:
+            await close_session(session, self.loop)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
 
     async def post(self, url, data):
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, data=data) as resp:
-                if resp.status == 200:
-                    return await resp.text()
+        session = await self.get_session()
+        async with session.post(url, data=data) as resp:
+            if resp.status == 200:
+                return await resp.text()
 
     def get_data(self):
         return {
@@ -66,3 +108,24 @@ class RestAsync:
     async def get_numbers(self):
         url = self.PATH % ('GetUserNumbers')
         return await self.post(url, self.get_data())
+
+    async def send_many(self, messages, concurrency=10):
+        """
+        _Send Many_
+        Sends the messages over the shared session, at most `concurrency` at once.
+        Args:
+            messages (_list_): send arguments of each message, a (to, _from, text) tuple or a dict
+            concurrency (_int_): Messages in flight at once
+        Returns:
+            _list_: The result of each message in order, the exception when it failed
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(message):
+            async with semaphore:
+                if isinstance(message, dict):
+                    return await self.send(**message)
+                return await self.send(*message)
+
+        return await asyncio.gather(*[send(message) for message in messages], return_exceptions=True)
@@ -1,4 +1,4 @@
-from zeep import Client
+from .clients import get_client
 
 
 class Users:
@@ -7,7 +7,7 @@ class Users:
     def __init__(self, username, password):
         self.username = username
         self.password = password
-        self.client = Client(self.PATH)
+        self.client = get_client(self.PATH)
 
     def get_data(self):
         return {
@@ -1,133 +1,98 @@
-import zeep
-from zeep.transports import AsyncTransport
-import asyncio
+from .clients import AsyncSoapClient
 
 
-class UsersAsync:
+class UsersAsync(AsyncSoapClient):
     PATH = 'http://api.payamak-panel.com/post/users.asmx?wsdl'
 
-    def __init__(self, username, password):
-        self.username = username
-        self.password = password
-        
-
-    def get_data(self):
-        return {
-            'username': self.username,
-            'password': self.password
-        }
-
     def makeRequest(self, func, data):
-        result = []
-
-        def handle_future(future):
-            result.extend(future.result())
-
-        loop = asyncio.get_event_loop()
-
-        transport = AsyncTransport(loop, cache=None)
-        client = zeep.Client(self.PATH, transport=transport)
-
-        tasks = [
-            getattr(client.service, func)(**data)
-        ]
-        future = asyncio.gather(*tasks, return_exceptions=True)
-
-        future.add_done_callback(handle_future)
-
-        # st = time.time()
-        loop.run_until_complete(future)
-        loop.run_until_complete(transport.session.close())
-        # print("time: %.2f" % (time.time() - st))
-        return result
-
+        return super().makeRequest(self.PATH, func, data)
 
-    def add_payment(self, options):
-        return self.makeRequest('AddPayment', {**self.get_data(), **options})
+    async def add_payment(self, options):
+        return await self.call(self.PATH, 'AddPayment', {**self.get_data(), **options})
         
 
-    def add(self, options):
-        return self.makeRequest('AddUser', {**self.get_data(), **options})
+    async def add(self, options):
+        return await self.call(self.PATH, 'AddUser', {**self.get_data(), **options})
 
 
-    def add_complete(self, options):
-        return self.makeRequest('AddUserComplete', {**self.get_data(), **options})
+    async def add_complete(self, options):
+        return await self.call(self.PATH, 'AddUserComplete', {**self.get_data(), **options})
         
 
-    def add_with_location(self, options):
-        return self.makeRequest('AddUserWithLocation', {**self.get_data(), **options})
+    async def add_with_location(self, options):
+        return await self.call(self.PATH, 'AddUserWithLocation', {**self.get_data(), **options})
         
 
-    def authenticate(self):
-        return self.makeRequest('AuthenticateUser', self.get_data())
+    async def authenticate(self):
+        return await self.call(self.PATH, 'AuthenticateUser', self.get_data())
 
-    def change_credit(self, amount, description, targetUsername, GetTax):
+    async def change_credit(self, amount, description, targetUsername, GetTax):
         data = {
             'amount': amount,
             'description': description,
             'targetUsername': targetUsername,
             'GetTax': GetTax
         }
-        return self.makeRequest('ChangeUserCredit', {**self.get_data(), **data})
+        return await self.call(self.PATH, 'ChangeUserCredit', {**self.get_data(), **data})
 
 
-    def forgot_password(self, mobileNumber, emailAddress, targetUsername):
+    async def forgot_password(self, mobileNumber, emailAddress, targetUsername):
         data = {
             'mobileNumber': mobileNumber,
             'emailAddress': emailAddress,
             'targetUsername': targetUsername
         }
-        return self.makeRequest('ForgotPassword', {**self.get_data(), **data})
+        return await self.call(self.PATH, 'ForgotPassword', {**self.get_data(), **data})
 
 
-    def get_base_price(self, targetUsername):
+    async def get_base_price(self, targetUsername):
         data = {
             'targetUsername': targetUsername
         }
-        return self.makeRequest('GetUserBasePrice', {**self.get_data(), **data})
+        return await self.call(self.PATH, 'GetUserBasePrice', {**self.get_data(), **data})
 
 
-    def remove(self, targetUsername):
+    async def remove(self, targetUsername):
         data = {
             'targetUsername': targetUsername
         }
-        return self.makeRequest('RemoveUser', {**self.get_data(), **data})
+        return await self.call(self.PATH, 'RemoveUser', {**self.get_data(), **data})
 
 
-    def get_credit(self, targetUsername):
+    async def get_credit(self, targetUsername):
         data = {
             'targetUsername': targetUsername
         }
-        return self.makeRequest('GetUserCredit', {**self.get_data(), **data})
+        return await self.call(self.PATH, 'GetUserCredit', {**self.get_data(), **data})
 
 
-    def get_details(self, targetUsername):
+    async def get_details(self, targetUsername):
         data = {
             'targetUsername': targetUsername
         }
-        return self.makeRequest('GetUserDetails', {**self.get_data(), **data})
+        return await self.call(self.PATH, 'GetUserDetails', {**self.get_data(), **data})
 
 
-    def get_numbers(self):
-        return self.makeRequest('GetUserNumbers', self.get_data())
+    async def get_numbers(self):
+        return await self.call(self.PATH, 'GetUserNumbers', self.get_data())
         
 
-    def get_provinces(self):
-        return self.makeRequest('GetProvinces', self.get_data())
+    async def get_provinces(self):
+        return await self.call(self.PATH, 'GetProvinces', self.get_data())
         
 
-    def get_cities(self, provinceId):
+    async def get_cities(self, provinceId):
         data = {
             'provinceId': provinceId
         }
-        return self.makeRequest('GetCities', {**self.get_data(), **data})
+        return await self.call(self.PATH, 'GetCities', {**self.get_data(), **data})
 
 
-    def get_expire_date(self):
-        return self.makeRequest('GetExpireDate', self.get_data())
+    async def get_expire_date(self):
+        return await self.call(self.PATH, 'GetExpireDate', self.get_data())
         
 
-    def get_transactions(self, targetUsername, creditType, dateFrom, dateTo, keyword):
+    async def get_transactions(self, targetUsername, creditType, dateFrom, dateTo, keyword):
         data = {
             'targetUsername': targetUsername,
             'creditType': creditType,
@@ -135,15 +100,15 @@ class UsersAsync:
             'dateTo': dateTo,
             'keyword': keyword
         }
-        return self.makeRequest('GetUserTransactions', {**self.get_data(), **data})
+        return await self.call(self.PATH, 'GetUserTransactions', {**self.get_data(), **data})
         
 
-    def get(self):
-        return self.makeRequest('GetUsers', self.get_data())
+    async def get(self):
+        return await self.call(self.PATH, 'GetUsers', self.get_data())
         
 
-    def has_filter(self, text):
+    async def has_filter(self, text):
         data = {
             'text': text
         }
-        return self.makeRequest('HasFilter', {**self.get_data(), **data})
+        return await self.call(self.PATH, 'HasFilter', {**self.get_data(), **data})
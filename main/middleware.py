@@ -0,0 +1,114 @@
+import json
+import logging
+import os
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+QUERY_BUDGET_FILE = 'query_budgets.json'
+SAVEPOINT_STATEMENTS = ('SAVEPOINT ', 'RELEASE SAVEPOINT ', 'ROLLBACK TO SAVEPOINT ')
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def load_query_budgets():
+    """
+    Collects the per-view query budgets of every installed app. Each app may
+    ship a `query_budgets.json` next to its urls, mapping a namespaced view
+    name to a maximum query count, either for all methods or per method:
+
+        {"foods:weekly-meal-list": {"GET": 4, "POST": 8}, "foods:weekly-meal-detail": 4}
+    """
+    budgets = {}
+    for app_config in apps.get_app_configs():
+        path = os.path.join(app_config.path, QUERY_BUDGET_FILE)
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as file:
+                budgets.update(json.load(file))
+    return budgets
+
+
+class QueryRecorder(object):
+    """
+    `connection.execute_wrapper` callable that counts, times and fingerprints
+    the queries of one request. The SQL is recorded before parameters are
+    bound, so the statement itself is the fingerprint. Savepoints are not
+    counted, a view runs them only when it is called inside a transaction
+    (tests), so the count is the same in tests and in production.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.startswith(SAVEPOINT_STATEMENTS):
+            return execute(sql, params, many, context)
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.fingerprints[sql] += 1
+
+    @property
+    def duplicates(self):
+        return sum(count - 1 for count in self.fingerprints.values() if count > 1)
+
+
+class QueryBudgetMiddleware(object):
+    """
+    Records the SQL count, SQL time and duplicate queries of every request,
+    reports them in a `Server-Timing` header and compares the count with the
+    budget declared for the view. Over budget requests are logged, or raise
+    QueryBudgetExceeded when QUERY_BUDGET_STRICT is set (tests).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.budgets = load_query_budgets()
+        self.strict = getattr(settings, 'QUERY_BUDGET_STRICT', False)
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={recorder.duration * 1000:.1f};desc="{recorder.count} queries"',
+            f'db-dup;desc="{recorder.duplicates} duplicate queries"',
+        ])
+        self.check_budget(request, recorder)
+        return response
+
+    def get_budget(self, request):
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return None
+        budget = self.budgets.get(match.view_name, None)
+        if isinstance(budget, dict):
+            return budget.get(request.method, None)
+        return budget
+
+    def check_budget(self, request, recorder):
+        budget = self.get_budget(request)
+        if budget is None or recorder.count <= budget:
+            return
+        duplicated = [sql for sql, count in recorder.fingerprints.most_common(3) if count > 1]
+        message = (f'{request.method} {request.path} ({request.resolver_match.view_name}) ran {recorder.count} '
+                   f'queries, budget is {budget}. Most repeated: {duplicated}')
+        if self.strict:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
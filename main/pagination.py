@@ -0,0 +1,182 @@
+import base64
+import binascii
+import hashlib
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CountedPageNumberPagination(PageNumberPagination):
+    """
+    Page number pagination that does not run COUNT(*) on every page turn.
+    The count of a queryset is cached for PAGE_COUNT_CACHE_TTL seconds, keyed
+    by its compiled WHERE clause, so the same filters share one count whatever
+    order the query string has, and users that only see their own rows never
+    share one. An unfiltered list of a table with more than
+    PAGE_COUNT_ESTIMATE_THRESHOLD rows uses the Postgres `reltuples` estimate.
+    `count_exact` is only true for a count that was just run, a cached one may
+    be out of date.
+    """
+    count_cache_ttl = settings.PAGE_COUNT_CACHE_TTL
+    count_estimate_threshold = settings.PAGE_COUNT_ESTIMATE_THRESHOLD
+
+    def django_paginator_class(self, queryset, page_size):
+        paginator = Paginator(queryset, page_size)
+        paginator.count, self.count_exact = self.get_count(queryset)
+        return paginator
+
+    def get_count(self, queryset):
+        queryset = queryset.order_by()
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return 0, True
+        key = 'page-count:%s' % hashlib.sha1(repr((queryset.db, sql, params)).encode('utf-8')).hexdigest()
+        count = cache.get(key, None)
+        if count is not None:
+            return count, False
+        count = self.estimate_count(queryset)
+        exact = count is None
+        if exact:
+            count = queryset.count()
+        cache.set(key, count, timeout=self.count_cache_ttl)
+        return count, exact
+
+    def estimate_count(self, queryset):
+        query = queryset.query
+        if query.where or query.distinct or query.is_sliced or connections[queryset.db].vendor != 'postgresql':
+            return None
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute('SELECT reltuples FROM pg_class WHERE oid = %s::regclass', [queryset.model._meta.db_table])
+            row = cursor.fetchone()
+        # reltuples is -1 until the table is analyzed
+        if row is None or row[0] < self.count_estimate_threshold:
+            return None
+        return int(row[0])
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('count', self.page.paginator.count),
+            ('count_exact', self.count_exact),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+
+class CursorPageNumberPagination(CountedPageNumberPagination):
+    """
+    Counted page number pagination that switches to keyset pagination when the
+    request has `?cursor=` (empty for the first page). A cursor page is read with
+    `WHERE (date, id) < (last date, last id) ORDER BY date DESC, id DESC LIMIT n`,
+    so it costs the same at any depth and runs no COUNT query.
+
+    The view sets `cursor_ordering`, non null columns ending with a unique one,
+    ideally covered by an index:
+
+        cursor_ordering = ('-date', '-id')
+    """
+    cursor_query_param = 'cursor'
+    cursor_ordering = ('pk',)
+    invalid_cursor_message = 'Invalid cursor'
+    # without a cursor the list keeps its page numbers
+    page_number_fallback = True
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor = request.query_params.get(self.cursor_query_param, None)
+        if self.cursor is None:
+            if not self.page_number_fallback:
+                return None
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.ordering = list(getattr(view, 'cursor_ordering', self.cursor_ordering))
+        position, reverse = self.decode_cursor(self.cursor)
+        ordering = [self.invert(field) for field in self.ordering] if reverse else self.ordering
+        if position is not None:
+            try:
+                queryset = queryset.filter(self.keyset_filter(ordering, position))
+            except ValidationError:
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        has_next, has_previous = (True, has_more) if reverse else (has_more, position is not None)
+        self.next_position = self.get_position(results[-1]) if results and has_next else None
+        self.previous_position = self.get_position(results[0]) if results and has_previous else None
+        return results
+
+    def get_paginated_response(self, data):
+        if self.cursor is None:
+            return super().get_paginated_response(data)
+        return Response(OrderedDict([
+            ('next', self.get_cursor_link(self.next_position, False)),
+            ('previous', self.get_cursor_link(self.previous_position, True)),
+            ('results', data),
+        ]))
+
+    @staticmethod
+    def invert(field):
+        return field[1:] if field.startswith('-') else '-' + field
+
+    @staticmethod
+    def keyset_filter(ordering, position):
+        # (a, b) after (x, y) is a > x OR (a = x AND b > y), with < for descending fields. The OR can not
+        # bound an index scan, so a >= x is repeated on its own for the database to start the scan at x.
+        query = Q()
+        for index, field in enumerate(ordering):
+            name = field.lstrip('-')
+            lookup = '%s__%s' % (name, 'lt' if field.startswith('-') else 'gt')
+            equal = {previous.lstrip('-'): value for previous, value in zip(ordering[:index], position)}
+            query |= Q(**equal, **{lookup: position[index]})
+        first = ordering[0]
+        return Q(**{'%s__%s' % (first.lstrip('-'), 'lte' if first.startswith('-') else 'gte'): position[0]}) & query
+
+    def get_position(self, instance):
+        return [str(getattr(instance, field.lstrip('-'))) for field in self.ordering]
+
+    def decode_cursor(self, cursor):
+        if not cursor:
+            return None, False
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+            position, reverse = data['p'], bool(data.get('r', False))
+        except (TypeError, ValueError, KeyError, UnicodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, position, reverse):
+        data = {'p': position, 'r': 1} if reverse else {'p': position}
+        return base64.urlsafe_b64encode(json.dumps(data, separators=(',', ':')).encode('utf-8')).decode('ascii')
+
+    def get_cursor_link(self, position, reverse):
+        if position is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position, reverse))
+
+
+class OptionalCursorPagination(CursorPageNumberPagination):
+    """
+    Keyset pagination on `?cursor=`, the whole list otherwise.
+    """
+    page_number_fallback = False
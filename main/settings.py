@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 import os
+import sys
 from datetime import timedelta
 from pathlib import Path
 
@@ -27,6 +28,8 @@ SECRET_KEY = config('SECRET_KEY')
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
 
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+
 ALLOWED_HOSTS = []
 
 # Application definition
@@ -61,6 +64,12 @@ MIDDLEWARE = [
     'django_user_agents.middleware.UserAgentMiddleware',
 ]
 
+# Per-request SQL count/time in Server-Timing, checked against each app's query_budgets.json.
+# Over budget views are logged in debug and fail the request under `manage.py test`.
+if DEBUG or TESTING:
+    MIDDLEWARE.insert(0, 'main.middleware.QueryBudgetMiddleware')
+QUERY_BUDGET_STRICT = TESTING
+
 ROOT_URLCONF = 'main.urls'
 
 TEMPLATES = [
@@ -201,6 +210,28 @@ SMS_FROM = config('SMS_FROM')
 
 CACHE_TTL = 60 * 60
 CACHE_TTL_CODE = 60 * 2
+GEO_CACHE_TTL = 60 * 60 * 24
+MENU_CACHE_TTL = 60 * 60 * 24
+PAGE_COUNT_CACHE_TTL = 60
+# unfiltered lists of bigger tables are counted from the planner statistics
+PAGE_COUNT_ESTIMATE_THRESHOLD = 100000
+
+EXPORT_REUSE_TTL = 60 * 10
+EXPORT_DOWNLOAD_TTL = 60 * 60
+EXPORT_POLL_INTERVAL = 5
+EXPORT_CLAIM_TIMEOUT = 60 * 5
+# finished jobs and their files are deleted by the export worker after this long
+EXPORT_KEEP_TTL = 60 * 60 * 24
+
+SMS_POLL_INTERVAL = 5
+# recipients of one SendSimpleSMS call and provider calls per second, the rate only holds per sms worker
+# process, with several workers each may call this often
+SMS_BATCH_SIZE = 100
+SMS_RATE_LIMIT = 5
+SMS_MAX_ATTEMPTS = 5
+# seconds before the first retry, doubled on every attempt
+SMS_RETRY_BACKOFF = 30
+SMS_CLAIM_TIMEOUT = 60 * 5
 
 CACHES = {
     'default': {
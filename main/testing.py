@@ -0,0 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+from django.test import Client
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+def jwt_client(user=None):
+    if user is None:
+        return Client()
+    return Client(HTTP_AUTHORIZATION='JWT ' + str(AccessToken.for_user(user)))
+
+
+def run_parallel(function, arguments, threads):
+    # every thread closes its own connection, the test database can not be dropped while one is open
+    def call(argument):
+        try:
+            return function(argument)
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(threads) as executor:
+        return list(executor.map(call, arguments))
+
+
+def plan(queryset):
+    # without sequential scans the planner takes any index that fits the query, however few rows the test has
+    with connection.cursor() as cursor:
+        cursor.execute('SET LOCAL enable_seqscan = off')
+    return queryset.explain()
@@ -0,0 +1,539 @@
+import asyncio
+import base64
+import datetime
+import json
+import shutil
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import requests
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.client import encode_multipart, BOUNDARY, MULTIPART_CONTENT
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from foods.models import FoodAndDesire, WeeklyMeal, WeeklyMealUser, PaymentFood
+from main.melipayamak.sms.rest import Rest
+from main.melipayamak.sms.restAsync import RestAsync
+from main.melipayamak.sms.soapAsync import SoapAsync
+from main.middleware import load_query_budgets
+from main.pagination import CountedPageNumberPagination
+from main.testing import jwt_client
+from teams.models import Team, Activity, MemberRecruitmentFilter, MembershipRequest
+from users.models import User, Profile, TransactionHistory, Skill, Education, Experience, TeamUser
+from utils.cities import get_provinces, get_cities
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+GIF = (b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00,'
+       b'\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;')
+
+
+def image(name='image.gif'):
+    return SimpleUploadedFile(name, GIF, content_type='image/gif')
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class QueryBudgetTests(TestCase):
+    """
+    Calls every route that has a query budget, with the middleware in strict
+    mode, so a change that makes a route run more queries than its budget
+    fails here with QueryBudgetExceeded.
+    """
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'x', credit=10 ** 8)
+        cls.other_admin = User.objects.create_superuser('admin2', 'admin2@example.com', 'x')
+        cls.users = [User.objects.create_user(f'user{i}', password='x', credit=10 ** 6) for i in range(15)]
+        for i, user in enumerate(cls.users):
+            Profile.objects.filter(user=user).update(first_name=f'name{i}', last_name='last', is_confirmed='P',
+                                                     date_of_birth='1990-01-01', marital_status='S')
+        profiles = [user.profile_user for user in cls.users]
+
+        now = timezone.now()
+        cls.team = Team.objects.create(name='team', description='d', ceo=profiles[0], create_date=now,
+                                       image='team.gif')
+        cls.team.managers.add(profiles[0], profiles[1])
+        cls.team_filter = MemberRecruitmentFilter.objects.create(team=cls.team)
+        cls.team_without_filter = Team.objects.create(name='team2', description='d', ceo=profiles[1],
+                                                      create_date=now, image='team.gif')
+        cls.team_to_delete = Team.objects.create(name='team3', description='d', ceo=profiles[2], create_date=now,
+                                                 image='team.gif')
+        for profile in profiles[:4]:
+            TeamUser.objects.create(team=cls.team, profile=profile, membership_type='PE')
+        cls.team_user = TeamUser.objects.create(team=cls.team, profile=cls.admin.profile_user, membership_type='PE')
+        cls.activities = []
+        for i in range(12):
+            activity = Activity.objects.create(name=f'activity{i}', description='d', image='a.gif', team=cls.team)
+            Activity.objects.create(name=f'child{i}', description='d', image='a.gif', team=cls.team, child=activity)
+            cls.activities.append(activity)
+        cls.membership_requests = [MembershipRequest.objects.create(
+            full_name='name', phone_number='09121234567', experience=1, age=20, gender='M', city='city',
+            membership_type='PE', team=cls.team, cv='cv.pdf', description='d') for _ in range(12)]
+
+        for profile in profiles[4:6]:
+            Skill.objects.create(name='skill', description='d', profile=profile)
+        cls.skill = Skill.objects.create(name='skill', description='d', profile=cls.admin.profile_user)
+        cls.skill_to_delete = Skill.objects.create(name='skill', description='d', profile=profiles[4])
+        cls.education, cls.education_to_delete = [Education.objects.create(
+            name='education', description='d', profile=cls.admin.profile_user, major='m', grade='MA', gpa=18,
+            image='e.gif', start='2010-01-01', stop='2014-01-01', is_student=False) for _ in range(2)]
+        cls.experience, cls.experience_to_delete = [Experience.objects.create(
+            name='experience', description='d', profile=cls.admin.profile_user, image='e.gif', company='c',
+            start='2014-01-01', stop='2018-01-01') for _ in range(2)]
+
+        foods = [FoodAndDesire.objects.create(name=f'food{i}', description='d', price=1000, limit=5, type='FOOD')
+                 for i in range(12)]
+        cls.desires = [FoodAndDesire.objects.create(name=f'desire{i}', description='d', price=100, limit=5,
+                                                    type='DESIRE') for i in range(2)]
+        cls.food = foods[0]
+        today = now.date()
+        cls.meals = []
+        for i in range(12):
+            meal = WeeklyMeal.objects.create(date=today + datetime.timedelta(days=i % 7), food=foods[i],
+                                             meal='LUNCH' if i < 7 else 'DINNER', price=1200)
+            meal.desire.set(cls.desires)
+            cls.meals.append(meal)
+        for user in [cls.admin] + cls.users:
+            PaymentFood.objects.get_or_create(user=user)
+        for payment in PaymentFood.objects.filter(user__in=[cls.admin] + cls.users[:5]):
+            for meal in cls.meals:
+                WeeklyMealUser.objects.create(payment=payment, weekly_meal_food=meal, count=1)
+        cls.payment = PaymentFood.objects.get(user=cls.admin)
+        cls.reservation = WeeklyMealUser.objects.filter(payment=cls.payment).first()
+
+        for user in [cls.admin] + cls.users:
+            TransactionHistory.objects.create(transaction_type='CBC', price=10, user_receiver=user)
+        for _ in range(12):
+            TransactionHistory.objects.create(transaction_type='CBC', price=10, user_receiver=cls.admin)
+        cls.transaction = TransactionHistory.objects.filter(user_receiver=cls.admin).first()
+        cls.waiting_transactions = [TransactionHistory.objects.create(
+            transaction_type='CBC', price=10, user_receiver=cls.users[0], status='WA') for _ in range(3)]
+
+    def request(self, client, method, url, data=None, multipart=False):
+        if multipart and method == 'post':
+            return client.post(url, data)
+        if multipart:
+            return getattr(client, method)(url, encode_multipart(BOUNDARY, data), content_type=MULTIPART_CONTENT)
+        return getattr(client, method)(url, data, content_type='application/json')
+
+    def profile_data(self):
+        province = get_provinces()[0]
+        return {
+            'first_name': 'name', 'last_name': 'last', 'marital_status': 'S', 'gender': 'M', 'address': 'address',
+            'state': province.name, 'city': get_cities(province.id)[0].name, 'phone_number': '09121234567',
+            'date_of_birth': '1990-01-01', 'country': 'DE', 'image': image(),
+            'foreigner_profile.exclusive_code': '123456', 'foreigner_profile.passport_image': image(),
+        }
+
+    def membership_request_data(self):
+        return {
+            'full_name': 'name', 'phone_number': '09121234567', 'experience': 2, 'age': 25, 'gender': 'M',
+            'city': 'city', 'membership_type': 'PE', 'team': self.team.pk, 'description': 'd',
+            'cv': SimpleUploadedFile('cv.pdf', b'%PDF-1.4', content_type='application/pdf'),
+        }
+
+    def cases(self):
+        """
+        (view name, method, client, url, data, multipart) of a successful call
+        to every budgeted route. Deletes come last, on objects nothing else uses.
+        """
+        admin = jwt_client(self.admin)
+        user = jwt_client(self.users[5])
+        anonymous = jwt_client()
+        team = self.team.pk
+        future = timezone.now().date() + datetime.timedelta(days=10)
+        meal = {'food': self.food.pk, 'meal': 'LUNCH', 'desire': [desire.pk for desire in self.desires]}
+        education = {'name': 'education', 'description': 'd', 'major': 'm', 'grade': 'MA', 'gpa': 18,
+                     'start': '2010-01-01', 'stop': '2014-01-01', 'is_student': False}
+        experience = {'name': 'experience', 'description': 'd', 'company': 'c', 'start': '2014-01-01',
+                      'stop': '2018-01-01'}
+        team_data = {'name': 'team', 'description': 'd', 'create_date': timezone.now().isoformat()}
+        new_team = dict(team_data, ceo=self.users[6].profile_user.pk, managers=[self.users[7].profile_user.pk])
+
+        def url(name, *args):
+            return reverse(name, args=args)
+
+        return [
+            ('foods:payment-food-list', 'get', admin, url('foods:payment-food-list'), None, False),
+            ('foods:payment-food-detail', 'get', admin, url('foods:payment-food-detail', self.payment.pk), None,
+             False),
+            ('foods:payment-food-me', 'get', admin, url('foods:payment-food-me'), None, False),
+            ('foods:food-and-desire-list', 'get', admin, url('foods:food-and-desire-list'), None, False),
+            ('foods:food-and-desire-detail', 'get', admin, url('foods:food-and-desire-detail', self.food.pk), None,
+             False),
+            ('foods:weekly-meal-list', 'get', admin, url('foods:weekly-meal-list'), None, False),
+            ('foods:weekly-meal-today', 'get', admin, url('foods:weekly-meal-today'), None, False),
+            ('foods:weekly-meal-report', 'get', admin, url('foods:weekly-meal-report'), None, False),
+            ('foods:weekly-meal-detail', 'get', admin, url('foods:weekly-meal-detail', self.meals[0].pk), None,
+             False),
+            ('foods:weekly-meal-user-list', 'get', admin, url('foods:weekly-meal-user-list'), None, False),
+            ('foods:weekly-meal-user-detail', 'get', admin, url('foods:weekly-meal-user-detail', self.reservation.pk),
+             None, False),
+            ('foods:weekly-meal-list', 'post', admin, url('foods:weekly-meal-list'), dict(meal, date=str(future)),
+             False),
+            ('foods:weekly-meal-bulk-create', 'post', admin, url('foods:weekly-meal-bulk-create'),
+             [dict(meal, meal='DINNER', date=str(future + datetime.timedelta(days=i))) for i in range(7)], False),
+            ('foods:weekly-meal-user-list', 'post', user, url('foods:weekly-meal-user-list'),
+             {'weekly_meal_food': self.meals[0].pk, 'count': 1}, False),
+            ('foods:weekly-meal-user-bulk-create', 'post', user, url('foods:weekly-meal-user-bulk-create'),
+             [{'weekly_meal_food': meal.pk, 'count': 1} for meal in self.meals[1:]], False),
+
+            ('users:credit-list', 'get', admin, url('users:credit-list'), None, False),
+            ('users:credit-detail', 'get', admin, url('users:credit-detail', self.transaction.pk), None, False),
+            ('users:credit-information', 'get', admin, url('users:credit-information'), None, False),
+            ('users:credit-list', 'post', admin, url('users:credit-list'), {'transaction_type': 'CBC', 'price': 10},
+             False),
+            ('users:credit-detail', 'put', admin, url('users:credit-detail', self.waiting_transactions[0].pk),
+             {'status': 'AC'}, False),
+            ('users:credit-detail', 'patch', admin, url('users:credit-detail', self.waiting_transactions[1].pk),
+             {'status': 'AC'}, False),
+            ('users:skill-list', 'post', admin, url('users:skill-list'), {'name': 'skill', 'description': 'd'},
+             False),
+            ('users:skill-detail', 'put', admin, url('users:skill-detail', self.skill.pk),
+             {'name': 'skill', 'description': 'd'}, False),
+            ('users:skill-detail', 'patch', admin, url('users:skill-detail', self.skill.pk), {'name': 'skill'}, False),
+            ('users:education-list', 'post', admin, url('users:education-list'), dict(education, image=image()),
+             True),
+            ('users:education-detail', 'put', admin, url('users:education-detail', self.education.pk),
+             dict(education, image=image()), True),
+            ('users:education-detail', 'patch', admin, url('users:education-detail', self.education.pk),
+             {'major': 'major'}, False),
+            ('users:experience-list', 'post', admin, url('users:experience-list'), dict(experience, image=image()),
+             True),
+            ('users:experience-detail', 'put', admin, url('users:experience-detail', self.experience.pk),
+             dict(experience, image=image()), True),
+            ('users:experience-detail', 'patch', admin, url('users:experience-detail', self.experience.pk),
+             {'company': 'company'}, False),
+            ('users:teams-user-list', 'post', jwt_client(self.other_admin), url('users:teams-user-list'),
+             {'team': team, 'profile': self.other_admin.profile_user.pk, 'membership_type': 'PE'}, False),
+            ('users:teams-user-detail', 'put', admin, url('users:teams-user-detail', self.team_user.pk),
+             {'team': team, 'profile': self.admin.profile_user.pk, 'membership_type': 'FR'}, False),
+            ('users:teams-user-detail', 'patch', admin, url('users:teams-user-detail', self.team_user.pk),
+             {'membership_type': 'LE'}, False),
+            ('users:profile-list', 'get', admin, url('users:profile-list'), None, False),
+            ('users:profile-detail', 'get', admin, url('users:profile-detail', self.users[2].profile_user.pk), None,
+             False),
+            ('users:profile-detail', 'put', admin, url('users:profile-detail', self.users[2].profile_user.pk),
+             self.profile_data(), True),
+            ('users:profile-detail', 'patch', admin, url('users:profile-detail', self.users[2].profile_user.pk),
+             self.profile_data(), True),
+            ('users:profile-me', 'get', user, url('users:profile-me'), None, False),
+            ('users:profile-me', 'put', user, url('users:profile-me'), self.profile_data(), True),
+            ('users:profile-me', 'patch', user, url('users:profile-me'), self.profile_data(), True),
+            ('users:confirm-profile', 'get', admin, url('users:confirm-profile'), None, False),
+            ('users:confirm-profile', 'post', admin, url('users:confirm-profile'),
+             {'profile_ids': [user.profile_user.pk for user in self.users[:4]], 'condition': 'C',
+              'reason': 'confirmed'}, False),
+
+            ('teams:teams-list', 'get', admin, url('teams:teams-list'), None, False),
+            ('teams:teams-detail', 'get', admin, url('teams:teams-detail', team), None, False),
+            ('teams:member-request-list', 'get', admin, url('teams:member-request-list'), None, False),
+            ('teams:member-request-detail', 'get', admin,
+             url('teams:member-request-detail', self.membership_requests[0].pk), None, False),
+            ('teams:activities-list', 'get', admin, url('teams:activities-list', team), None, False),
+            ('teams:activities-detail', 'get', admin, url('teams:activities-detail', team, self.activities[0].pk),
+             None, False),
+            ('teams:filter-list', 'get', admin, url('teams:filter-list', team), None, False),
+            ('teams:filter-detail', 'get', admin, url('teams:filter-detail', team, self.team_filter.pk), None,
+             False),
+            ('teams:teams-list', 'post', admin, url('teams:teams-list'), dict(new_team, image=image()), True),
+            ('teams:teams-detail', 'put', admin, url('teams:teams-detail', team),
+             dict(team_data, ceo=self.users[7].profile_user.pk, image=image()), True),
+            ('teams:teams-detail', 'patch', admin, url('teams:teams-detail', team), {'description': 'description'},
+             False),
+            ('teams:teams-confirm', 'patch', admin, url('teams:teams-confirm', team), {'is_confirmed': 'C'}, False),
+            ('teams:member-request-list', 'post', anonymous, url('teams:member-request-list'),
+             self.membership_request_data(), True),
+            ('teams:member-request-detail', 'put', admin,
+             url('teams:member-request-detail', self.membership_requests[0].pk), self.membership_request_data(),
+             True),
+            ('teams:member-request-detail', 'patch', admin,
+             url('teams:member-request-detail', self.membership_requests[0].pk), {'description': 'description'},
+             False),
+            ('teams:member-request-confirm', 'patch', admin,
+             url('teams:member-request-confirm', self.membership_requests[1].pk), {'is_confirmed': 'C'}, False),
+            ('teams:activities-list', 'post', admin, url('teams:activities-list', team),
+             {'name': 'activity', 'description': 'd', 'image': image()}, True),
+            ('teams:activities-detail', 'put', admin, url('teams:activities-detail', team, self.activities[0].pk),
+             {'name': 'activity', 'description': 'd', 'team': team, 'image': image()}, True),
+            ('teams:activities-detail', 'patch', admin, url('teams:activities-detail', team, self.activities[0].pk),
+             {'name': 'activity'}, False),
+            ('teams:filter-list', 'post', admin, url('teams:filter-list', self.team_without_filter.pk),
+             {'city': 'city', 'gender': 'M'}, False),
+            ('teams:filter-detail', 'put', admin, url('teams:filter-detail', team, self.team_filter.pk),
+             {'team': team, 'city': 'city', 'activity': [self.activities[1].pk]}, False),
+            ('teams:filter-detail', 'patch', admin, url('teams:filter-detail', team, self.team_filter.pk),
+             {'gender': 'F'}, False),
+
+            ('users:credit-detail', 'delete', admin, url('users:credit-detail', self.waiting_transactions[2].pk),
+             None, False),
+            ('users:skill-detail', 'delete', admin, url('users:skill-detail', self.skill_to_delete.pk), None, False),
+            ('users:education-detail', 'delete', admin, url('users:education-detail', self.education_to_delete.pk),
+             None, False),
+            ('users:experience-detail', 'delete', admin,
+             url('users:experience-detail', self.experience_to_delete.pk), None, False),
+            ('users:teams-user-detail', 'delete', admin,
+             url('users:teams-user-detail', self.users[2].profile_user.team_user_profile.pk), None, False),
+            ('teams:activities-detail', 'delete', admin, url('teams:activities-detail', team, self.activities[3].pk),
+             None, False),
+            ('teams:filter-detail', 'delete', admin, url('teams:filter-detail', team, self.team_filter.pk), None,
+             False),
+            ('teams:member-request-detail', 'delete', admin,
+             url('teams:member-request-detail', self.membership_requests[3].pk), None, False),
+            ('teams:teams-detail', 'delete', admin, url('teams:teams-detail', self.team_to_delete.pk), None, False),
+        ]
+
+    def test_budgeted_routes_within_budget(self):
+        self.assertTrue(settings.QUERY_BUDGET_STRICT)
+        for view_name, method, client, url, data, multipart in self.cases():
+            with self.subTest(view=view_name, method=method), transaction.atomic():
+                response = self.request(client, method, url, data, multipart)
+                self.assertLess(response.status_code, 400, response.content[:500])
+                self.assertEqual(response.wsgi_request.resolver_match.view_name, view_name)
+                self.assertIn('Server-Timing', response)
+
+    def test_every_budget_has_a_case(self):
+        called = {(view_name, method.upper()) for view_name, method, *_ in self.cases()}
+        for view_name, budget in load_query_budgets().items():
+            if not isinstance(budget, dict):
+                # one budget for every method
+                self.assertIn(view_name, {name for name, method in called})
+                continue
+            for method in budget:
+                self.assertIn((view_name, method), called)
+
+
+class ProviderStub(BaseHTTPRequestHandler):
+    """
+    Answers the REST calls from the queued (status, delay) replies of the
+    server, 200 once they run out, and records the name and client port of
+    every request.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        name = self.path.rsplit('/', 1)[-1]
+        self.server.calls.append((name, self.client_address[1]))
+        replies = self.server.replies.get(name)
+        status, delay = replies.pop(0) if replies else (200, 0)
+        time.sleep(delay)
+        body = json.dumps({'Value': '1', 'RetStatus': 1, 'StrRetStatus': 'Ok'}).encode('utf-8')
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except ConnectionError:
+            # the client gave up waiting, see test_timeout
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RestClientTests(SimpleTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), ProviderStub)
+        self.server.calls, self.server.replies = [], {}
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        class StubRest(Rest):
+            PATH = 'http://127.0.0.1:%d/api/SendSMS/%%s' % self.server.server_port
+
+        self.rest = StubRest('username', 'password', timeout=(1, 0.5), backoff=0)
+        self.addCleanup(self.rest.close)
+
+    def test_calls_reuse_the_connection(self):
+        for _ in range(5):
+            self.rest.get_credit()
+            self.rest.send('09120000000', '5000', 'text')
+
+        self.assertEqual(len(self.server.calls), 10)
+        # reads and sends have their own adapter, each keeps one connection open
+        self.assertEqual(len({port for name, port in self.server.calls if name == 'GetCredit'}), 1)
+        self.assertEqual(len({port for name, port in self.server.calls if name == 'SendSMS'}), 1)
+        self.assertEqual(self.rest.metrics['SendSMS']['calls'], 5)
+
+    def test_reads_are_retried(self):
+        self.server.replies['GetCredit'] = [(503, 0), (503, 0)]
+
+        self.assertEqual(self.rest.get_credit()['Value'], '1')
+        self.assertEqual([name for name, port in self.server.calls], ['GetCredit'] * 3)
+
+    def test_sends_are_not_retried(self):
+        self.server.replies['SendSMS'] = [(503, 0)]
+
+        self.rest.send('09120000000', '5000', 'text')
+        self.assertEqual([name for name, port in self.server.calls], ['SendSMS'])
+
+    def test_timeout(self):
+        self.server.replies['SendSMS'] = [(200, 1)]
+
+        with self.assertRaises(requests.RequestException):
+            self.rest.send('09120000000', '5000', 'text')
+        # a send that timed out may have reached the provider, it is not repeated
+        self.assertEqual([name for name, port in self.server.calls], ['SendSMS'])
+        self.assertEqual(self.rest.metrics['SendSMS']['errors'], 1)
+
+
+class RestAsyncSessionTests(SimpleTestCase):
+    def test_a_new_loop_closes_the_old_session(self):
+        rest = RestAsync('username', 'password')
+        first = asyncio.run(rest.get_session())
+        second = asyncio.run(rest.get_session())
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        asyncio.run(rest.close())
+        self.assertTrue(second.closed)
+
+    def test_the_session_of_a_running_loop_is_closed_in_it(self):
+        rest = RestAsync('username', 'password')
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        self.addCleanup(loop.close)
+        self.addCleanup(thread.join)
+        self.addCleanup(loop.call_soon_threadsafe, loop.stop)
+        first = asyncio.run_coroutine_threadsafe(rest.get_session(), loop).result(5)
+
+        asyncio.run(rest.get_session())
+
+        self.assertTrue(first.closed)
+        asyncio.run(rest.close())
+
+
+class AsyncSoapClientTests(SimpleTestCase):
+    def test_the_wsdl_is_loaded_outside_the_loop(self):
+        threads = []
+
+        def get_client(url):
+            threads.append(threading.current_thread())
+            return mock.Mock()
+
+        soap = SoapAsync('username', 'password')
+
+        async def main():
+            async with soap:
+                first = await soap.get_service(soap.sendUrl)
+                self.assertIs(await soap.get_service(soap.sendUrl), first)
+
+        with mock.patch('main.melipayamak.clients.get_client', get_client), \
+                mock.patch('main.melipayamak.clients.AsyncClient'):
+            asyncio.run(main())
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+
+class PageCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            User.objects.create_user(f'user{i}', password='x')
+
+    def setUp(self):
+        cache.clear()
+
+    def count(self, queryset, pagination=None):
+        pagination = pagination or CountedPageNumberPagination()
+        pagination.paginate_queryset(queryset, Request(APIRequestFactory().get('/')))
+        return pagination.page.paginator.count, pagination.count_exact
+
+    def test_cached_count_is_not_exact(self):
+        self.assertEqual(self.count(User.objects.order_by('pk')), (5, True))
+        User.objects.create_user('user5', password='x')
+
+        # the page query only, the count comes from the cache
+        with self.assertNumQueries(1):
+            self.assertEqual(self.count(User.objects.order_by('username')), (5, False))
+        self.assertEqual(self.count(User.objects.filter(username__startswith='user').order_by('pk')), (6, True))
+
+    def test_large_unfiltered_list_is_estimated(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE %s' % User._meta.db_table)
+        pagination = CountedPageNumberPagination()
+        pagination.count_estimate_threshold = 5
+
+        # reltuples and the page, no COUNT(*)
+        with self.assertNumQueries(2):
+            self.assertEqual(self.count(User.objects.order_by('pk'), pagination), (5, False))
+        self.assertEqual(self.count(User.objects.filter(is_active=True).order_by('pk'), pagination), (5, True))
+
+        pagination.count_estimate_threshold = 6
+        cache.clear()
+        self.assertEqual(self.count(User.objects.order_by('pk'), pagination), (5, True))
+
+
+class CursorPaginationTests(TestCase):
+    """
+    Keyset pages of the credit list, ordered by (-date, -id).
+    """
+    url = '/api/v1/increase-credit-card-number/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        today = timezone.now().date()
+        # five transactions on each day, the id breaks the ties
+        for day in range(5):
+            transactions = [TransactionHistory.objects.create(user_receiver=cls.admin, price=10, status='AC',
+                                                              transaction_type='CBC') for _ in range(5)]
+            TransactionHistory.objects.filter(pk__in=[item.pk for item in transactions]).update(
+                date=today - datetime.timedelta(days=day))
+        cls.expected = [str(pk) for pk in TransactionHistory.objects.order_by('-date', '-id').values_list(
+            'pk', flat=True)]
+
+    def setUp(self):
+        self.client = jwt_client(self.admin)
+
+    def walk(self, url, direction):
+        # the ids of every page up to the end in direction, and the last response
+        pages = []
+        while True:
+            data = self.client.get(url).json()
+            pages.append([item['id'] for item in data['results']])
+            if data[direction] is None:
+                return pages, data
+            url = data[direction]
+
+    def test_forward_and_backward(self):
+        pages, last = self.walk(self.url + '?cursor=', 'next')
+        self.assertEqual([len(page) for page in pages], [11, 11, 3])
+        self.assertEqual(sum(pages, []), self.expected)
+
+        backward, first = self.walk(last['previous'], 'previous')
+        self.assertEqual(backward, pages[-2::-1])
+        self.assertEqual(first['next'], self.client.get(self.url + '?cursor=').json()['next'])
+
+    def test_cursor_page_has_no_count(self):
+        data = self.client.get(self.url + '?cursor=').json()
+        self.assertEqual(list(data), ['next', 'previous', 'results'])
+        self.assertIsNone(data['previous'])
+
+    def test_bad_cursor(self):
+        wrong_length = base64.urlsafe_b64encode(b'{"p":["2020-01-01"]}').decode('ascii')
+        bad_date = base64.urlsafe_b64encode(b'{"p":["not a date","x"]}').decode('ascii')
+        for cursor in ['not base64!', wrong_length, bad_date]:
+            with self.subTest(cursor=cursor):
+                self.assertEqual(self.client.get(self.url, {'cursor': cursor}).status_code, 404)
@@ -0,0 +1,65 @@
+# Generated by Django 4.1.5 on 2026-10-18 14:00
+
+import django.contrib.postgres.fields
+import django.core.validators
+from django.db import migrations, models
+import utils.utils
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Activity',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=256, verbose_name='نام فعالیت')),
+                ('description', models.TextField(verbose_name='توضیحات فعالیت')),
+                ('image', models.ImageField(upload_to=utils.utils.upload_image_path, verbose_name='تصویر فعالیت')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='MemberRecruitmentFilter',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('age', django.contrib.postgres.fields.ArrayField(base_field=models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(50)]), blank=True, null=True, size=2, verbose_name='سن')),
+                ('experience', django.contrib.postgres.fields.ArrayField(base_field=models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(50)]), blank=True, null=True, size=2, verbose_name='سابقه')),
+                ('gender', models.CharField(blank=True, choices=[('M', 'مرد'), ('F', 'زن')], max_length=1, null=True, verbose_name='جنسیت')),
+                ('city', models.CharField(blank=True, max_length=256, null=True, verbose_name='شهر')),
+                ('membership_type', models.CharField(blank=True, choices=[('PE', 'دائمی'), ('FR', 'فریلنسر'), ('LE', 'کارآموز')], max_length=2, null=True, verbose_name='نوع عضویت')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='MembershipRequest',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('full_name', models.CharField(max_length=256, verbose_name='نام و نام خانوادگی')),
+                ('phone_number', models.CharField(max_length=13, validators=[django.core.validators.RegexValidator(code='invalid_phone_number', message='شماره تلفن صحیح نیست', regex='^(0)9(0[1-5]|[1 3]\\d|2[0-2]|98)\\d{7}$')], verbose_name='شماره تلفن')),
+                ('experience', models.PositiveSmallIntegerField(verbose_name='سابقه کاری')),
+                ('age', models.PositiveSmallIntegerField(verbose_name='سن')),
+                ('gender', models.CharField(choices=[('M', 'مرد'), ('F', 'زن')], max_length=1, verbose_name='جنسیت')),
+                ('city', models.CharField(max_length=256, verbose_name='شهر')),
+                ('membership_type', models.CharField(choices=[('PE', 'دائمی'), ('FR', 'فریلنسر'), ('LE', 'کارآموز')], max_length=2, verbose_name='نوع عضویت')),
+                ('cv', models.FileField(upload_to=utils.utils.upload_image_path, verbose_name='رزومه')),
+                ('is_confirmed', models.CharField(blank=True, choices=[('C', 'تایید شده'), ('P', 'در انتظار تایید'), ('R', 'رد شده')], default='P', max_length=1, null=True, verbose_name='تایید/عدم تایید')),
+                ('description', models.TextField(verbose_name='توضیحات')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Team',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=256, verbose_name='نام تیم')),
+                ('description', models.TextField(verbose_name='توضیحات')),
+                ('create_date', models.DateTimeField(verbose_name='تاریخ ایجاد')),
+                ('image', models.ImageField(upload_to=utils.utils.upload_image_path, verbose_name='تصویر تیم')),
+                ('is_confirmed', models.CharField(choices=[('C', 'تایید شده'), ('P', 'در انتظار تایید'), ('R', 'رد شده')], default='P', max_length=1, verbose_name='تایید/عدم تایید ')),
+            ],
+        ),
+    ]
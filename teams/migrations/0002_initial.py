@@ -0,0 +1,65 @@
+# Generated by Django 4.1.5 on 2026-10-18 14:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('teams', '0001_initial'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='ceo',
+            field=models.ForeignKey(limit_choices_to={'team_ceo': None}, on_delete=django.db.models.deletion.CASCADE, related_name='team_ceo', to='users.profile', verbose_name='مدیر عامل'),
+        ),
+        migrations.AddField(
+            model_name='team',
+            name='managers',
+            field=models.ManyToManyField(blank=True, limit_choices_to={'team_manager': None}, related_name='team_manager', to='users.profile', verbose_name='مدیران تیم'),
+        ),
+        migrations.AddField(
+            model_name='membershiprequest',
+            name='activity',
+            field=models.ManyToManyField(blank=True, related_name='membership_request_activity', to='teams.activity', verbose_name='بخش های فعالیت'),
+        ),
+        migrations.AddField(
+            model_name='membershiprequest',
+            name='team',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='membership_request_team', to='teams.team', verbose_name='تیم مربوطه'),
+        ),
+        migrations.AddField(
+            model_name='memberrecruitmentfilter',
+            name='activity',
+            field=models.ManyToManyField(blank=True, null=True, related_name='member_recruitment_filter_activity', to='teams.activity', verbose_name='فعالیت مربوطه'),
+        ),
+        migrations.AddField(
+            model_name='memberrecruitmentfilter',
+            name='team',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='member_recruitment_filter_team', to='teams.team', verbose_name='تیم مربوطه'),
+        ),
+        migrations.AddField(
+            model_name='activity',
+            name='child',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='activity_parent', to='teams.activity', verbose_name='ریشه فعالیت'),
+        ),
+        migrations.AddField(
+            model_name='activity',
+            name='team',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='activity_team', to='teams.team', verbose_name='تیم مربوطه'),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(condition=models.Q(('is_confirmed', 'P')), fields=['is_confirmed'], name='teams_team_pending'),
+        ),
+        migrations.AddIndex(
+            model_name='membershiprequest',
+            index=models.Index(fields=['team', 'is_confirmed'], name='teams_membership_team'),
+        ),
+    ]
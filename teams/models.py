@@ -45,6 +45,9 @@ class Team(ID):
 
     class Meta:
         app_label = 'teams'
+        indexes = [
+            models.Index(fields=['is_confirmed'], name='teams_team_pending', condition=models.Q(is_confirmed='P')),
+        ]
 
 
 class Activity(ID):
@@ -128,7 +131,7 @@ class MembershipRequest(ID):
     city = models.CharField(max_length=256, verbose_name='شهر')
     membership_type = models.CharField(max_length=2, choices=MembershipChoices.choices, verbose_name='نوع عضویت')
     team = models.ForeignKey("teams.Team", on_delete=models.CASCADE, related_name='membership_request_team',
-                             verbose_name='تیم مربوطه')
+                             verbose_name='تیم مربوطه', db_index=False)
     cv = models.FileField(upload_to=upload_image_path, verbose_name='رزومه')
     is_confirmed = models.CharField(max_length=1, choices=Condition.choices, default=Condition.pending,
                                     verbose_name="تایید/عدم تایید", null=True, blank=True)
@@ -141,3 +144,7 @@ class MembershipRequest(ID):
 
     class Meta:
         app_label = 'teams'
+        # leads with team, it replaces the index of the foreign key
+        indexes = [
+            models.Index(fields=['team', 'is_confirmed'], name='teams_membership_team'),
+        ]
@@ -6,16 +6,11 @@ from django.contrib.auth import get_user_model
 from django.utils.functional import cached_property
 from rest_framework import serializers
 
-from main.melipayamak import Api
 from teams.exception import MaxParentDepthExceeded
 from teams.models import Team, Activity, MemberRecruitmentFilter, MembershipRequest
 from users.models import TeamUser
+from users.sms import enqueue_sms
 
-username = settings.SMS_USERNAME
-password = settings.SMS_PASSWORD
-from_ = settings.SMS_FROM
-api = Api(username, password)
-sms = api.sms()
 User = get_user_model()
 
 
@@ -208,11 +203,10 @@ class MembershipRequestSerializer(serializers.ModelSerializer):
             user = User.objects.create_user(username=username, password=password)
             TeamUser.objects.create(profile=user.profile_user, team=instance.team,
                                     membership_type=instance.membership_type)
-            result = sms.send(instance.phone_number, from_,
-                              "Your username is " + username + " and password is " + password)
+            enqueue_sms([instance.phone_number], "Your username is " + username + " and password is " + password,
+                        secret=True)
         elif is_confirmed == 'R':
-            result = sms.send(instance.phone_number, from_,
-                              "Your request has been rejected")
+            enqueue_sms([instance.phone_number], "Your request has been rejected")
         return super().update(instance, validated_data)
 
     class Meta:
@@ -1,3 +1,53 @@
 from django.test import TestCase
+from django.utils import timezone
 
-# Create your tests here.
+from main.testing import jwt_client, plan
+from teams.models import Team, MembershipRequest, Activity
+from users.models import User
+
+
+class IndexPlanTests(TestCase):
+    """
+    The hot list filters are answered from their indexes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        ceo = User.objects.create_user('ceo', password='x').profile_user
+        cls.team = Team.objects.create(name='team', description='d', ceo=ceo, create_date=timezone.now(),
+                                       image='team.gif')
+
+    def test_team_confirmation_queue(self):
+        self.assertIn('teams_team_pending', plan(Team.objects.filter(is_confirmed='P')))
+
+    def test_requests_of_a_team(self):
+        queryset = MembershipRequest.objects.filter(team=self.team, is_confirmed='P')
+        self.assertIn('teams_membership_team', plan(queryset))
+
+
+class MembershipRequestListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        team = Team.objects.create(name='team', description='d', ceo=cls.admin.profile_user,
+                                   create_date=timezone.now(), image='team.gif')
+        activity = Activity.objects.create(name='activity', description='d', team=team)
+        for _ in range(15):
+            MembershipRequest.objects.create(
+                full_name='name', phone_number='09121234567', experience=1, age=20, gender='M', city='city',
+                membership_type='PE', team=team, cv='cv.pdf', description='d').activity.add(activity)
+        cls.ids = sorted(str(pk) for pk in MembershipRequest.objects.values_list('pk', flat=True))
+
+    def test_whole_list_without_cursor(self):
+        client = jwt_client(self.admin)
+        # the user, the requests and their activities, whatever the number of requests
+        with self.assertNumQueries(3):
+            response = client.get('/api/v1/member-request/')
+        self.assertEqual(sorted(item['id'] for item in response.json()), self.ids)
+
+    def test_keyset_pages_with_cursor(self):
+        client = jwt_client(self.admin)
+        first = client.get('/api/v1/member-request/?cursor=').json()
+        second = client.get(first['next']).json()
+        self.assertIsNone(second['next'])
+        self.assertEqual([item['id'] for item in first['results'] + second['results']], self.ids)
@@ -7,6 +7,7 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from main.pagination import CursorPageNumberPagination, OptionalCursorPagination
 from main.permissions import IsSuperUser, IsCeoOrManager, SafeMethodOnly
 from teams.models import Team, MemberRecruitmentFilter, Activity, MembershipRequest
 from teams.serializers import TeamSerializer, MemberRecruitmentFilterSerializer, ActivitySerializer, \
@@ -38,7 +39,7 @@ class TeamViewSet(viewsets.ModelViewSet):
     queryset = Team.objects.all()
     serializer_class = TeamSerializer
     permission_classes = [IsAuthenticated] + [SafeMethodOnly | (IsSuperUser | IsCeoOrManager)]
-    pagination_class = PageNumberPagination
+    pagination_class = CursorPageNumberPagination
     filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_fields = ['is_confirmed']
     search_fields = ['name']
@@ -95,9 +96,12 @@ class MemberRecruitmentFilterViewSet(viewsets.ModelViewSet):
 class MembershipRequestViewSet(viewsets.ModelViewSet):
     queryset = MembershipRequest.objects.all()
     serializer_class = MembershipRequestSerializer
+    # the list has always been returned whole, keyset pages are opt in with ?cursor=
+    pagination_class = OptionalCursorPagination
 
     def get_queryset(self):
-        print(self.queryset)
+        if self.action == 'list':
+            return self.queryset.prefetch_related('activity')
         return self.queryset
 
     def get_permissions(self):
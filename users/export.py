@@ -0,0 +1,159 @@
+import hashlib
+import json
+import tempfile
+from itertools import islice
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from users.models import ExportJob, Profile
+from users.serializers import ProfileSerializer
+from utils.utils import EXCEL_SPOOL_MAX_SIZE, profile_excel_row, write_excel
+
+EXPORT_CHUNK_SIZE = 500
+EXPORT_REUSE_TTL = settings.EXPORT_REUSE_TTL
+EXPORT_CLAIM_TIMEOUT = settings.EXPORT_CLAIM_TIMEOUT
+EXPORT_MAX_ATTEMPTS = 3
+EXPORT_KEEP_TTL = settings.EXPORT_KEEP_TTL
+EXPORT_PURGE_INTERVAL = 60 * 60
+
+PROFILE_EXPORT_FIELDS = [
+    'id', 'first_name', 'last_name', 'marital_status', 'gender', 'address', 'city', 'state',
+    'phone_verified', 'phone_number', 'child', 'date_of_birth', 'country', 'is_confirmed', 'image', 'role',
+    'iranian_profile', 'foreigner_profile', 'user', 'education_profile', 'experience_profile'
+]
+
+
+def profile_export_params(query_params):
+    # without query params everything is exported, otherwise only the sections set to "True"
+    if not query_params:
+        return {'education': True, 'experience': True}
+    return {
+        'education': query_params.get('education', None) == "True",
+        'experience': query_params.get('experience', None) == "True",
+    }
+
+
+def profile_export_fields(params):
+    fields = list(PROFILE_EXPORT_FIELDS)
+    if not params.get('education', False):
+        fields.remove('education_profile')
+    if not params.get('experience', False):
+        fields.remove('experience_profile')
+    return fields
+
+
+def profile_export_rows(queryset, fields, context, on_chunk=None):
+    # serialize chunk by chunk so only EXPORT_CHUNK_SIZE profiles are in memory at once
+    queryset = ProfileSerializer.setup_eager_loading(queryset, fields)
+    profiles = queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    processed = 0
+    while True:
+        chunk = list(islice(profiles, EXPORT_CHUNK_SIZE))
+        if not chunk:
+            break
+        serializer = ProfileSerializer(chunk, many=True, fields=fields, ex=True, context=context)
+        for item in serializer.data:
+            yield profile_excel_row(item)
+        processed += len(chunk)
+        if on_chunk is not None:
+            on_chunk(processed)
+
+
+def params_hash(params):
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def enqueue_profile_export(params, user=None):
+    """
+    Returns a job for the given params: a pending one, a running one whose
+    worker is alive, or one that finished within EXPORT_REUSE_TTL, before
+    creating a new one.
+    """
+    key = params_hash(params)
+    now = timezone.now()
+    reusable = ExportJob.objects.filter(params_hash=key).exclude(status=ExportJob.StatusChoices.FAILED)
+    reusable = reusable.exclude(status=ExportJob.StatusChoices.DONE,
+                                finished__lt=now - timezone.timedelta(seconds=EXPORT_REUSE_TTL))
+    reusable = reusable.exclude(expired_lease(now))
+    job = reusable.order_by('-created').first()
+    if job:
+        return job
+    return ExportJob.objects.create(params=params, params_hash=key, user=user)
+
+
+def lease():
+    return timezone.now() + timezone.timedelta(seconds=EXPORT_CLAIM_TIMEOUT)
+
+
+def expired_lease(now):
+    # jobs claimed before leases existed have none
+    return Q(status=ExportJob.StatusChoices.RUNNING) & (Q(lease_until__lt=now) | Q(lease_until__isnull=True))
+
+
+def claim_export_job():
+    # SKIP LOCKED lets several workers poll the same table without taking the same job, a running job whose
+    # lease expired lost its worker and is taken again, up to EXPORT_MAX_ATTEMPTS times
+    now = timezone.now()
+    expired = expired_lease(now)
+    with transaction.atomic():
+        ExportJob.objects.filter(expired, attempts__gte=EXPORT_MAX_ATTEMPTS).update(
+            status=ExportJob.StatusChoices.FAILED, error='worker stopped', finished=now)
+        job = ExportJob.objects.select_for_update(skip_locked=True).filter(
+            Q(status=ExportJob.StatusChoices.PENDING) | expired).order_by('created').first()
+        if job is None:
+            return None
+        job.status = ExportJob.StatusChoices.RUNNING
+        job.attempts += 1
+        job.lease_until = lease()
+        job.save(update_fields=['status', 'attempts', 'lease_until'])
+    return job
+
+
+def purge_export_jobs():
+    """
+    Deletes the jobs that finished more than EXPORT_KEEP_TTL ago, with their files.
+    Returns:
+        _int_: Number of deleted jobs
+    """
+    jobs = ExportJob.objects.filter(status__in=[ExportJob.StatusChoices.DONE, ExportJob.StatusChoices.FAILED],
+                                    finished__lt=timezone.now() - timezone.timedelta(seconds=EXPORT_KEEP_TTL))
+    jobs = list(jobs)
+    for job in jobs:
+        if job.file:
+            job.file.delete(save=False)
+    ExportJob.objects.filter(pk__in=[job.pk for job in jobs]).delete()
+    return len(jobs)
+
+
+def run_export_job(job):
+    queryset = Profile.objects.all()
+    total = queryset.count()
+    ExportJob.objects.filter(pk=job.pk).update(total=total)
+
+    def on_chunk(processed):
+        ExportJob.objects.filter(pk=job.pk).update(processed=processed, lease_until=lease())
+
+    try:
+        with tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_MAX_SIZE) as file:
+            rows = profile_export_rows(queryset, profile_export_fields(job.params), {'request': None}, on_chunk)
+            write_excel(rows, file)
+            file.seek(0)
+            job.file.save(f'{job.pk}.xlsx', File(file), save=False)
+    except Exception as e:
+        job.status = ExportJob.StatusChoices.FAILED
+        job.error = str(e)
+        job.finished = timezone.now()
+        job.save(update_fields=['status', 'error', 'finished'])
+        raise
+
+    job.status = ExportJob.StatusChoices.DONE
+    job.total = total
+    job.processed = total
+    job.finished = timezone.now()
+    job.save(update_fields=['file', 'status', 'total', 'processed', 'finished'])
+    return job
+
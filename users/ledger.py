@@ -0,0 +1,156 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connections, router, transaction
+from django.db.models import F, Q, Sum
+
+from users.exception import CreditNotEnough
+from users.models import CreditSummary, TransactionHistory
+from utils.utils import jalali_month
+
+User = get_user_model()
+
+
+def credit_deltas(*entries):
+    """
+    _Credit Deltas_
+    Args:
+        entries (_tuple_): (user_id, amount) pairs, amount is negative for a debit
+    Returns:
+        _dict_: Net amount per user
+    """
+
+    deltas = defaultdict(Decimal)
+    for user_id, amount in entries:
+        if user_id is not None:
+            deltas[user_id] += Decimal(amount)
+    return deltas
+
+
+def apply_credit(deltas, check_balance=False, using=None):
+    """
+    _Apply Credit_
+    Applies net credit deltas in one transaction with
+    `UPDATE ... SET credit = credit + delta`, so concurrent changes never
+    overwrite each other. Rows are locked in id order. Users that get the same amount share one UPDATE,
+    a refund of a whole meal is a handful of statements instead of one per user.
+    The total debt in the credit summary follows the users whose credit goes below or comes back from zero.
+    Args:
+        deltas (_dict_): Amount per user id, see credit_deltas
+        check_balance (_bool_): Reject debits larger than the user's credit
+        using (_str_): Database alias
+    Raises:
+        CreditNotEnough: A debited user does not have enough credit, nothing is applied
+    """
+
+    groups = defaultdict(list)
+    for user_id, amount in deltas.items():
+        if amount:
+            groups[amount].append(user_id)
+    if not groups:
+        return
+
+    with transaction.atomic(using=using, savepoint=False):
+        # the grouped UPDATEs would lock the rows group by group, lock them in id order first so two
+        # transactions touching the same users can not deadlock, and read the credit the debt moves from
+        users = User.objects.using(using).select_for_update(no_key=True).filter(pk__in=list(deltas)).order_by('pk')
+        credits = dict(users.values_list('pk', 'credit'))
+        for amount, user_ids in sorted(groups.items()):
+            queryset = User.objects.using(using).filter(pk__in=sorted(user_ids))
+            if check_balance and amount < 0:
+                queryset = queryset.filter(credit__gte=-amount)
+            if queryset.update(credit=F('credit') + amount) != len(user_ids) and check_balance:
+                raise CreditNotEnough
+
+        debt = sum((min(credit + deltas[user_id], 0) - min(credit, 0) for user_id, credit in credits.items()),
+                   Decimal(0))
+        if debt:
+            apply_summary({(None, ''): (0, 0, 0, debt)}, using=using)
+
+
+def summary_deltas(*entries):
+    """
+    _Summary Deltas_
+    Args:
+        entries (_tuple_): (user_id, date, status, price) of transactions, price is negative to take one out
+    Returns:
+        _dict_: (accepted, rejected, total, debt) per (user_id, month) summary row
+    """
+
+    deltas = defaultdict(lambda: [0, 0, 0, Decimal(0)])
+    for user_id, date, status, price in entries:
+        month = jalali_month(date)
+        for key in {(user_id, month), (user_id, ''), (None, month), (None, '')}:
+            delta = deltas[key]
+            delta[0] += price if status == 'AC' else 0
+            delta[1] += price if status == 'RE' else 0
+            delta[2] += price
+    return deltas
+
+
+def apply_summary(deltas, create=True, using=None):
+    """
+    _Apply Summary_
+    Adds deltas to the credit summary rows, creating the missing ones. The rows
+    are locked with the all time total of every user first, the order every
+    writer uses, and rows that get the same deltas share one UPDATE.
+    Args:
+        deltas (_dict_): (accepted, rejected, total, debt) per (user_id, month), see summary_deltas
+        create (_bool_): Create the missing rows, off when the rows may be deleted with their user
+        using (_str_): Database alias
+    """
+
+    groups = defaultdict(list)
+    for key, delta in deltas.items():
+        if any(delta):
+            groups[tuple(delta)].append(key)
+    if not groups:
+        return
+
+    def rows(keys):
+        query = Q()
+        for user_id, month in keys:
+            query |= Q(user_id=user_id, month=month)
+        return CreditSummary.objects.using(using).filter(query)
+
+    with transaction.atomic(using=using, savepoint=False):
+        keys = [key for group in groups.values() for key in group]
+        locked = rows(keys).select_for_update(no_key=True).order_by(F('user').asc(nulls_first=True), 'month')
+        missing = set(keys) - set(locked.values_list('user_id', 'month'))
+        if missing and create:
+            CreditSummary.objects.using(using).bulk_create(
+                [CreditSummary(user_id=user_id, month=month) for user_id, month in sorted(missing, key=str)],
+                ignore_conflicts=True)
+        for (accepted, rejected, total, debt), group in groups.items():
+            rows(group).update(accepted=F('accepted') + accepted, rejected=F('rejected') + rejected,
+                               total=F('total') + total, debt=F('debt') + debt)
+
+
+def recompute_summary(using=None):
+    """
+    _Recompute Summary_
+    Rebuilds every credit summary row from the transactions and the credit of
+    the users. The summary only follows the writes that go through this module,
+    a credit or transaction changed from the admin, or a deleted user, makes it
+    drift until it is recomputed.
+    Returns:
+        _int_: Number of summary rows
+    """
+
+    using = using or router.db_for_write(CreditSummary)
+    with transaction.atomic(using=using):
+        # ledger writers wait for the rebuilt rows and apply their deltas to them, none is counted twice or lost
+        with connections[using].cursor() as cursor:
+            cursor.execute('LOCK TABLE %s IN EXCLUSIVE MODE' % CreditSummary._meta.db_table)
+        days = TransactionHistory.objects.using(using).values('user_receiver', 'date', 'status').annotate(
+            price=Sum('price')).order_by().values_list('user_receiver', 'date', 'status', 'price')
+        deltas = summary_deltas(*days.iterator())
+        debt = User.objects.using(using).filter(credit__lt=0).aggregate(debt=Sum('credit'))['debt'] or 0
+        deltas[(None, '')][3] += debt
+
+        CreditSummary.objects.using(using).all().delete()
+        CreditSummary.objects.using(using).bulk_create([
+            CreditSummary(user_id=user_id, month=month, accepted=accepted, rejected=rejected, total=total, debt=debt)
+            for (user_id, month), (accepted, rejected, total, debt) in sorted(deltas.items(), key=str)])
+    return len(deltas)
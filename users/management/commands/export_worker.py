@@ -0,0 +1,37 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from users.export import EXPORT_PURGE_INTERVAL, claim_export_job, purge_export_jobs, run_export_job
+
+
+class Command(BaseCommand):
+    help = 'Builds queued profile exports (ExportJob rows), polling the database for new jobs. Old finished ' \
+           'jobs and their files are deleted while the queue is empty.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit.')
+
+    def handle(self, *args, **options):
+        next_purge = 0
+        while True:
+            job = claim_export_job()
+            if job is None:
+                if time.monotonic() >= next_purge:
+                    purged = purge_export_jobs()
+                    if purged:
+                        self.stdout.write(f'purged {purged} old exports')
+                    next_purge = time.monotonic() + EXPORT_PURGE_INTERVAL
+                if options['once']:
+                    return
+                time.sleep(settings.EXPORT_POLL_INTERVAL)
+                continue
+
+            self.stdout.write(f'export {job.pk}: started')
+            try:
+                run_export_job(job)
+            except Exception as e:
+                self.stderr.write(f'export {job.pk}: failed ({e})')
+            else:
+                self.stdout.write(f'export {job.pk}: done')
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from users.ledger import recompute_summary
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the credit summary (CreditSummary rows) from the transactions and the credit of the users.'
+
+    def handle(self, *args, **options):
+        self.stdout.write(f'credit summary: {recompute_summary()} rows')
@@ -0,0 +1,26 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from users.sms import SmsSender, claim_sms_messages
+
+
+class Command(BaseCommand):
+    help = 'Sends queued SMS (SmsMessage rows), polling the database for new messages.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit.')
+
+    def handle(self, *args, **options):
+        sender = SmsSender()
+        while True:
+            messages = claim_sms_messages()
+            if not messages:
+                if options['once']:
+                    return
+                time.sleep(settings.SMS_POLL_INTERVAL)
+                continue
+
+            sent, failed = sender.send(messages)
+            self.stdout.write(f'sms: {sent} sent, {failed} failed')
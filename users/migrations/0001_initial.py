@@ -0,0 +1,191 @@
+# Generated by Django 4.1.5 on 2026-10-18 14:00
+
+from django.conf import settings
+import django.contrib.auth.models
+import django.contrib.auth.validators
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import users.models.user
+import utils.utils
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('teams', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('username', models.CharField(error_messages={'unique': 'A user with that username already exists.'}, help_text='Required. 150 characters or fewer. Letters, digits and @/./+/-/_ only.', max_length=150, unique=True, validators=[django.contrib.auth.validators.UnicodeUsernameValidator()], verbose_name='username')),
+                ('email', models.EmailField(blank=True, max_length=254, verbose_name='email address')),
+                ('is_staff', models.BooleanField(default=False, help_text='Designates whether the user can log into this admin site.', verbose_name='staff status')),
+                ('is_active', models.BooleanField(default=True, help_text='Designates whether this user should be treated as active. Unselect this instead of deleting accounts.', verbose_name='active')),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now, verbose_name='date joined')),
+                ('credit', models.DecimalField(decimal_places=2, default=0, max_digits=11, verbose_name='اعتبار')),
+                ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to. A user will get all permissions granted to each of their groups.', related_name='user_set', related_query_name='user', to='auth.group', verbose_name='groups')),
+                ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='user_set', related_query_name='user', to='auth.permission', verbose_name='user permissions')),
+            ],
+            options={
+                'base_manager_name': 'objects',
+                'default_manager_name': 'objects',
+            },
+            managers=[
+                ('iranian', users.models.user.IranianManager()),
+                ('foreigner', users.models.user.ForeignerManager()),
+                ('objects', django.contrib.auth.models.UserManager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Children',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('identification', models.ImageField(upload_to=utils.utils.upload_image_path, verbose_name='تصویر کارت ملی')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Foreigner',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('passport_image', models.ImageField(upload_to=utils.utils.upload_image_path, verbose_name='تصویر پاسپورت')),
+                ('exclusive_code', models.CharField(max_length=12, verbose_name='کد اختصاصی')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Iranian',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('national_code', models.CharField(max_length=10, verbose_name='کد ملی')),
+                ('national_card_image', models.ImageField(upload_to=utils.utils.upload_image_path, verbose_name='تصویر کارت ملی')),
+                ('birth_certificate_image', models.ImageField(upload_to=utils.utils.upload_image_path, verbose_name='تصویر شناسنامه')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Profile',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(blank=True, max_length=256, null=True, verbose_name='نقش کاربر')),
+                ('image', models.ImageField(blank=True, null=True, upload_to=utils.utils.upload_image_path, verbose_name='تصویر پروفایل')),
+                ('is_confirmed', models.CharField(blank=True, choices=[('C', 'تایید شده'), ('P', 'در انتظار تایید'), ('R', 'رد شده')], default='P', max_length=1, null=True, verbose_name='تایید/عدم تایید حساب کاربری')),
+                ('country', models.CharField(blank=True, choices=[('AF', 'Afghanistan'), ('AX', 'Aland Islands'), ('AL', 'Albania'), ('DZ', 'Algeria'), ('AS', 'American Samoa'), ('AD', 'Andorra'), ('AO', 'Angola'), ('AI', 'Anguilla'), ('AQ', 'Antarctica'), ('AG', 'Antigua & Barbuda'), ('AR', 'Argentina'), ('AM', 'Armenia'), ('AW', 'Aruba'), ('AU', 'Australia'), ('AT', 'Austria'), ('AZ', 'Azerbaijan'), ('BS', 'Bahamas'), ('BH', 'Bahrain'), ('BD', 'Bangladesh'), ('BB', 'Barbados'), ('BY', 'Belarus'), ('BE', 'Belgium'), ('BZ', 'Belize'), ('BJ', 'Benin'), ('BM', 'Bermuda'), ('BT', 'Bhutan'), ('BO', 'Bolivia'), ('BA', 'Bosnia & Herzegovina'), ('BW', 'Botswana'), ('BV', 'Bouvet Island'), ('BR', 'Brazil'), ('IO', 'British Indian Ocean Territory'), ('VG', 'British Virgin Islands'), ('BN', 'Brunei'), ('BG', 'Bulgaria'), ('BF', 'Burkina Faso'), ('BI', 'Burundi'), ('KH', 'Cambodia'), ('CM', 'Cameroon'), ('CA', 'Canada'), ('CV', 'Cape Verde'), ('BQ', 'Caribbean Netherlands'), ('KY', 'Cayman Islands'), ('CF', 'Central African Republic'), ('TD', 'Chad'), ('CL', 'Chile'), ('CN', 'China'), ('CX', 'Christmas Island'), ('CC', 'Cocos (Keeling) Islands'), ('CO', 'Colombia'), ('KM', 'Comoros'), ('CG', 'Congo - Brazzaville'), ('CD', 'Congo - Kinshasa'), ('CK', 'Cook Islands'), ('CR', 'Costa Rica'), ('CI', 'Côte d’Ivoire'), ('HR', 'Croatia'), ('CU', 'Cuba'), ('CW', 'Curaçao'), ('CY', 'Cyprus'), ('CZ', 'Czechia'), ('DK', 'Denmark'), ('DJ', 'Djibouti'), ('DM', 'Dominica'), ('DO', 'Dominican Republic'), ('EC', 'Ecuador'), ('EG', 'Egypt'), ('SV', 'El Salvador'), ('GQ', 'Equatorial Guinea'), ('ER', 'Eritrea'), ('EE', 'Estonia'), ('SZ', 'Eswatini'), ('ET', 'Ethiopia'), ('FK', 'Falkland Islands'), ('FO', 'Faroe Islands'), ('FJ', 'Fiji'), ('FI', 'Finland'), ('FR', 'France'), ('GF', 'French Guiana'), ('PF', 'French Polynesia'), ('TF', 'French Southern Territories'), ('GA', 'Gabon'), ('GM', 'Gambia'), ('GE', 'Georgia'), ('DE', 'Germany'), ('GH', 'Ghana'), ('GI', 'Gibraltar'), ('GR', 'Greece'), ('GL', 'Greenland'), ('GD', 'Grenada'), ('GP', 'Guadeloupe'), ('GU', 'Guam'), ('GT', 'Guatemala'), ('GG', 'Guernsey'), ('GN', 'Guinea'), ('GW', 'Guinea-Bissau'), ('GY', 'Guyana'), ('HT', 'Haiti'), ('HM', 'Heard & McDonald Islands'), ('HN', 'Honduras'), ('HK', 'Hong Kong SAR China'), ('HU', 'Hungary'), ('IS', 'Iceland'), ('IN', 'India'), ('ID', 'Indonesia'), ('IR', 'Iran'), ('IQ', 'Iraq'), ('IE', 'Ireland'), ('IM', 'Isle of Man'), ('IL', 'Israel'), ('IT', 'Italy'), ('JM', 'Jamaica'), ('JP', 'Japan'), ('JE', 'Jersey'), ('JO', 'Jordan'), ('KZ', 'Kazakhstan'), ('KE', 'Kenya'), ('KI', 'Kiribati'), ('KW', 'Kuwait'), ('KG', 'Kyrgyzstan'), ('LA', 'Laos'), ('LV', 'Latvia'), ('LB', 'Lebanon'), ('LS', 'Lesotho'), ('LR', 'Liberia'), ('LY', 'Libya'), ('LI', 'Liechtenstein'), ('LT', 'Lithuania'), ('LU', 'Luxembourg'), ('MO', 'Macao SAR China'), ('MG', 'Madagascar'), ('MW', 'Malawi'), ('MY', 'Malaysia'), ('MV', 'Maldives'), ('ML', 'Mali'), ('MT', 'Malta'), ('MH', 'Marshall Islands'), ('MQ', 'Martinique'), ('MR', 'Mauritania'), ('MU', 'Mauritius'), ('YT', 'Mayotte'), ('MX', 'Mexico'), ('FM', 'Micronesia'), ('MD', 'Moldova'), ('MC', 'Monaco'), ('MN', 'Mongolia'), ('ME', 'Montenegro'), ('MS', 'Montserrat'), ('MA', 'Morocco'), ('MZ', 'Mozambique'), ('MM', 'Myanmar (Burma)'), ('NA', 'Namibia'), ('NR', 'Nauru'), ('NP', 'Nepal'), ('NL', 'Netherlands'), ('NC', 'New Caledonia'), ('NZ', 'New Zealand'), ('NI', 'Nicaragua'), ('NE', 'Niger'), ('NG', 'Nigeria'), ('NU', 'Niue'), ('NF', 'Norfolk Island'), ('KP', 'North Korea'), ('MK', 'North Macedonia'), ('MP', 'Northern Mariana Islands'), ('NO', 'Norway'), ('OM', 'Oman'), ('PK', 'Pakistan'), ('PW', 'Palau'), ('PS', 'Palestinian Territories'), ('PA', 'Panama'), ('PG', 'Papua New Guinea'), ('PY', 'Paraguay'), ('PE', 'Peru'), ('PH', 'Philippines'), ('PN', 'Pitcairn Islands'), ('PL', 'Poland'), ('PT', 'Portugal'), ('PR', 'Puerto Rico'), ('QA', 'Qatar'), ('RE', 'Réunion'), ('RO', 'Romania'), ('RU', 'Russia'), ('RW', 'Rwanda'), ('WS', 'Samoa'), ('SM', 'San Marino'), ('ST', 'São Tomé & Príncipe'), ('SA', 'Saudi Arabia'), ('SN', 'Senegal'), ('RS', 'Serbia'), ('SC', 'Seychelles'), ('SL', 'Sierra Leone'), ('SG', 'Singapore'), ('SX', 'Sint Maarten'), ('SK', 'Slovakia'), ('SI', 'Slovenia'), ('SB', 'Solomon Islands'), ('SO', 'Somalia'), ('ZA', 'South Africa'), ('GS', 'South Georgia & South Sandwich Islands'), ('KR', 'South Korea'), ('SS', 'South Sudan'), ('ES', 'Spain'), ('LK', 'Sri Lanka'), ('BL', 'St. Barthélemy'), ('SH', 'St. Helena'), ('KN', 'St. Kitts & Nevis'), ('LC', 'St. Lucia'), ('MF', 'St. Martin'), ('PM', 'St. Pierre & Miquelon'), ('VC', 'St. Vincent & Grenadines'), ('SD', 'Sudan'), ('SR', 'Suriname'), ('SJ', 'Svalbard & Jan Mayen'), ('SE', 'Sweden'), ('CH', 'Switzerland'), ('SY', 'Syria'), ('TW', 'Taiwan'), ('TJ', 'Tajikistan'), ('TZ', 'Tanzania'), ('TH', 'Thailand'), ('TL', 'Timor-Leste'), ('TG', 'Togo'), ('TK', 'Tokelau'), ('TO', 'Tonga'), ('TT', 'Trinidad & Tobago'), ('TN', 'Tunisia'), ('TR', 'Turkey'), ('TM', 'Turkmenistan'), ('TC', 'Turks & Caicos Islands'), ('TV', 'Tuvalu'), ('UM', 'U.S. Outlying Islands'), ('VI', 'U.S. Virgin Islands'), ('UG', 'Uganda'), ('UA', 'Ukraine'), ('AE', 'United Arab Emirates'), ('GB', 'United Kingdom'), ('US', 'United States'), ('UY', 'Uruguay'), ('UZ', 'Uzbekistan'), ('VU', 'Vanuatu'), ('VA', 'Vatican City'), ('VE', 'Venezuela'), ('VN', 'Vietnam'), ('WF', 'Wallis & Futuna'), ('EH', 'Western Sahara'), ('YE', 'Yemen'), ('ZM', 'Zambia'), ('ZW', 'Zimbabwe')], max_length=4, null=True, verbose_name='کشور')),
+                ('date_of_birth', models.DateField(blank=True, null=True, verbose_name='تاریخ تولد')),
+                ('phone_number', models.CharField(blank=True, max_length=13, null=True, validators=[django.core.validators.RegexValidator(code='invalid_phone_number', message='شماره تلفن صحیح نیست', regex='^(0)9(0[1-5]|[1 3]\\d|2[0-2]|98)\\d{7}$')], verbose_name='شماره تلفن')),
+                ('phone_verified', models.BooleanField(blank=True, default=False, null=True, verbose_name='تایید/عدم تایید شماره تلفن')),
+                ('state', models.CharField(blank=True, max_length=50, null=True, verbose_name='استان')),
+                ('city', models.CharField(blank=True, max_length=50, null=True, verbose_name='نام شهر')),
+                ('address', models.CharField(blank=True, max_length=150, null=True, verbose_name='آدرس')),
+                ('gender', models.CharField(blank=True, choices=[('M', 'مرد'), ('F', 'زن')], max_length=25, null=True, verbose_name='جنسیت')),
+                ('marital_status', models.CharField(blank=True, choices=[('M', 'متاهل'), ('S', 'مجرد')], max_length=25, null=True, verbose_name='وضعیت تاهل')),
+                ('first_name', models.CharField(blank=True, max_length=150, null=True, verbose_name='first name')),
+                ('last_name', models.CharField(blank=True, max_length=150, null=True, verbose_name='last name')),
+                ('childs', models.ManyToManyField(blank=True, null=True, to='users.children', verbose_name='فرزندان')),
+                ('foreigner_profile', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='users.foreigner')),
+                ('iranian_profile', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='users.iranian')),
+                ('user', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='profile_user', to=settings.AUTH_USER_MODEL, verbose_name='کاربر')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TransactionHistory',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('transaction_type', models.CharField(choices=[('CBC', 'کارت به کارت'), ('PG', 'درگاه پراخت'), ('TT', 'انتقال')], max_length=3, verbose_name='نوع تراکنش')),
+                ('price', models.IntegerField(verbose_name='مبلغ')),
+                ('date', models.DateField(auto_now_add=True, verbose_name='تاریخ')),
+                ('status', models.CharField(choices=[('RE', 'رد شده'), ('AC', 'تایید شده'), ('WA', 'در انتظار تایید')], default='WA', max_length=2, verbose_name='وضعیت')),
+                ('document', models.FileField(blank=True, null=True, upload_to=utils.utils.upload_image_path, verbose_name='فایل تراکنش')),
+                ('description', models.TextField(blank=True, null=True, verbose_name='توضیحات')),
+                ('user_receiver', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='transaction_history_user_receiver', to=settings.AUTH_USER_MODEL, verbose_name='کاربر دریافت کننده')),
+                ('user_sender', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='transaction_history_user_sender', to=settings.AUTH_USER_MODEL, verbose_name='کاربر ارسال کننده')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TeamUser',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('membership_type', models.CharField(choices=[('PE', 'دائمی'), ('FR', 'فریلنسر'), ('LE', 'کارآموز')], max_length=2, verbose_name='نوع عضویت')),
+                ('profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='team_user_profile', to='users.profile', verbose_name='پروفایل')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='team_user_team', to='teams.team', verbose_name='تیم')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255, verbose_name='نام')),
+                ('description', models.TextField(verbose_name='توضیحات')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_profile', to='users.profile', verbose_name='پروفایل')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('params', models.JSONField(default=dict, verbose_name='پارامترها')),
+                ('params_hash', models.CharField(db_index=True, max_length=64, verbose_name='شناسه پارامترها')),
+                ('status', models.CharField(choices=[('PE', 'در صف'), ('RU', 'در حال ساخت'), ('DO', 'آماده دریافت'), ('FA', 'ناموفق')], default='PE', max_length=2, verbose_name='وضعیت')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='تعداد کل')),
+                ('processed', models.PositiveIntegerField(default=0, verbose_name='تعداد پردازش شده')),
+                ('file', models.FileField(blank=True, null=True, upload_to='exports/', verbose_name='فایل')),
+                ('error', models.TextField(blank=True, null=True, verbose_name='خطا')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='تاریخ ایجاد')),
+                ('finished', models.DateTimeField(blank=True, null=True, verbose_name='تاریخ پایان')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='export_job_user', to=settings.AUTH_USER_MODEL, verbose_name='درخواست کننده')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Experience',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255, verbose_name='نام')),
+                ('description', models.TextField(verbose_name='توضیحات')),
+                ('image', models.ImageField(upload_to=utils.utils.upload_image_path, verbose_name='تصویر لوگو موسسه')),
+                ('company', models.CharField(max_length=255, verbose_name='نام شرکت')),
+                ('start', models.DateField(verbose_name='تاریخ شروع')),
+                ('stop', models.DateField(verbose_name='تاریخ پایان')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_profile', to='users.profile', verbose_name='پروفایل')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Education',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255, verbose_name='نام')),
+                ('description', models.TextField(verbose_name='توضیحات')),
+                ('major', models.CharField(max_length=255, verbose_name='رشته تحصیلی')),
+                ('grade', models.CharField(choices=[('CY', 'سیکل'), ('DI', 'دیپلم'), ('MA', 'کارشناسی'), ('MP', 'کارشناسی ارشد'), ('DA', 'دکترا')], max_length=23, verbose_name='مقطع تحصیلی')),
+                ('gpa', models.FloatField(verbose_name='معدل')),
+                ('image', models.ImageField(upload_to=utils.utils.upload_image_path, verbose_name='تصویر لوگو موسسه')),
+                ('start', models.DateField(verbose_name='تاریخ شروع')),
+                ('stop', models.DateField(verbose_name='تاریخ پایان')),
+                ('is_student', models.BooleanField(verbose_name='تحصیل/عدم تحصیل')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(class)s_profile', to='users.profile', verbose_name='پروفایل')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='transactionhistory',
+            index=models.Index(fields=['user_receiver', 'status', 'date'], name='users_transaction_receiver'),
+        ),
+        migrations.AddIndex(
+            model_name='transactionhistory',
+            index=models.Index(condition=models.Q(('status', 'WA')), fields=['date'], name='users_transaction_waiting'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(condition=models.Q(('is_confirmed', 'P')), fields=['is_confirmed'], name='users_profile_pending'),
+        ),
+    ]
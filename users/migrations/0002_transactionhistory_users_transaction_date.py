@@ -0,0 +1,17 @@
+# Generated by Django 4.1.5 on 2026-10-18 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transactionhistory',
+            index=models.Index(fields=['date', 'id'], name='users_transaction_date'),
+        ),
+    ]
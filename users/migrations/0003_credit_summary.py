@@ -0,0 +1,67 @@
+# Generated by Django 4.1.5 on 2026-10-18 14:08
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Sum
+import django.db.models.deletion
+import uuid
+
+from utils.utils import jalali_month
+
+
+def build_credit_summary(apps, schema_editor):
+    CreditSummary = apps.get_model('users', 'CreditSummary')
+    TransactionHistory = apps.get_model('users', 'TransactionHistory')
+    User = apps.get_model('users', 'User')
+    db = schema_editor.connection.alias
+
+    rows = defaultdict(lambda: [0, 0, 0])
+    transactions = TransactionHistory.objects.using(db).values('user_receiver', 'date', 'status').annotate(
+        amount=Sum('price')).order_by()
+    for item in transactions:
+        month = jalali_month(item['date'])
+        user_id = item['user_receiver']
+        for key in {(user_id, month), (user_id, ''), (None, month), (None, '')}:
+            rows[key][0] += item['amount'] if item['status'] == 'AC' else 0
+            rows[key][1] += item['amount'] if item['status'] == 'RE' else 0
+            rows[key][2] += item['amount']
+    # the all time row of every user carries the debt, with or without transactions
+    rows[(None, '')]
+    debt = User.objects.using(db).filter(credit__lt=0).aggregate(debt=Sum('credit'))['debt'] or 0
+    CreditSummary.objects.using(db).bulk_create([
+        CreditSummary(user_id=user_id, month=month, accepted=accepted, rejected=rejected, total=total,
+                      debt=debt if (user_id, month) == (None, '') else 0)
+        for (user_id, month), (accepted, rejected, total) in rows.items()], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_transactionhistory_users_transaction_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CreditSummary',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('month', models.CharField(blank=True, default='', max_length=7, verbose_name='ماه')),
+                ('accepted', models.BigIntegerField(default=0, verbose_name='مجموع تایید شده')),
+                ('rejected', models.BigIntegerField(default=0, verbose_name='مجموع رد شده')),
+                ('total', models.BigIntegerField(default=0, verbose_name='مجموع تراکنش ها')),
+                ('debt', models.DecimalField(decimal_places=2, default=0, max_digits=15, verbose_name='مجموع بدهی')),
+                ('user', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='credit_summary_user', to=settings.AUTH_USER_MODEL, verbose_name='کاربر')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='creditsummary',
+            constraint=models.UniqueConstraint(condition=models.Q(('user__isnull', False)), fields=('user', 'month'), name='users_credit_summary_user'),
+        ),
+        migrations.AddConstraint(
+            model_name='creditsummary',
+            constraint=models.UniqueConstraint(condition=models.Q(('user__isnull', True)), fields=('month',), name='users_credit_summary_all'),
+        ),
+        migrations.RunPython(build_credit_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.1.5 on 2026-10-18 14:18
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_credit_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SmsMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('to', models.CharField(max_length=15, verbose_name='گیرنده')),
+                ('sender', models.CharField(max_length=20, verbose_name='فرستنده')),
+                ('text', models.TextField(verbose_name='متن')),
+                ('secret', models.BooleanField(default=False, verbose_name='محرمانه')),
+                ('status', models.CharField(choices=[('PE', 'در صف'), ('SE', 'ارسال شده'), ('FA', 'ناموفق')], default='PE', max_length=2, verbose_name='وضعیت')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='تعداد تلاش')),
+                ('next_attempt', models.DateTimeField(default=django.utils.timezone.now, verbose_name='زمان تلاش بعدی')),
+                ('rec_id', models.CharField(blank=True, max_length=32, null=True, verbose_name='شناسه تحویل')),
+                ('error', models.TextField(blank=True, null=True, verbose_name='خطا')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='تاریخ ایجاد')),
+                ('sent', models.DateTimeField(blank=True, null=True, verbose_name='تاریخ ارسال')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='smsmessage',
+            index=models.Index(condition=models.Q(('status', 'PE')), fields=['next_attempt'], name='users_sms_pending'),
+        ),
+    ]
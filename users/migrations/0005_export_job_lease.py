@@ -0,0 +1,23 @@
+# Generated by Django 4.1.5 on 2026-10-18 14:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_sms_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exportjob',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='تعداد تلاش'),
+        ),
+        migrations.AddField(
+            model_name='exportjob',
+            name='lease_until',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='مهلت اجرا'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.5 on 2026-10-18 15:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_export_job_lease'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='smsmessage',
+            name='status',
+            field=models.CharField(choices=[('PE', 'در صف'), ('SE', 'ارسال شده'), ('FA', 'ناموفق'), ('UN', 'نامشخص')], default='PE', max_length=2, verbose_name='وضعیت'),
+        ),
+    ]
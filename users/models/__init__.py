@@ -1,3 +1,5 @@
 from users.models.information import *
 from users.models.profile import *
 from users.models.user import *
+from users.models.export import *
+from users.models.sms import *
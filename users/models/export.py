@@ -0,0 +1,57 @@
+import uuid
+
+from django.conf import settings
+from django.core import signing
+from django.db import models
+
+EXPORT_SIGNING_SALT = 'users.export'
+
+
+class ExportJob(models.Model):
+    class StatusChoices(models.TextChoices):
+        PENDING = 'PE', ('در صف')
+        RUNNING = 'RU', ('در حال ساخت')
+        DONE = 'DO', ('آماده دریافت')
+        FAILED = 'FA', ('ناموفق')
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    params = models.JSONField(default=dict, verbose_name='پارامترها')
+    params_hash = models.CharField(max_length=64, db_index=True, verbose_name='شناسه پارامترها')
+    status = models.CharField(max_length=2, choices=StatusChoices.choices, default=StatusChoices.PENDING,
+                              verbose_name='وضعیت')
+    total = models.PositiveIntegerField(default=0, verbose_name='تعداد کل')
+    processed = models.PositiveIntegerField(default=0, verbose_name='تعداد پردازش شده')
+    file = models.FileField(upload_to='exports/', null=True, blank=True, verbose_name='فایل')
+    error = models.TextField(null=True, blank=True, verbose_name='خطا')
+    user = models.ForeignKey('users.User', on_delete=models.SET_NULL, related_name='export_job_user',
+                             verbose_name='درخواست کننده', null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='تعداد تلاش')
+    # a running job is renewed by its worker after every chunk, once expired the worker is taken for dead
+    lease_until = models.DateTimeField(null=True, blank=True, verbose_name='مهلت اجرا')
+    created = models.DateTimeField(auto_now_add=True, verbose_name='تاریخ ایجاد')
+    finished = models.DateTimeField(null=True, blank=True, verbose_name='تاریخ پایان')
+
+    def progress(self):
+        if self.status == self.StatusChoices.DONE:
+            return 100
+        if not self.total:
+            return 0
+        return min(99, self.processed * 100 // self.total)
+
+    def download_token(self):
+        return signing.dumps(str(self.pk), salt=EXPORT_SIGNING_SALT)
+
+    @classmethod
+    def from_download_token(cls, token):
+        """
+        Resolves a signed download token, returns None when the token is
+        invalid, expired or the job has no file yet.
+        """
+        try:
+            pk = signing.loads(token, salt=EXPORT_SIGNING_SALT, max_age=settings.EXPORT_DOWNLOAD_TTL)
+        except signing.BadSignature:
+            return None
+        return cls.objects.filter(pk=pk, status=cls.StatusChoices.DONE).first()
+
+    class Meta:
+        app_label = 'users'
@@ -1,6 +1,6 @@
 import uuid
 
-from django.db import models
+from django.db import models, transaction
 
 from utils.utils import upload_image_path
 
@@ -102,10 +102,47 @@ class TransactionHistory(models.Model):
     description = models.TextField(verbose_name='توضیحات', null=True, blank=True)
     user_receiver = models.ForeignKey('users.User', on_delete=models.CASCADE,
                                       related_name='transaction_history_user_receiver',
-                                      verbose_name='کاربر دریافت کننده', null=True, blank=True)
+                                      verbose_name='کاربر دریافت کننده', null=True, blank=True, db_index=False)
     user_sender = models.ForeignKey('users.User', on_delete=models.CASCADE,
                                     related_name='transaction_history_user_sender',
                                     verbose_name='کاربر ارسال کننده', null=True, blank=True)
 
+    def save(
+            self, force_insert=False, force_update=False, using=None, update_fields=None
+    ):
+        # the credit is applied in pre_save, keep it in the same transaction as the row
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(force_insert, force_update, using, update_fields)
+
+    class Meta:
+        app_label = 'users'
+        # leads with user_receiver, it replaces the index of the foreign key
+        indexes = [
+            models.Index(fields=['user_receiver', 'status', 'date'], name='users_transaction_receiver'),
+            models.Index(fields=['date', 'id'], name='users_transaction_date'),
+            models.Index(fields=['date'], name='users_transaction_waiting', condition=models.Q(status='WA')),
+        ]
+
+
+class CreditSummary(ID):
+    # one row per receiver and Jalali month ('1402-07') and one with an empty month for all time,
+    # the rows without a user are the totals of every user, kept by users.ledger. The month is the one of the
+    # stored transaction date, a UTC date. Writes outside the ledger are not followed, see
+    # users.ledger.recompute_summary
+    user = models.ForeignKey('users.User', on_delete=models.CASCADE, related_name='credit_summary_user',
+                             verbose_name='کاربر', null=True, blank=True, db_index=False)
+    month = models.CharField(max_length=7, blank=True, default='', verbose_name='ماه')
+    accepted = models.BigIntegerField(default=0, verbose_name='مجموع تایید شده')
+    rejected = models.BigIntegerField(default=0, verbose_name='مجموع رد شده')
+    total = models.BigIntegerField(default=0, verbose_name='مجموع تراکنش ها')
+    debt = models.DecimalField(decimal_places=2, max_digits=15, default=0, verbose_name='مجموع بدهی')
+
     class Meta:
         app_label = 'users'
+        # the unique index of the users leads with user, it replaces the index of the foreign key
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'month'], name='users_credit_summary_user',
+                                    condition=models.Q(user__isnull=False)),
+            models.UniqueConstraint(fields=['month'], name='users_credit_summary_all',
+                                    condition=models.Q(user__isnull=True)),
+        ]
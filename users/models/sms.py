@@ -0,0 +1,32 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class SmsMessage(models.Model):
+    class StatusChoices(models.TextChoices):
+        PENDING = 'PE', ('در صف')
+        SENT = 'SE', ('ارسال شده')
+        FAILED = 'FA', ('ناموفق')
+        # the provider call timed out, it may have been sent
+        UNKNOWN = 'UN', ('نامشخص')
+
+    to = models.CharField(max_length=15, verbose_name='گیرنده')
+    sender = models.CharField(max_length=20, verbose_name='فرستنده')
+    text = models.TextField(verbose_name='متن')
+    # the text is cleared once it is sent, for messages carrying credentials
+    secret = models.BooleanField(default=False, verbose_name='محرمانه')
+    status = models.CharField(max_length=2, choices=StatusChoices.choices, default=StatusChoices.PENDING,
+                              verbose_name='وضعیت')
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='تعداد تلاش')
+    next_attempt = models.DateTimeField(default=timezone.now, verbose_name='زمان تلاش بعدی')
+    rec_id = models.CharField(max_length=32, null=True, blank=True, verbose_name='شناسه تحویل')
+    error = models.TextField(null=True, blank=True, verbose_name='خطا')
+    created = models.DateTimeField(auto_now_add=True, verbose_name='تاریخ ایجاد')
+    sent = models.DateTimeField(null=True, blank=True, verbose_name='تاریخ ارسال')
+
+    class Meta:
+        app_label = 'users'
+        indexes = [
+            models.Index(fields=['next_attempt'], name='users_sms_pending', condition=Q(status='PE')),
+        ]
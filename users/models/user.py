@@ -185,6 +185,9 @@ class Profile(ID):
 
     class Meta:
         app_label = 'users'
+        indexes = [
+            models.Index(fields=['is_confirmed'], name='users_profile_pending', condition=models.Q(is_confirmed='P')),
+        ]
 
 
 class Iranian(ID):
@@ -10,6 +10,4 @@ class ExcelRenderer(renderers.BaseRenderer):
     def render(self, data, accepted_media_type=None, renderer_context=None):
         if isinstance(data, dict):
             return
-        path = convert_to_excel(data)
-        file = open(path, 'rb')
-        return file.read()
+        return convert_to_excel(data)
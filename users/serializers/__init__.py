@@ -1,3 +1,4 @@
 from users.serializers.user import *
 from users.serializers.information import *
 from users.serializers.profile import *
+from users.serializers.export import *
@@ -0,0 +1,22 @@
+from django.urls import reverse
+from rest_framework import serializers
+
+from users.models import ExportJob
+
+
+class ExportJobSerializer(serializers.ModelSerializer):
+    progress = serializers.IntegerField(read_only=True)
+    download_url = serializers.SerializerMethodField()
+
+    def get_download_url(self, obj):
+        if obj.status != ExportJob.StatusChoices.DONE:
+            return None
+        url = reverse('users:export-download', kwargs={'token': obj.download_token()})
+        request = self.context.get('request', None)
+        return request.build_absolute_uri(url) if request else url
+
+    class Meta:
+        model = ExportJob
+        fields = ('id', 'params', 'status', 'total', 'processed', 'progress', 'error', 'created', 'finished',
+                  'download_url')
+        read_only_fields = fields
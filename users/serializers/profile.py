@@ -188,6 +188,18 @@ class ProfileSerializer(DynamicFieldsMixin, WritableNestedModelSerializer):
             instance.childs.set(obj)
         return instance
 
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None):
+        """
+        Joins/prefetches the nested relations this serializer will render, so a
+        list costs the same number of queries whatever its length. `fields`
+        narrows them the same way the `fields` argument narrows the output.
+        """
+        fields = set(cls.Meta.fields if fields is None else fields)
+        select_related = [name for name in cls.Meta.select_related_fields if name in fields]
+        prefetch_related = [name for name in cls.Meta.prefetch_related_fields if name in fields]
+        return queryset.select_related(*select_related).prefetch_related(*prefetch_related)
+
     def validate(self, attrs):
         validator = ProfileValidator()
         return validator.validate(attrs, self.context['request'])
@@ -211,6 +223,8 @@ class ProfileSerializer(DynamicFieldsMixin, WritableNestedModelSerializer):
         )
         read_only_fields = ('id', 'is_confirmed', 'phone_verified')
         exempt_fields = ['user', 'iranian_profile', 'foreigner_profile', 'childs']
+        select_related_fields = ['user', 'iranian_profile', 'foreigner_profile']
+        prefetch_related_fields = ['childs', 'skill_profile', 'education_profile', 'experience_profile']
 
 
 class ConfirmProfileSerializer(serializers.Serializer):
@@ -14,9 +14,18 @@ class UserSerializer(serializers.ModelSerializer):
         fields['is_staff'].read_only = True
         fields['is_superuser'].read_only = True
         fields['is_active'].read_only = True
+        # credit only changes through users.ledger
+        fields['credit'].read_only = True
 
         return fields
 
+    def update(self, instance, validated_data):
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        # a full save would write back the credit loaded with the request over parallel ledger updates
+        instance.save(update_fields=list(validated_data))
+        return instance
+
     class Meta:
         model = User
         exclude = ['password', 'groups', 'user_permissions', 'date_joined', 'last_login']
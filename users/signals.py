@@ -1,7 +1,8 @@
 from django.db.models.signals import m2m_changed
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 
+from users.ledger import apply_credit, apply_summary, credit_deltas, summary_deltas
 from users.models import Profile, Children
 
 #
@@ -18,14 +19,35 @@ from users.models import Profile, Children
 
 @receiver(pre_save, sender='users.TransactionHistory')
 def update_credit(sender, instance, **kwargs):
-    if instance.status == 'AC':
-        user_receiver = instance.user_receiver
-        user_sender = instance.user_sender
-        user_receiver.credit += instance.price
-        user_receiver.save()
-        if user_sender:
-            user_sender.credit -= instance.price
-            user_sender.save()
+    instance.saved_summary = None
+    if not instance._state.adding:
+        # locked, two admins accepting the same transaction at once apply its credit once
+        instance.saved_summary = sender.objects.select_for_update(no_key=True).filter(pk=instance.pk).values_list(
+            'user_receiver_id', 'date', 'status', 'price').first()
+    if instance.status != 'AC':
+        return
+    if instance.saved_summary is not None and instance.saved_summary[2] == 'AC':
+        # credit is applied once, when the transaction becomes accepted
+        return
+    deltas = credit_deltas((instance.user_receiver_id, instance.price), (instance.user_sender_id, -instance.price))
+    apply_credit(deltas, check_balance=instance.user_sender_id is not None)
+
+
+@receiver(post_save, sender='users.TransactionHistory')
+def summary_post_save_transaction_history(sender, instance, **kwargs):
+    entries = [(instance.user_receiver_id, instance.date, instance.status, instance.price)]
+    saved = getattr(instance, 'saved_summary', None)
+    if saved is not None:
+        user_id, date, status, price = saved
+        entries.append((user_id, date, status, -price))
+    apply_summary(summary_deltas(*entries))
+
+
+@receiver(post_delete, sender='users.TransactionHistory')
+def summary_post_delete_transaction_history(sender, instance, **kwargs):
+    # the rows exist since the transaction was saved, unless they went with a deleted user
+    apply_summary(summary_deltas((instance.user_receiver_id, instance.date, instance.status, -instance.price)),
+                  create=False)
 
 
 @receiver(post_save, sender='users.User')
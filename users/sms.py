@@ -0,0 +1,161 @@
+import time
+from itertools import groupby
+
+import requests
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from main.melipayamak import Api
+from users.models import SmsMessage
+
+SMS_CLAIM_SIZE = 500
+# the codes SendSimpleSMS answers instead of delivery ids, from the melipayamak web service documentation
+SMS_ERROR_CODES = {
+    '0': 'wrong username or password',
+    '2': 'not enough credit',
+    '3': 'daily sending limit',
+    '4': 'sending volume limit',
+    '5': 'invalid sender number',
+    '6': 'the system is being updated',
+    '7': 'the text has a filtered word',
+    '9': 'public lines can not send through the web service',
+    '10': 'the user is not active',
+    '11': 'not sent',
+    '12': 'the user documents are not complete',
+    '14': 'the text has a link',
+    '35': 'the number is in the blacklist',
+}
+
+
+def enqueue_sms(numbers, text, sender=None, secret=False):
+    """
+    _Enqueue SMS_
+    Queues one message per number for the sms worker, in one INSERT, instead
+    of calling the provider inside the request.
+    Args:
+        numbers (_list_): Phone numbers, empty ones are skipped
+        text (_str_): Message text
+        sender (_str_): Sender number, SMS_FROM by default
+        secret (_bool_): The text carries credentials, it is cleared once sent
+    """
+
+    sender = sender or settings.SMS_FROM
+    messages = [SmsMessage(to=number, sender=sender, text=text, secret=secret) for number in numbers if number]
+    return SmsMessage.objects.bulk_create(messages)
+
+
+def claim_sms_messages(limit=SMS_CLAIM_SIZE):
+    # SKIP LOCKED lets several workers poll the same table without taking the same messages, the claimed ones
+    # are leased until SMS_CLAIM_TIMEOUT so a worker that dies mid batch only delays them
+    now = timezone.now()
+    with transaction.atomic():
+        messages = list(SmsMessage.objects.select_for_update(skip_locked=True).filter(
+            status=SmsMessage.StatusChoices.PENDING, next_attempt__lte=now).order_by('next_attempt', 'id')[:limit])
+        if messages:
+            SmsMessage.objects.filter(pk__in=[message.pk for message in messages]).update(
+                attempts=F('attempts') + 1, next_attempt=now + timezone.timedelta(seconds=settings.SMS_CLAIM_TIMEOUT))
+    for message in messages:
+        message.attempts += 1
+    return messages
+
+
+def batch_key(message):
+    return message.sender, message.text
+
+
+def sms_batches(messages, size):
+    # identical texts from the same sender go out in one multi recipient call
+    for _, group in groupby(sorted(messages, key=batch_key), key=batch_key):
+        group = list(group)
+        for start in range(0, len(group), size):
+            yield group[start:start + size]
+
+
+def delivery_ids(result, count):
+    """
+    Splits a SendSimpleSMS result into (rec_id, error) per recipient. The
+    provider answers with a delivery id per recipient, or one of SMS_ERROR_CODES
+    for the whole call.
+    """
+    values = [str(value) for value in (result or [])]
+    if len(values) == count:
+        return [(None, sms_error(value)) if value in SMS_ERROR_CODES else (value, None) for value in values]
+    return [(None, sms_error(','.join(values)))] * count
+
+
+def sms_error(code):
+    description = SMS_ERROR_CODES.get(code)
+    return 'error code %s: %s' % (code, description) if description else 'error code %s' % code
+
+
+def redact(message):
+    # the text of a secret message is only kept while it can still be sent
+    if message.secret:
+        message.text = ''
+
+
+def delivery_unknown(error):
+    # a read timeout comes after the request went out, the provider may have sent the messages
+    return isinstance(error, requests.exceptions.ReadTimeout)
+
+
+def record_sms_results(messages, results, unknown=False):
+    now = timezone.now()
+    for message, (rec_id, error) in zip(messages, results):
+        if error is None:
+            message.status = SmsMessage.StatusChoices.SENT
+            message.rec_id = rec_id
+            message.sent = now
+            message.error = None
+            redact(message)
+        elif unknown and message.secret:
+            # a secret text is never sent twice, it is left for the user to ask again
+            message.status = SmsMessage.StatusChoices.UNKNOWN
+            message.error = error
+            redact(message)
+        elif message.attempts >= settings.SMS_MAX_ATTEMPTS:
+            message.status = SmsMessage.StatusChoices.FAILED
+            message.error = error
+            redact(message)
+        else:
+            message.error = error
+            message.next_attempt = now + timezone.timedelta(
+                seconds=settings.SMS_RETRY_BACKOFF * 2 ** (message.attempts - 1))
+    SmsMessage.objects.bulk_update(messages, ['status', 'rec_id', 'sent', 'error', 'text', 'next_attempt'])
+
+
+class SmsSender:
+    """
+    Sends claimed messages with the SOAP SendSimpleSMS, at most SMS_BATCH_SIZE
+    recipients per call and SMS_RATE_LIMIT calls per second in this process.
+    """
+
+    def __init__(self, sms=None):
+        self.sms = sms or Api(settings.SMS_USERNAME, settings.SMS_PASSWORD).sms('soap')
+        self.interval = 1 / settings.SMS_RATE_LIMIT
+        self.last_call = 0
+
+    def wait(self):
+        delay = self.last_call + self.interval - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.last_call = time.monotonic()
+
+    def send(self, messages):
+        sent = failed = 0
+        for batch in sms_batches(messages, settings.SMS_BATCH_SIZE):
+            self.wait()
+            unknown = False
+            try:
+                result = self.sms.send([message.to for message in batch], batch[0].sender, batch[0].text)
+                results = delivery_ids(result, len(batch))
+            except Exception as e:
+                results = [(None, str(e) or e.__class__.__name__)] * len(batch)
+                unknown = delivery_unknown(e)
+            record_sms_results(batch, results, unknown)
+            ok = sum(error is None for rec_id, error in results)
+            sent += ok
+            failed += len(batch) - ok
+        return sent, failed
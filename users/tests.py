@@ -1,3 +1,442 @@
-from django.test import TestCase
+import io
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-# Create your tests here.
+import openpyxl
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from main.testing import jwt_client, plan, run_parallel
+from teams.models import Team
+from users.exception import CreditNotEnough
+from users.export import EXPORT_REUSE_TTL, claim_export_job, enqueue_profile_export, purge_export_jobs, \
+    run_export_job
+from users.ledger import apply_credit, credit_deltas
+from users.models import User, Profile, Foreigner, Children, Skill, Education, Experience, TransactionHistory, \
+    CreditSummary, SmsMessage, ExportJob
+from users.renderer import ExcelRenderer
+from users.serializers import UserSerializer
+from users.views import ChangePasswordView
+from users.sms import SmsSender, delivery_ids, enqueue_sms, record_sms_results
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+EXPORT_THREADS = 8
+LEDGER_THREADS = 8
+
+
+def workbook_names(content):
+    # the first two rows are the headers, first and last name are the first two columns
+    sheet = openpyxl.load_workbook(io.BytesIO(content), read_only=True).active
+    return [(row[0], row[1]) for row in sheet.iter_rows(min_row=3, values_only=True)]
+
+
+class ExcelRendererTests(SimpleTestCase):
+    def profiles(self, export):
+        return [{'first_name': f'export{export}', 'last_name': f'row{i}', 'country': 'IR', 'state': 'state',
+                 'city': 'city', 'address': 'address', 'marital_status': 'S'} for i in range(50)]
+
+    def test_concurrent_renders_keep_their_own_rows(self):
+        def render(export):
+            return export, ExcelRenderer().render(self.profiles(export))
+
+        with ThreadPoolExecutor(EXPORT_THREADS) as executor:
+            results = list(executor.map(render, range(EXPORT_THREADS * 4)))
+
+        for export, content in results:
+            self.assertEqual(workbook_names(content),
+                             [(item['first_name'], item['last_name']) for item in self.profiles(export)])
+
+
+class ProfileExcelConcurrencyTests(TransactionTestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        for i in range(30):
+            user = User.objects.create_user(f'user{i}', password='x')
+            Profile.objects.filter(user=user).update(first_name=f'name{i}', last_name='last', marital_status='S')
+
+    def test_parallel_exports_are_complete(self):
+        def export(_):
+            response = jwt_client(self.admin).get('/api/v1/profile-excel/')
+            return response.status_code, b''.join(response.streaming_content)
+
+        results = run_parallel(export, range(EXPORT_THREADS), EXPORT_THREADS)
+
+        expected = list(Profile.objects.values_list('first_name', 'last_name'))
+        for status_code, content in results:
+            self.assertEqual(status_code, 200)
+            self.assertCountEqual(workbook_names(content), expected)
+
+
+class ProfileListQueryTests(TestCase):
+    """
+    The profile lists render every nested relation of ProfileSerializer, the
+    number of queries must not grow with the number of profiles.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        cls.manager = User.objects.create_user('manager', password='x')
+        Team.objects.create(name='team', description='d', ceo=cls.manager.profile_user, create_date=timezone.now(),
+                            image='team.gif').managers.add(cls.manager.profile_user)
+        cls.count = 0
+
+    def add_profiles(self, count):
+        for _ in range(count):
+            self.count += 1
+            user = User.objects.create_user(f'user{self.count}', password='x')
+            profile = user.profile_user
+            profile.first_name, profile.last_name, profile.marital_status = f'name{self.count}', 'last', 'M'
+            profile.foreigner_profile = Foreigner.objects.create(passport_image='p.gif', exclusive_code='123')
+            profile.save()
+            profile.childs.add(Children.objects.create(identification='c.gif'))
+            Skill.objects.create(name='skill', description='d', profile=profile)
+            Education.objects.create(name='education', description='d', profile=profile, major='m', grade='MA',
+                                     gpa=18, image='e.gif', start='2010-01-01', stop='2014-01-01', is_student=False)
+            Experience.objects.create(name='experience', description='d', profile=profile, image='e.gif',
+                                      company='c', start='2014-01-01', stop='2018-01-01')
+
+    def assertConstantQueries(self, client, url, queries):
+        for count in (2, 9):
+            self.add_profiles(count)
+            # the page count is cached, every request here counts again
+            cache.clear()
+            with self.assertNumQueries(queries):
+                response = client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+    def test_profile_list(self):
+        self.assertConstantQueries(jwt_client(self.manager), '/api/v1/profile/', 10)
+
+    def test_confirm_profile_list(self):
+        self.assertConstantQueries(jwt_client(self.admin), '/api/v1/confirm-profile/', 8)
+
+    def test_profile_excel(self):
+        self.assertConstantQueries(jwt_client(self.admin), '/api/v1/profile-excel/', 4)
+
+
+class CreditLedgerConcurrencyTests(TransactionTestCase):
+    """
+    Credit changes from parallel transactions, on committed rows, must all be
+    applied exactly once.
+    """
+
+    def setUp(self):
+        self.first = User.objects.create_user('first', credit=1000)
+        self.second = User.objects.create_user('second', credit=1000)
+
+    def credits(self):
+        return dict(User.objects.filter(pk__in=[self.first.pk, self.second.pk]).values_list('pk', 'credit'))
+
+    def test_parallel_deposits(self):
+        def deposit(_):
+            for _ in range(10):
+                apply_credit(credit_deltas((self.first.pk, 10), (self.second.pk, 5)))
+
+        run_parallel(deposit, range(LEDGER_THREADS * 2), LEDGER_THREADS)
+
+        self.assertEqual(self.credits(), {self.first.pk: 1000 + 16 * 100, self.second.pk: 1000 + 16 * 50})
+
+    def test_parallel_transfers_both_ways(self):
+        def transfer(i):
+            sender, receiver = (self.first, self.second) if i % 2 else (self.second, self.first)
+            TransactionHistory.objects.create(user_sender=sender, user_receiver=receiver, price=7 + i % 2,
+                                              transaction_type='TT', status='AC')
+
+        run_parallel(transfer, range(LEDGER_THREADS * 8), LEDGER_THREADS)
+
+        # 32 transfers of 8 from the first user, 32 of 7 from the second
+        self.assertEqual(self.credits(), {self.first.pk: 1000 - 32, self.second.pk: 1000 + 32})
+        self.assertEqual(CreditSummary.objects.get(user=None, month='').accepted, 32 * 8 + 32 * 7)
+
+    def test_parallel_debits_never_overdraw(self):
+        def debit(_):
+            try:
+                apply_credit(credit_deltas((self.first.pk, -30), (self.second.pk, 30)), check_balance=True)
+                return True
+            except CreditNotEnough:
+                return False
+
+        results = run_parallel(debit, range(LEDGER_THREADS * 8), LEDGER_THREADS)
+
+        self.assertEqual(sum(results), 1000 // 30)
+        self.assertEqual(self.credits(), {self.first.pk: 1000 % 30, self.second.pk: 1000 + 1000 // 30 * 30})
+
+
+class StaleUserSaveTests(TestCase):
+    """
+    Saves of a user row loaded before a ledger update keep the new credit.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user('user', password='old', credit=1000)
+        self.stale = User.objects.get(pk=self.user.pk)
+        apply_credit(credit_deltas((self.user.pk, 500)))
+
+    def test_change_password(self):
+        with mock.patch.object(ChangePasswordView, 'get_object', return_value=self.stale):
+            response = jwt_client(self.user).put('/api/v1/auth/change-password/', {
+                'old_password': 'old', 'new_password': 'new', 're_new_password': 'new'}, content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('new'))
+        self.assertEqual(self.user.credit, 1500)
+
+    def test_nested_user_update(self):
+        serializer = UserSerializer(self.stale, data={'email': 'user@example.com', 'credit': 0}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual((self.user.email, self.user.credit), ('user@example.com', 1500))
+
+
+class IndexPlanTests(TestCase):
+    """
+    The hot list filters are answered from their indexes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('user', password='x')
+
+    def test_credit_history_of_a_user(self):
+        queryset = TransactionHistory.objects.filter(user_receiver=self.user, status='AC').order_by('-date', '-id')
+        self.assertIn('users_transaction_receiver', plan(queryset))
+
+    def test_approval_queue(self):
+        queryset = TransactionHistory.objects.filter(status='WA').order_by('-date', '-id')
+        self.assertIn('users_transaction_waiting', plan(queryset))
+
+    def test_profile_confirmation_queue(self):
+        self.assertIn('users_profile_pending', plan(Profile.objects.filter(is_confirmed='P')))
+
+    def test_pending_sms(self):
+        queryset = SmsMessage.objects.filter(status=SmsMessage.StatusChoices.PENDING,
+                                             next_attempt__lte=timezone.now()).order_by('next_attempt', 'id')
+        self.assertIn('users_sms_pending', plan(queryset[:500]))
+
+
+class DeliveryIdsTests(SimpleTestCase):
+    def test_delivery_ids_and_error_codes(self):
+        self.assertEqual(delivery_ids(['11', '5912345678901234567', 35], 3),
+                         [(None, 'error code 11: not sent'), ('5912345678901234567', None),
+                          (None, 'error code 35: the number is in the blacklist')])
+
+    def test_one_error_for_the_whole_call(self):
+        self.assertEqual(delivery_ids([2], 2), [(None, 'error code 2: not enough credit')] * 2)
+
+
+@override_settings(SMS_MAX_ATTEMPTS=3)
+class SecretSmsTests(TestCase):
+    def record(self, attempts, result):
+        message = enqueue_sms(['09120000000'], 'password: 1234', sender='5000', secret=True)[0]
+        message.attempts = attempts
+        record_sms_results([message], [result])
+        return SmsMessage.objects.get(pk=message.pk)
+
+    def test_sent_text_is_cleared(self):
+        message = self.record(1, ('5912345678901234567', None))
+        self.assertEqual((message.status, message.text), (SmsMessage.StatusChoices.SENT, ''))
+
+    def test_failed_text_is_cleared(self):
+        message = self.record(3, (None, 'error code 11: not sent'))
+        self.assertEqual((message.status, message.text), (SmsMessage.StatusChoices.FAILED, ''))
+
+    def test_retried_text_is_kept(self):
+        message = self.record(1, (None, 'error code 11: not sent'))
+        self.assertEqual((message.status, message.text), (SmsMessage.StatusChoices.PENDING, 'password: 1234'))
+
+
+@override_settings(SMS_RATE_LIMIT=1000)
+class SmsTimeoutTests(TestCase):
+    def send(self, error, secret):
+        message = enqueue_sms(['09120000000'], 'password: 1234', sender='5000', secret=secret)[0]
+        message.attempts = 1
+        sms = mock.Mock()
+        sms.send.side_effect = error
+        self.assertEqual(SmsSender(sms).send([message]), (0, 1))
+        return SmsMessage.objects.get(pk=message.pk)
+
+    def test_secret_text_is_not_sent_again_after_a_read_timeout(self):
+        message = self.send(requests.exceptions.ReadTimeout('read timed out'), secret=True)
+        self.assertEqual((message.status, message.text, message.error),
+                         (SmsMessage.StatusChoices.UNKNOWN, '', 'read timed out'))
+
+    def test_secret_text_is_retried_when_the_call_did_not_go_out(self):
+        message = self.send(requests.exceptions.ConnectTimeout('connect timed out'), secret=True)
+        self.assertEqual((message.status, message.text), (SmsMessage.StatusChoices.PENDING, 'password: 1234'))
+
+    def test_other_texts_are_retried_after_a_read_timeout(self):
+        message = self.send(requests.exceptions.ReadTimeout('read timed out'), secret=False)
+        self.assertEqual((message.status, message.text), (SmsMessage.StatusChoices.PENDING, 'password: 1234'))
+
+
+class CityAutocompleteTests(TestCase):
+    url = '/api/v1/geo/cities/'
+
+    def get(self, **params):
+        return self.client.get(self.url, params)
+
+    def test_arabic_letters_and_spacing_find_the_persian_names(self):
+        # arabic kaf and yeh and extra spaces
+        response = self.get(prefix=' كيش ')
+        self.assertEqual([city['name'] for city in response.json()], ['کیش'])
+        self.assertEqual(response['ETag'], self.get(prefix='کیش')['ETag'])
+        self.assertEqual(self.get(prefix='بناب\u200cجدید')['ETag'], self.get(prefix='بناب  جدید')['ETag'])
+
+    def test_province_filter(self):
+        cities = self.get(prefix='کر', province='22', limit=50).json()
+        self.assertIn('کرمانشاه', [city['name'] for city in cities])
+        self.assertEqual({city['province_id'] for city in cities}, {22})
+        self.assertNotIn('کرج', [city['name'] for city in cities])
+        by_name = self.get(prefix='کر', province='کرمانشاه', limit=50)
+        self.assertEqual(by_name.json(), cities)
+        self.assertNotEqual(by_name['ETag'], self.get(prefix='کر', limit=50)['ETag'])
+
+    def test_matching_etag_is_not_modified(self):
+        response = self.get(prefix='کرج')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('public', response['Cache-Control'])
+
+        cached = self.client.get(self.url, {'prefix': 'كرج'}, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached['ETag'], response['ETag'])
+        self.assertEqual(self.client.get(self.url, {'prefix': 'کرمان'}, HTTP_IF_NONE_MATCH=response['ETag'])
+                         .status_code, 200)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ExportJobTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        for i in range(3):
+            User.objects.create_user(f'user{i}', password='x')
+
+    def finish(self, job, **kwargs):
+        ExportJob.objects.filter(pk=job.pk).update(**kwargs)
+        job.refresh_from_db()
+
+    def test_same_params_reuse_the_job(self):
+        job = enqueue_profile_export({'education': True, 'experience': True})
+        self.assertEqual(enqueue_profile_export({'experience': True, 'education': True}), job)
+        self.assertNotEqual(enqueue_profile_export({'education': False, 'experience': True}), job)
+
+        self.finish(job, status=ExportJob.StatusChoices.DONE, finished=timezone.now())
+        self.assertEqual(enqueue_profile_export(job.params), job)
+        self.finish(job, finished=timezone.now() - timezone.timedelta(seconds=EXPORT_REUSE_TTL + 1))
+        self.assertNotEqual(enqueue_profile_export(job.params), job)
+
+    def test_failed_job_is_not_reused(self):
+        job = enqueue_profile_export({})
+        self.finish(job, status=ExportJob.StatusChoices.FAILED, finished=timezone.now())
+        self.assertNotEqual(enqueue_profile_export({}), job)
+
+    def test_expired_lease_is_claimed_again(self):
+        job = enqueue_profile_export({})
+        self.assertEqual(claim_export_job(), job)
+        # leased to the first worker
+        self.assertIsNone(claim_export_job())
+
+        for attempts in (2, 3):
+            self.finish(job, lease_until=timezone.now() - timezone.timedelta(seconds=1))
+            job = claim_export_job()
+            self.assertEqual((job.status, job.attempts), (ExportJob.StatusChoices.RUNNING, attempts))
+
+        self.finish(job, lease_until=timezone.now() - timezone.timedelta(seconds=1))
+        self.assertIsNone(claim_export_job())
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.error), (ExportJob.StatusChoices.FAILED, 'worker stopped'))
+
+    def test_progress(self):
+        job = ExportJob(total=0)
+        self.assertEqual(job.progress(), 0)
+        job.total, job.processed = 8, 6
+        self.assertEqual(job.progress(), 75)
+        job.processed = 8
+        self.assertEqual(job.progress(), 99)
+        job.status = ExportJob.StatusChoices.DONE
+        self.assertEqual(job.progress(), 100)
+
+    def test_download(self):
+        client = jwt_client(self.admin)
+        response = client.post('/api/v1/profile-excel/jobs/')
+        self.assertEqual(response.status_code, 202)
+        self.assertIsNone(response.json()['download_url'])
+
+        job = run_export_job(claim_export_job())
+        self.assertEqual((job.total, job.processed), (Profile.objects.count(), Profile.objects.count()))
+        data = client.get(f'/api/v1/profile-excel/jobs/{job.pk}/').json()
+        self.assertEqual((data['status'], data['progress']), (ExportJob.StatusChoices.DONE, 100))
+
+        response = self.client.get(data['download_url'])
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual(workbook_names(b''.join(response.streaming_content)),
+                              Profile.objects.values_list('first_name', 'last_name'))
+
+    def test_bad_download_tokens(self):
+        job = run_export_job(ExportJob.objects.create(params={}, status=ExportJob.StatusChoices.RUNNING))
+        token = job.download_token()
+        tampered = token[:-1] + ('b' if token.endswith('a') else 'a')
+
+        self.assertEqual(self.client.get(f'/api/v1/profile-excel/download/{tampered}/').status_code, 404)
+        later = time.time() + settings.EXPORT_DOWNLOAD_TTL + 1
+        with mock.patch('django.core.signing.time.time', return_value=later):
+            self.assertEqual(self.client.get(f'/api/v1/profile-excel/download/{token}/').status_code, 404)
+        self.assertEqual(self.client.get(f'/api/v1/profile-excel/download/{token}/').status_code, 200)
+
+    def test_purge_old_jobs(self):
+        old = run_export_job(ExportJob.objects.create(params={}, status=ExportJob.StatusChoices.RUNNING))
+        recent = run_export_job(ExportJob.objects.create(params={}, status=ExportJob.StatusChoices.RUNNING))
+        pending = ExportJob.objects.create(params={})
+        self.finish(old, finished=timezone.now() - timezone.timedelta(seconds=settings.EXPORT_KEEP_TTL + 1))
+        path = old.file.path
+
+        self.assertEqual(purge_export_jobs(), 1)
+        self.assertCountEqual(ExportJob.objects.values_list('pk', flat=True), [recent.pk, pending.pk])
+        self.assertFalse(os.path.exists(path))
+        self.assertTrue(os.path.exists(recent.file.path))
+
+
+class CreditSummaryRecomputeTests(TestCase):
+    def summary(self):
+        return {(user, month): (accepted, rejected, total, debt) for user, month, accepted, rejected, total, debt in
+                CreditSummary.objects.values_list('user', 'month', 'accepted', 'rejected', 'total', 'debt')}
+
+    def test_recompute_matches_the_ledger(self):
+        first = User.objects.create_user('first', credit=1000)
+        second = User.objects.create_user('second', credit=1000)
+        for user, status, price in [(first, 'AC', 100), (first, 'RE', 30), (second, 'AC', 70), (second, 'WA', 5)]:
+            TransactionHistory.objects.create(user_receiver=user, price=price, status=status, transaction_type='CBC')
+        moved = TransactionHistory.objects.create(user_receiver=first, price=40, status='AC', transaction_type='CBC')
+        moved.date = moved.date - timezone.timedelta(days=40)
+        moved.save()
+        TransactionHistory.objects.create(user_sender=first, user_receiver=second, price=500, status='AC',
+                                          transaction_type='TT')
+        expected = self.summary()
+        self.assertEqual(len({month for user, month in expected}), 3)
+        self.assertEqual(expected[(None, '')], (710, 30, 745, 0))
+
+        # changes outside the ledger
+        CreditSummary.objects.update(accepted=0, total=0)
+        User.objects.filter(pk=second.pk).update(credit=-200)
+
+        call_command('recompute_credit_summary', stdout=io.StringIO())
+        expected[(None, '')] = (710, 30, 745, -200)
+        self.assertEqual(self.summary(), expected)
@@ -5,7 +5,8 @@ from rest_framework_simplejwt.views import TokenVerifyView
 from users.views import TokenObtainPairView, TokenRefreshView, CheckDestinationAccountAV, SendCreditAV, \
     IncreaseCreditCardNumberVS, CreditCardNumberShowAP, TokenBlacklistView, SkillViewSet, ExperienceViewSet, \
     EducationViewSet, ChangePasswordView, ConfirmProfileAPIView, PhoneSubmitView, PhoneVerifyView, ProfileList, \
-    ProfileRetrieveUpdate, ProfileRetrieveUpdateMe, ProfileListExcel, TeamUserViewSet
+    ProfileRetrieveUpdate, ProfileRetrieveUpdateMe, ProfileListExcel, TeamUserViewSet, CityAutocompleteView, \
+    ProfileExportJobCreate, ProfileExportJobRetrieve, ExportJobDownload
 
 app_name = 'users'
 
@@ -31,15 +32,20 @@ urlpatterns = [
     path('credit-card-number-show/', CreditCardNumberShowAP.as_view(),
          name='credit-card-number-show'),
 
-    path('profile/', ProfileList.as_view()),
-    path('profile-excel/', ProfileListExcel.as_view()),
+    path('profile/', ProfileList.as_view(), name='profile-list'),
+    path('profile-excel/', ProfileListExcel.as_view(), name='profile-excel'),
+    path('profile-excel/jobs/', ProfileExportJobCreate.as_view(), name='export-job-create'),
+    path('profile-excel/jobs/<uuid:pk>/', ProfileExportJobRetrieve.as_view(), name='export-job-detail'),
+    path('profile-excel/download/<str:token>/', ExportJobDownload.as_view(), name='export-download'),
     path('profile/<uuid:pk>/', ProfileRetrieveUpdate.as_view(), name='profile-detail'),
-    path('profile/me/', ProfileRetrieveUpdateMe.as_view()),
-    path('confirm-profile/', ConfirmProfileAPIView.as_view()),
+    path('profile/me/', ProfileRetrieveUpdateMe.as_view(), name='profile-me'),
+    path('confirm-profile/', ConfirmProfileAPIView.as_view(), name='confirm-profile'),
 
     path("auth/phone-submit/", PhoneSubmitView.as_view(), name='phone-submit'),
     path("auth/phone-verify/", PhoneVerifyView.as_view(), name='phone-verfiy'),
 
+    path('geo/cities/', CityAutocompleteView.as_view(), name='geo-cities'),
+
     path("", include(routers.urls)),
 
 ]
@@ -23,10 +23,10 @@ class ProfileValidator(object):
         country = attrs.get('country', None)
         iranian = attrs.get('iranian_profile', None)
         foreigner = attrs.get('foreigner_profile', None)
-        city = check_city(attrs.get('city', None))
         state = check_province(attrs.get('state', None))
+        city = check_city(attrs.get('city', None), state.id) if state else False
 
-        if city['province_id'] != state['id']:
+        if not city:
             raise CityDoesNotExist
 
         if martial_status != 'M' and child:
@@ -44,6 +44,6 @@ class ProfileValidator(object):
         if foreigner and iranian:
             raise NationalityDoseNoteMatch
 
-        attrs['city'] = city['name']
-        attrs['state'] = state['name']
+        attrs['city'] = city.name
+        attrs['state'] = state.name
         return attrs
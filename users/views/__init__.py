@@ -1,4 +1,5 @@
 from users.views.auth import *
+from users.views.geo import *
 from users.views.information import *
 from users.views.profile import *
 from users.views.user import *
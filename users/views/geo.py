@@ -0,0 +1,71 @@
+import hashlib
+
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from utils.cities import check_province, dataset_version, get_index, normalize_name, search_cities
+
+GEO_CACHE_TTL = settings.GEO_CACHE_TTL
+GEO_DEFAULT_LIMIT = 10
+GEO_MAX_LIMIT = 50
+
+
+class CityAutocompleteView(APIView):
+    """
+    Read-only city suggestions for the profile form. The answer depends only
+    on the query string and the bundled dataset, so it is public and cached
+    by the browser/CDN under a strong ETag.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get_province_id(self, value):
+        if not value:
+            return None
+        if value.isdigit():
+            return int(value)
+        province = check_province(value)
+        return province.id if province else 0
+
+    def get_limit(self, value):
+        try:
+            limit = int(value)
+        except (TypeError, ValueError):
+            return GEO_DEFAULT_LIMIT
+        return max(1, min(limit, GEO_MAX_LIMIT))
+
+    def get_etag(self, prefix, province_id, limit):
+        key = f'{dataset_version()}:{prefix}:{province_id}:{limit}'
+        return '"%s"' % hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def finalize(self, response, etag):
+        response['ETag'] = etag
+        patch_cache_control(response, public=True, max_age=GEO_CACHE_TTL)
+        return response
+
+    def get(self, request, *args, **kwargs):
+        # spellings that find the same cities share one etag
+        prefix = normalize_name(request.query_params.get('prefix', ''))
+        province_id = self.get_province_id(request.query_params.get('province', None))
+        limit = self.get_limit(request.query_params.get('limit', None))
+
+        etag = self.get_etag(prefix, province_id, limit)
+        if_none_match = request.headers.get('If-None-Match', '')
+        if etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*':
+            return self.finalize(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+
+        provinces = get_index().province_by_id
+        result = [
+            {
+                'id': city.id,
+                'name': city.name,
+                'province_id': city.province_id,
+                'province': provinces[city.province_id].name,
+            }
+            for city in search_cities(prefix, province_id, limit)
+        ]
+        return self.finalize(Response(result), etag)
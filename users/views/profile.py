@@ -1,25 +1,25 @@
-from django.conf import settings
+import tempfile
+
+from django.http import FileResponse, Http404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics
 from rest_framework import status
 from rest_framework.filters import SearchFilter
 from rest_framework.generics import UpdateAPIView, ListCreateAPIView
-from rest_framework.pagination import PageNumberPagination
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from main.melipayamak import Api
+from main.pagination import CountedPageNumberPagination, CursorPageNumberPagination
 from main.permissions import IsSuperUser, IsCurrentUser, IsCeoOrManager
 from users.exception import IncorrectPasswordError
-from users.models import Profile
+from users.export import enqueue_profile_export, profile_export_fields, profile_export_params, profile_export_rows
+from users.models import Profile, ExportJob
 from users.renderer import ExcelRenderer
-from users.serializers import ProfileSerializer, ConfirmProfileSerializer, ChangePasswordSerializer
-
-username = settings.SMS_USERNAME
-password = settings.SMS_PASSWORD
-from_ = settings.SMS_FROM
-api = Api(username, password)
-sms = api.sms()
+from users.serializers import ProfileSerializer, ConfirmProfileSerializer, ChangePasswordSerializer, \
+    ExportJobSerializer
+from users.sms import enqueue_sms
+from utils.utils import EXCEL_SPOOL_MAX_SIZE, write_excel
 
 
 class ProfileList(generics.ListAPIView):
@@ -28,17 +28,18 @@ class ProfileList(generics.ListAPIView):
     permission_classes = [IsAuthenticated & (IsCeoOrManager | IsSuperUser)]
     filter_backends = [SearchFilter]
     search_fields = ['first_name', 'last_name']
-    pagination_class = PageNumberPagination
+    pagination_class = CursorPageNumberPagination
 
     def get(self, request, *args, **kwargs):
         return self.list(request, *args, **kwargs)
 
     def get_queryset(self):
         user = self.request.user
+        queryset = ProfileSerializer.setup_eager_loading(super().get_queryset())
 
         if not user.is_superuser:
-            return super().get_queryset()
-        return super().get_queryset().filter(team_user_profile=user.profile_user.team_user_profile)
+            return queryset
+        return queryset.filter(team_user_profile=user.profile_user.team_user_profile)
 
 
 class ProfileListExcel(generics.ListAPIView):
@@ -46,35 +47,48 @@ class ProfileListExcel(generics.ListAPIView):
     serializer_class = ProfileSerializer
     permission_classes = [IsAuthenticated & IsSuperUser]
     renderer_classes = [ExcelRenderer]
-    pagination_class = PageNumberPagination
 
     def get(self, request, *args, **kwargs):
         return self.list(request, *args, **kwargs)
 
     def list(self, request, *args, **kwargs):
-        fields = [
-            'id', 'first_name', 'last_name', 'marital_status', 'gender', 'address', 'city', 'state',
-            'phone_verified', 'phone_number', 'child', 'date_of_birth', 'country', 'is_confirmed', 'image', 'role',
-            'iranian_profile', 'foreigner_profile', 'user', 'education_profile', 'experience_profile'
-        ]
-        queryparams = self.request.query_params
-        if queryparams:
-            team = queryparams.get('team', None)
-            education = queryparams.get('education', None)
-            experience = queryparams.get('experience', None)
-            query_dict = {"education_profile": education, "experience_profile": experience}
-
-            for key, value in query_dict.items():
-                if value != "True":
-                    fields.remove(key)
+        fields = profile_export_fields(profile_export_params(self.request.query_params))
         queryset = self.filter_queryset(self.get_queryset())
 
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True, fields=fields, ex=True)
-        return Response(serializer.data)
+        file = tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_MAX_SIZE)
+        write_excel(profile_export_rows(queryset, fields, self.get_serializer_context()), file)
+        file.seek(0)
+        return FileResponse(file, as_attachment=True, filename='profiles.xlsx',
+                            content_type=ExcelRenderer.media_type)
+
+
+class ProfileExportJobCreate(generics.CreateAPIView):
+    serializer_class = ExportJobSerializer
+    permission_classes = [IsAuthenticated & IsSuperUser]
+
+    def create(self, request, *args, **kwargs):
+        job = enqueue_profile_export(profile_export_params(request.query_params), request.user)
+        serializer = self.get_serializer(job)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+class ProfileExportJobRetrieve(generics.RetrieveAPIView):
+    queryset = ExportJob.objects.all()
+    serializer_class = ExportJobSerializer
+    permission_classes = [IsAuthenticated & IsSuperUser]
+
+
+class ExportJobDownload(APIView):
+    # the signed token in the url is the credential, so the link also works from a plain browser tab
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request, token, *args, **kwargs):
+        job = ExportJob.from_download_token(token)
+        if job is None or not job.file:
+            raise Http404
+        return FileResponse(job.file.open('rb'), as_attachment=True, filename='profiles.xlsx',
+                            content_type=ExcelRenderer.media_type)
 
 
 class ProfileRetrieveUpdate(generics.RetrieveUpdateAPIView):
@@ -98,7 +112,13 @@ class ConfirmProfileAPIView(ListCreateAPIView):
     filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_fields = ['gender', 'marital_status', 'is_confirmed']
     search_fields = ['first_name', 'last_name', 'phone_number']
-    pagination_class = PageNumberPagination
+    pagination_class = CountedPageNumberPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method == 'GET':
+            return ProfileSerializer.setup_eager_loading(queryset)
+        return queryset
 
     def get_serializer_class(self):
         if self.request.method == 'GET':
@@ -115,9 +135,7 @@ class ConfirmProfileAPIView(ListCreateAPIView):
             profiles = Profile.objects.filter(id__in=profile_ids)
             profiles.update(is_confirmed=condition)
             if reason:
-                phone_numbers = profiles.values_list('phone_number', flat=True)
-                for i in phone_numbers:
-                    sms.send(i, from_, reason)
+                enqueue_sms(profiles.values_list('phone_number', flat=True), reason)
             return Response(status=status.HTTP_200_OK)
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -139,7 +157,8 @@ class ChangePasswordView(UpdateAPIView):
             if not self.object.check_password(serializer.data.get("old_password")):
                 raise IncorrectPasswordError
             self.object.set_password(serializer.data.get("new_password"))
-            self.object.save()
+            # the user row was loaded with the request, saving it whole would write back a stale credit
+            self.object.save(update_fields=['password'])
             response = {
                 'status': 'success',
                 'code': status.HTTP_200_OK,
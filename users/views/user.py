@@ -1,19 +1,21 @@
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Q, Sum
+from django.db.models import Q
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.filters import SearchFilter
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from main.pagination import CursorPageNumberPagination
 from main.permissions import IsSuperUser
-from users.models import TransactionHistory
+from users.models import CreditSummary, TransactionHistory
 from users.serializers import CheckDestinationAccountSerializer, SendCreditSerializer, TransactionHistorySerializer
+from utils.utils import jalali_month
 
 User = get_user_model()
 
@@ -57,7 +59,8 @@ class IncreaseCreditCardNumberVS(viewsets.ModelViewSet):
     serializer_class = TransactionHistorySerializer
     filter_backends = [DjangoFilterBackend, SearchFilter]
     search_fields = ['user_receiver__username', 'description']
-    pagination_class = PageNumberPagination
+    pagination_class = CursorPageNumberPagination
+    cursor_ordering = ('-date', '-id')
 
     filterset_fields = {
         'date': ['lt', 'gt'],
@@ -98,19 +101,20 @@ class IncreaseCreditCardNumberVS(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def information(self, request, *args, **kwargs):
         user = self.request.user
-        queryset = self.get_queryset()
-        credit_in_the_month = queryset.filter(date__month__exact=1, status="AC").aggregate(Sum('price'))
-        credit_blocked = queryset.filter(status="RE").aggregate(Sum('price'))
-        count_all = queryset.aggregate(Sum('price'))
+        month = jalali_month(timezone.now().date())
+        # the summary rows of the user, or of every user for a superuser, for this month and for all time
+        summaries = {summary.month: summary for summary in CreditSummary.objects.filter(
+            user_id=None if user.is_superuser else user.pk, month__in=[month, ''])}
+        summary_month, summary_all = summaries.get(month, CreditSummary()), summaries.get('', CreditSummary())
         if user.is_superuser:
-            debt = User.objects.filter(credit__lte=0).aggregate(Sum('credit'))
+            debt = {'credit__sum': summary_all.debt}
         else:
             debt = abs(user.credit) if user.credit < 0 else 0
         return Response({
             'credit': user.credit,
             'debt': debt,
-            'credit_in_the_month': credit_in_the_month,
-            'credit_blocked': credit_blocked,
-            'count_all': count_all,
+            'credit_in_the_month': {'price__sum': summary_month.accepted},
+            'credit_blocked': {'price__sum': summary_all.rejected},
+            'count_all': {'price__sum': summary_all.total},
 
         })
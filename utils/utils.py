@@ -1,7 +1,10 @@
+import io
 import os
 from datetime import datetime
+from functools import lru_cache
 
 import openpyxl
+from openpyxl.utils import get_column_letter
 from django.utils.crypto import get_random_string
 from persiantools.jdatetime import JalaliDate
 
@@ -18,6 +21,12 @@ def convertor_hijri(year, mounth, day):
     return persian_string
 
 
+@lru_cache(maxsize=4096)
+def jalali_month(date):
+    # Solar Hijri month of a Gregorian date, '1402-07'
+    return JalaliDate(date).strftime('%Y-%m')
+
+
 def get_file_name(file_name):
     """
     _Get File Name_
@@ -115,122 +124,119 @@ def get_country_list():
         ('WF', 'Wallis & Futuna'), ('EH', 'Western Sahara'), ('YE', 'Yemen'), ('ZM', 'Zambia'), ('ZW', 'Zimbabwe'))
 
 
-def convert_to_excel(data):
-    # Create a new workbook
-    workbook = openpyxl.Workbook()
-
-    # Select the active sheet
-    sheet = workbook.active
-
-    # Define headers and subheaders
-    headers = [
-        ('اطلاعات شخصی ', ['نام', 'نام خانوادگی', 'تاریخ ولد', 'کد ملی',
-                           'ملیت', 'استان', 'شهر', 'آدرس', ',وضعیت تاهل', 'تعداد فرزندان']),
-        ('اطلاعات تحصیلی', ['رشته تحصیلی', 'مقطع تحصیلی', 'محل تحصیل']),
-        ('اطلاعات تیمی', ['نام تیم', 'بخش های فعالیت', 'مدیر تیم']),
-        ('تجربه کاری', ['عنوان', 'نام کمپانی', 'مدت زمان'])
-    ]
-
-    # Keep track of the current row and column
-    row = 1
-    col = 1
-
-    # Add headers and subheaders to the sheet
-    for header, subheaders in headers:
-        # Add the header to the sheet
-        sheet.cell(row=row, column=col, value=header)
-        sheet.cell(row=row, column=col, value=header)
-        sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col + len(subheaders) - 1)
-
-        # Add the subheaders to the sheet
-        for i, subheader in enumerate(subheaders):
-            sheet.cell(row=row + 1, column=col + i, value=subheader)
-            sheet.cell(row=row + 1, column=col + i, value=subheader)
-
-        # Update the current row and column
-        # row = 1
-        col += len(subheaders)
-
-    # Add data to the sheet
-    row += 2
-
-    for i, item in enumerate(data):
-        sheet.cell(row=i + row, column=1, value=item['first_name'])
-        sheet.cell(row=i + row, column=2, value=item['last_name'])
+EXCEL_HEADERS = [
+    ('اطلاعات شخصی ', ['نام', 'نام خانوادگی', 'تاریخ ولد', 'کد ملی',
+                       'ملیت', 'استان', 'شهر', 'آدرس', ',وضعیت تاهل', 'تعداد فرزندان']),
+    ('اطلاعات تحصیلی', ['رشته تحصیلی', 'مقطع تحصیلی', 'محل تحصیل']),
+    ('اطلاعات تیمی', ['نام تیم', 'بخش های فعالیت', 'مدیر تیم']),
+    ('تجربه کاری', ['عنوان', 'نام کمپانی', 'مدت زمان'])
+]
+
+EXCEL_GRADES = {
+    'CY': 'سیکل',
+    'DI': 'دیپلم',
+    'MA': 'کارشناسی',
+    'MP': 'کارشناسی ارشد',
+    'DA': 'دکتری',
+}
+
+# Workbooks smaller than this stay in memory, larger ones are spooled to a temp file.
+EXCEL_SPOOL_MAX_SIZE = 5 * 1024 * 1024
+
+
+def profile_excel_row(item):
+    """
+    _Profile Excel Row_
+    Args:
+        item (_dict_): Serialized profile (ProfileSerializer data)
+    Returns:
+        _list_: Cell values of one sheet row, in EXCEL_HEADERS column order
+    """
+
+    row = [None] * sum(len(subheaders) for header, subheaders in EXCEL_HEADERS)
+    row[0] = item['first_name']
+    row[1] = item['last_name']
+
+    if item.get('date_of_birth', None):
         date = item['date_of_birth'].split("-")
-        date_of_birth = convertor_hijri(date[0], date[1], date[2])
-
-        sheet.cell(row=i + row, column=3, value=date_of_birth)
-
-        if item.get('iranian_profile', False):
-            sheet.cell(row=i + row, column=4, value=item['iranian_profile']['national_code'])
-        else:
-            sheet.cell(row=i + row, column=4, value=item['foreigner_profile']['exclusive_code'])
-
-        sheet.cell(row=i + row, column=5, value=item['country'])
-        sheet.cell(row=i + row, column=6, value=item['state'])
-        sheet.cell(row=i + row, column=7, value=item['city'])
-        sheet.cell(row=i + row, column=8, value=item['address'])
-        if item['marital_status'] == 'married':
-            item['marital_status'] = 'متاهل'
-        else:
-            item['marital_status'] = 'مجرد'
-        sheet.cell(row=i + row, column=9, value=item['marital_status'])
-        if item.get("child"):
-            sheet.cell(row=i + row, column=10, value=len(item['child']))
-        else:
-            sheet.cell(row=i + row, column=10, value=0)
-        # set last education
-        if item.get("education_profile", None):
-            item['education_profile'] = item['education_profile'][-1]
-
-            # create match and case for education
-            if item['education_profile']['grade'] == 'CY':
-                item['education_profile']['grade'] = 'سیکل'
-            elif item['education_profile']['grade'] == 'DI':
-                item['education_profile']['grade'] = 'دیپلم'
-            elif item['education_profile']['grade'] == 'MA':
-                item['education_profile']['grade'] = 'کارشناسی'
-            elif item['education_profile']['grade'] == 'MP':
-                item['education_profile']['grade'] = 'کارشناسی ارشد'
-            elif item['education_profile']['grade'] == 'DA':
-                item['education_profile']['grade'] = 'دکتری'
-
-            sheet.cell(row=i + row, column=11, value=item['education_profile']['major'])
-            sheet.cell(row=i + row, column=12, value=item['education_profile']['grade'])
-            sheet.cell(row=i + row, column=13, value=item['education_profile']['name'])
-
-        # sheet.cell(row=i + row, column=14, value=item['team_name'])
-        # sheet.cell(row=i + row, column=15, value=item['activity_sections'])
-        # sheet.cell(row=i + row, column=6, value=item['team_manager'])
-        #
-
-        if item.get("experience_profile",None):
-            name = [i['name'] for i in item['experience_profile']]
-            company = [i['company'] for i in item['experience_profile']]
-
-            time = [str((datetime.strptime(i['stop'], '%Y-%m-%d') - datetime.strptime(i['start'], '%Y-%m-%d')).days) for i
-                    in
-                    item['experience_profile']]
-            time = []
-
-            for work in item['experience_profile']:
-                time_work = (datetime.strptime(work['stop'], '%Y-%m-%d') - datetime.strptime(work['start'], '%Y-%m-%d'))
-                days = time_work.days
-                years, days = divmod(days, 365)
-                months, days = divmod(days, 30)
-                time.append(f"{years} سال و {months} ماه و {days} روز")
-
-            sheet.cell(row=i + row, column=17, value="\n".join(name))
-            sheet.cell(row=i + row, column=18, value="\n".join(company))
-            sheet.cell(row=i + row, column=19, value="\n".join(time))
-
-    # Save the workbook
-    path = os.path.dirname(os.path.abspath(__file__))
-    path_file = f'{path}/data.xlsx'
+        row[2] = convertor_hijri(date[0], date[1], date[2])
+
+    if item.get('iranian_profile', None):
+        row[3] = item['iranian_profile']['national_code']
+    elif item.get('foreigner_profile', None):
+        row[3] = item['foreigner_profile']['exclusive_code']
+
+    row[4] = item['country']
+    row[5] = item['state']
+    row[6] = item['city']
+    row[7] = item['address']
+    row[8] = 'متاهل' if item['marital_status'] == 'M' else 'مجرد'
+    row[9] = len(item['child']) if item.get("child") else 0
+
+    # set last education
+    if item.get("education_profile", None):
+        education = item['education_profile'][-1]
+        row[10] = education['major']
+        row[11] = EXCEL_GRADES.get(education['grade'], education['grade'])
+        row[12] = education['name']
+
+    if item.get("experience_profile", None):
+        time = []
+        for work in item['experience_profile']:
+            time_work = (datetime.strptime(work['stop'], '%Y-%m-%d') - datetime.strptime(work['start'], '%Y-%m-%d'))
+            days = time_work.days
+            years, days = divmod(days, 365)
+            months, days = divmod(days, 30)
+            time.append(f"{years} سال و {months} ماه و {days} روز")
+
+        row[16] = "\n".join(work['name'] for work in item['experience_profile'])
+        row[17] = "\n".join(work['company'] for work in item['experience_profile'])
+        row[18] = "\n".join(time)
+    return row
+
+
+def write_excel(rows, file):
+    """
+    _Write Excel_
+    Streams rows into a write-only workbook, so memory does not grow with the
+    number of rows.
+    Args:
+        rows (_iterable_): Rows built by profile_excel_row
+        file (_str_ or file object): Destination of the workbook
+    Returns:
+        The given file
+    """
 
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
     sheet.sheet_view.rightToLeft = True
-    if os.path.exists(path_file):
-        os.remove(path_file)
-    workbook.save(path_file)
-    return path_file
+
+    header_row = []
+    subheader_row = []
+    for header, subheaders in EXCEL_HEADERS:
+        col = len(header_row) + 1
+        sheet.merged_cells.add(f'{get_column_letter(col)}1:{get_column_letter(col + len(subheaders) - 1)}1')
+        header_row += [header] + [None] * (len(subheaders) - 1)
+        subheader_row += subheaders
+
+    sheet.append(header_row)
+    sheet.append(subheader_row)
+    for row in rows:
+        sheet.append(row)
+
+    workbook.save(file)
+    return file
+
+
+def convert_to_excel(data):
+    """
+    _Convert To Excel_
+    Args:
+        data (_list_): Serialized profiles
+    Returns:
+        _bytes_: The workbook, built in memory for this call only
+    """
+
+    file = io.BytesIO()
+    write_excel((profile_excel_row(item) for item in data), file)
+    return file.getvalue()